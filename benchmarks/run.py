@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""Run the hot-path benchmarks (same as ``yodel bench``).
+
+    python benchmarks/run.py --sizes 1000,100000,1000000 --json bench.json
+    python benchmarks/run.py --save-baseline     # record benchmarks/baseline.json
+    python benchmarks/run.py --threshold 0.2     # exit 1 on >20 % regressions
+
+See yodel.bench for what is measured. Baselines are machine specific: record
+one on the target board (or CI runner) before comparing against it.
+"""
+from __future__ import annotations
+
+import sys
+
+from yodel.cli import main
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main(["bench", *sys.argv[1:]]))
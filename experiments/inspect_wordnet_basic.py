@@ -18,63 +18,33 @@ import argparse
 import sys
 from io import StringIO
 
-RAW_ROOT = Path("data/raw")
-PREFIX = "english-wordnet-2024_"
+from yodel import wordnet
+
 INNER = "oewn2024"
 
 
 def latest_wordnet_dir() -> Path:
-    if not RAW_ROOT.exists():
-        raise SystemExit("data/raw does not exist. Run scripts/fetch_en_word.py first.")
-    candidates = []
-    for p in RAW_ROOT.iterdir():
-        if p.is_dir() and p.name.startswith(PREFIX):
-            parts = p.name.rsplit("_", 1)
-            if len(parts) == 2 and parts[1].isdigit():
-                candidates.append((parts[1], p))
-    if not candidates:
-        raise SystemExit("No english-wordnet-2024_* directories found.")
-    return max(candidates, key=lambda t: t[0])[1] / INNER
+    root = wordnet.latest_wordnet_dir()
+    if root is None:
+        raise SystemExit("No english-wordnet-2024_* directories found under data/raw. Run scripts/fetch_en_word.py first.")
+    return root / INNER
 
 
-def parse_data_file(path: Path):
+def summarise(synsets):
     synset_count = 0
     lemma_tokens = 0
     pointer_counter = Counter()
-    with path.open(encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            if not line or not line[0].isdigit():
-                continue
-            # split before gloss
-            pre, *_ = line.split("|", 1)
-            parts = pre.split()
-            if len(parts) < 4:
-                continue
-            synset_count += 1
-            w_cnt_hex = parts[3]
-            try:
-                w_cnt = int(w_cnt_hex, 16)
-            except ValueError:
-                continue
-            # lemmas start at index 4, alternating lemma lex_id
-            lemma_tokens += w_cnt
-            after_lemmas = 4 + 2 * w_cnt
-            if after_lemmas >= len(parts):
-                continue
-            try:
-                p_cnt = int(parts[after_lemmas])
-            except ValueError:
-                p_cnt = 0
-            i = after_lemmas + 1
-            for _ in range(p_cnt):
-                if i + 3 >= len(parts):
-                    break
-                symbol = parts[i]
-                pointer_counter[symbol] += 1
-                i += 4  # symbol target_offset target_pos source/target
+    for syn in synsets:
+        synset_count += 1
+        lemma_tokens += len(syn.lemmas)
+        pointer_counter.update(ptr.symbol for ptr in syn.pointers)
     return synset_count, lemma_tokens, pointer_counter
 
 
+def parse_data_file(path: Path):
+    return summarise(wordnet.iter_data(path))
+
+
 def main(argv=None):
     parser = argparse.ArgumentParser(description="Inspect basic WordNet data file structure.")
     parser.add_argument("--top", type=int, default=10, help="Show top N pointer symbols (default 10)")
@@ -87,16 +57,14 @@ def main(argv=None):
         print(line)
 
     base = latest_wordnet_dir()
-    pos_files = {pos: base / f"data.{pos}" for pos in ("noun", "verb", "adj", "adv")}
+    for pos in wordnet.POS_NAMES:
+        if not (base / f"data.{pos}").exists():
+            w(f"[warn] missing {base / f'data.{pos}'}")
 
+    # one pass per file, the four POS files summarised concurrently
+    results = wordnet.map_files(base, "data", summarise)
     all_pointer_counts = Counter()
-    results = {}
-    for pos, path in pos_files.items():
-        if not path.exists():
-            w(f"[warn] missing {path}")
-            continue
-        syn_ct, lem_ct, ptrs = parse_data_file(path)
-        results[pos] = (syn_ct, lem_ct, ptrs)
+    for _syn_ct, _lem_ct, ptrs in results.values():
         all_pointer_counts.update(ptrs)
 
     w("=== WordNet Basic Structure Summary ===")
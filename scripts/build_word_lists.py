@@ -1,26 +1,22 @@
 #!/usr/bin/env python3
-"""Build curated game word lists from raw en-word data (stub).
+"""Build curated game word lists from raw en-word data.
 
-Future steps:
-- Load latest raw file(s)
-- Apply filters (length, frequency, profanity blacklist, ASCII only)
-- Output data/processed/game_words.txt and optional metadata parquet/JSON
-- Produce SHA256 checksums
+Thin wrapper around yodel.pipeline (also run in-process by
+``yodel update-words``): extract -> tokenize -> filter (length, ASCII,
+blocklist) -> dedupe -> emit data/processed/game_words.txt, the compiled
+lexicon (game_words.lex), its prefix/pattern/anagram index (game_words.idx),
+the wordle feedback table (with numpy), the synset graph store (when raw
+WordNet data exists) and manifest.json with SHA256 checksums. Each stage is
+cached by content hash, so re-runs only redo what changed.
 """
 from __future__ import annotations
 
-from pathlib import Path
-
-RAW_DIR = Path("data/raw")
-PROC_DIR = Path("data/processed")
+from yodel.pipeline import run_pipeline
 
 
 def main() -> None:
-    PROC_DIR.mkdir(parents=True, exist_ok=True)
-    out_words = PROC_DIR / "game_words.txt"
-    # Placeholder content until filters implemented
-    out_words.write_text("YODEL\nHELLO\nWORLD\n", encoding="utf-8")
-    print(f"Wrote placeholder word list: {out_words}")
+    run_pipeline()
+
 
 if __name__ == "__main__":  # pragma: no cover
     main()
@@ -1,37 +1,110 @@
 #!/usr/bin/env python3
-"""Fetch English WordNet dataset archive only (no processing yet).
+"""Fetch the English WordNet archive and extract what the build needs.
 
 Usage:
     python scripts/fetch_en_word.py               # download dated copy if missing
     python scripts/fetch_en_word.py --force       # re-download even if exists
     python scripts/fetch_en_word.py --url <zip>   # custom URL
+    python scripts/fetch_en_word.py --sha256 <hex>  # pin the expected checksum
 
 Output:
-    data/raw/english-wordnet-2024_<DATE>.zip
-
-All further parsing / extraction will be handled by a separate script later.
+    data/raw/english-wordnet-2024_<DATE>.zip          archive
+    data/raw/english-wordnet-2024_<DATE>.zip.sha256   stored checksum (sha256sum format)
+    data/raw/english-wordnet-2024_<DATE>/             only the data.* / index.* members
+
+The download streams to ``<archive>.part`` in chunks while hashing, and an
+interrupted download resumes with an HTTP Range request. An existing archive
+is verified against its stored checksum before extraction. Afterwards the
+word-list pipeline (yodel.pipeline) runs unless ``--no-build`` is given.
 """
 from __future__ import annotations
 
 import argparse
 import hashlib
+import re
+import shutil
 import zipfile
 from datetime import datetime, UTC
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 import sys
 import urllib.request
 
 RAW_DIR = Path("data/raw")
 DEFAULT_URL = "https://en-word.net/static/english-wordnet-2024.zip"
-
-
-def sha256_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
-
-
-def download(url: str) -> bytes:
-    with urllib.request.urlopen(url) as resp:  # nosec: trusted source specified by user
-        return resp.read()
+CHUNK = 1 << 16
+MEMBER_RE = re.compile(r"^(data|index)\.(noun|verb|adj|adv)$")  # WordNet files the build reads
+
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        while block := fh.read(CHUNK):
+            h.update(block)
+    return h.hexdigest()
+
+
+def checksum_path(archive: Path) -> Path:
+    return archive.with_name(archive.name + ".sha256")
+
+
+def read_checksum(archive: Path) -> str | None:
+    try:
+        return checksum_path(archive).read_text(encoding="ascii").split()[0].lower()
+    except (OSError, IndexError):
+        return None
+
+
+def download(url: str, dest: Path, expected_sha256: str | None = None) -> str:
+    """Stream ``url`` to ``dest`` and return its sha256.
+
+    Bytes go to ``dest.part`` in ``CHUNK``-sized pieces and are hashed as they
+    arrive. If a ``.part`` file is left from an interrupted run, its bytes are
+    hashed and the rest is requested with ``Range``; a server that ignores the
+    range (200 instead of 206) restarts the download from scratch.
+    """
+    part = dest.with_name(dest.name + ".part")
+    h = hashlib.sha256()
+    have = 0
+    if part.exists():
+        with part.open("rb") as fh:
+            while block := fh.read(CHUNK):
+                h.update(block)
+                have += len(block)
+    req = urllib.request.Request(url)
+    if have:
+        req.add_header("Range", f"bytes={have}-")
+    with urllib.request.urlopen(req) as resp:  # nosec: trusted source specified by user
+        if have and resp.status != 206:
+            h, have = hashlib.sha256(), 0
+        if have:
+            print(f"Resuming at byte {have}", file=sys.stderr)
+        with part.open("ab" if have else "wb") as out:
+            while block := resp.read(CHUNK):
+                out.write(block)
+                h.update(block)
+    digest = h.hexdigest()
+    if expected_sha256 and digest != expected_sha256.lower():
+        part.unlink(missing_ok=True)
+        raise ValueError(f"checksum mismatch for {url}: got {digest}, expected {expected_sha256}")
+    part.replace(dest)
+    checksum_path(dest).write_text(f"{digest}  {dest.name}\n", encoding="ascii")
+    return digest
+
+
+def extract_members(archive: Path, dest: Path) -> list[Path]:
+    """Stream only the ``data.*`` / ``index.*`` members of ``archive`` into ``dest``."""
+    written = []
+    with zipfile.ZipFile(archive) as zf:
+        for info in zf.infolist():
+            member = PurePosixPath(info.filename)
+            if info.is_dir() or not MEMBER_RE.match(member.name) or ".." in member.parts or member.is_absolute():
+                continue
+            target = dest.joinpath(*member.parts)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info) as src, target.open("wb") as out:
+                shutil.copyfileobj(src, out, CHUNK)
+            written.append(target)
+    return written
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -39,6 +112,8 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--url", default=DEFAULT_URL, help="Archive URL (zip)")
     p.add_argument("--out-dir", default=str(RAW_DIR), help="Raw output directory")
     p.add_argument("--force", action="store_true", help="Re-download even if existing")
+    p.add_argument("--sha256", help="Expected archive sha256 (default: the stored .sha256 file, if any)")
+    p.add_argument("--no-build", action="store_true", help="Skip the word-list build after extraction")
     return p
 
 
@@ -54,22 +129,36 @@ def main(argv: list[str] | None = None) -> int:
 
     if archive_path.exists() and not args.force:
         print(f"Archive exists: {archive_path} (use --force to re-download)", file=sys.stderr)
+        expected = args.sha256 or read_checksum(archive_path)
+        if expected:
+            digest = sha256_file(archive_path)
+            if digest != expected.lower():
+                print(f"Checksum mismatch for {archive_path}: {digest} != {expected}", file=sys.stderr)
+                return 1
+            checksum_path(archive_path).write_text(f"{digest}  {archive_path.name}\n", encoding="ascii")
     else:
+        if args.force:
+            archive_path.with_name(archive_path.name + ".part").unlink(missing_ok=True)
         print(f"Downloading {args.url} ...", file=sys.stderr)
-        data = download(args.url)
-        digest = sha256_bytes(data)[:16]
-        archive_path.write_bytes(data)
-        print(f"Saved {archive_path} (sha256 {digest}...)")
-
-    # Extract (always) into sibling directory without .zip suffix
+        try:
+            digest = download(args.url, archive_path, args.sha256)
+        except ValueError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        print(f"Saved {archive_path} (sha256 {digest[:16]}...)")
+
+    # Extract into sibling directory without .zip suffix (only what the build reads)
     extract_dir = archive_path.with_suffix("")
-    if not extract_dir.exists():
-        with zipfile.ZipFile(archive_path, 'r') as zf:
-            zf.extractall(extract_dir)
-        print(f"Extracted to {extract_dir}")
+    if not extract_dir.exists() or args.force:
+        files = extract_members(archive_path, extract_dir)
+        print(f"Extracted {len(files)} WordNet files to {extract_dir}")
     else:
         print(f"Extraction directory exists: {extract_dir}")
 
+    if not args.no_build:
+        from yodel.pipeline import BuildConfig, run_pipeline
+
+        run_pipeline(BuildConfig(raw_dir=raw_dir))
     return 0
 
 
@@ -0,0 +1,356 @@
+"""Hot-path benchmarks (``yodel bench``, ``benchmarks/run.py``).
+
+Every benchmark runs against synthetic data generated into a temporary
+directory, so results do not depend on whether WordNet has been fetched:
+
+    load_words.text      cold load of a plain-text list (ms)
+    load_words.wordnet   cold derive from WordNet index files, empty disk cache (ms)
+    load_words.cached    load from the on-disk lexicon cache, new-process equivalent (ms)
+    load_words.warm      calls/sec once loaded (in-process cache hit)
+    is_valid.lexicon     lookups/sec against the mmap'd compiled lexicon
+    is_valid.bloom       the same with the Bloom pre-filter next to the lexicon
+    is_valid.set         lookups/sec against the in-memory word set
+    score_guess          calls/sec (count mode)
+    feedback             calls/sec (wordle mode)
+    scroll_once          frames/sec, headless software canvas, unpaced
+    mock_board           clear+draw+show cycles/sec on a 64x32 MockBoard
+    cli_start            fresh interpreter + ``import yodel.cli`` (ms)
+
+Word-list benchmarks run once per lexicon size (``--sizes``). Results are
+JSON; ``compare`` flags any metric worse than a stored baseline by more than
+``threshold`` (a fraction, 0.25 = 25 %).
+"""
+from __future__ import annotations
+
+from contextlib import chdir, contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+import json
+import os
+import platform
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = (1_000, 100_000)
+MAX_SIZE = 1_000_000
+DEFAULT_THRESHOLD = 0.25
+BASELINE_PATH = Path("benchmarks/baseline.json")
+_WN_DIR = "english-wordnet-2024_20240101"
+
+
+@dataclass
+class BenchResult:
+    name: str
+    size: int | None  # lexicon size, None when the benchmark does not depend on it
+    value: float
+    unit: str
+    higher_is_better: bool
+
+    @property
+    def key(self) -> str:
+        return self.name if self.size is None else f"{self.name}[{self.size}]"
+
+
+@dataclass
+class Regression:
+    key: str
+    baseline: float
+    value: float
+    change: float  # signed fraction, positive = worse
+
+
+def synthetic_words(n: int, seed: int = 0, min_length: int = 3, max_length: int = 9) -> list[str]:
+    """``n`` distinct pseudo-random upper-case words, deterministic for a seed."""
+    rng = random.Random(seed)
+    letters = string.ascii_uppercase
+    words: set[str] = set()
+    while len(words) < n:
+        words.add("".join(rng.choices(letters, k=rng.randint(min_length, max_length))))
+    return sorted(words)
+
+
+def write_wordnet(words: Sequence[str], root: Path) -> Path:
+    """Minimal WordNet ``index.*`` files under ``root/data/raw`` (one synset per lemma)."""
+    d = root / "data" / "raw" / _WN_DIR
+    d.mkdir(parents=True, exist_ok=True)
+    shards = {pos: [] for pos in ("noun", "verb", "adj", "adv")}
+    names = list(shards)
+    for i, w in enumerate(words):
+        shards[names[i % 4]].append(f"{w.lower()} {names[i % 4][0]} 1 0 1 0 {i:08d}\n")
+    for pos, lines in shards.items():
+        (d / f"index.{pos}").write_text("".join(lines), encoding="utf-8")
+    return d
+
+
+def write_font(path: Path, width: int = 8, height: int = 16) -> Path:
+    """A BDF font with blocky pseudo-random glyphs for space and A-Z."""
+    rng = random.Random(1)
+    out = [
+        "STARTFONT 2.1",
+        f"FONTBOUNDINGBOX {width} {height} 0 -4",
+        f"FONT_ASCENT {height - 4}",
+        "FONT_DESCENT 4",
+        "CHARS 27",
+    ]
+    for code in [32, *range(65, 91)]:
+        rows = ["00"] * height if code == 32 else [f"{rng.getrandbits(width) & 0xFE:02X}" for _ in range(height)]
+        out += [f"STARTCHAR {chr(code)}", f"ENCODING {code}", f"DWIDTH {width} 0",
+                f"BBX {width} {height} 0 -4", "BITMAP", *rows, "ENDCHAR"]
+    out.append("ENDFONT")
+    path.write_text("\n".join(out) + "\n", encoding="ascii")
+    return path
+
+
+@contextmanager
+def _env(**values: str | None) -> Iterator[None]:
+    saved = {k: os.environ.get(k) for k in values}
+    try:
+        for k, v in values.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def _per_call(fn: Callable[[], object], repeat: int) -> float:
+    """Best seconds per call over ``repeat`` timeit runs (each sized to ~0.2 s)."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def _once(fn: Callable[[], object], repeat: int, setup: Callable[[], object] | None = None) -> float:
+    """Best wall time (seconds) of one call, ``setup()`` untimed before each."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _probe_words(words: Sequence[str], n: int = 1000, seed: int = 2) -> list[str]:
+    """Half real words, half misses (same lengths, scrambled)."""
+    rng = random.Random(seed)
+    hits = rng.sample(list(words), min(n // 2, len(words)))
+    misses = ["".join(rng.sample(w, len(w))) + "Q" for w in hits]
+    return hits + misses
+
+
+def bench_words(size: int, root: Path, repeat: int) -> list[BenchResult]:
+    from . import dictionary
+    from .bloom import write_bloom
+    from .lexicon import Lexicon, compile_lexicon
+
+    words = synthetic_words(size)
+    text = root / "words.txt"
+    text.write_text("\n".join(words) + "\n", encoding="utf-8")
+    lex_path = compile_lexicon(words, root / "words.lex")
+    write_wordnet(words, root)
+    cache = root / "cache"
+    results: list[BenchResult] = []
+
+    def clear() -> None:
+        dictionary._load_words.cache_clear()
+        dictionary._load_lexicon.cache_clear()
+        dictionary.load_bloom.cache_clear()
+
+    def clear_disk() -> None:
+        clear()
+        for f in cache.glob("*"):
+            f.unlink()
+
+    with chdir(root), _env(YODEL_CACHE_DIR=str(cache), YODEL_LEXICON_PATH=None, YODEL_WORDS_PATH=None):
+        with _env(YODEL_WORDS_PATH=str(text)):
+            t = _once(dictionary.load_words, repeat, clear)
+            results.append(BenchResult("load_words.text", size, t * 1000, "ms", False))
+        t = _once(dictionary.load_words, repeat, clear_disk)
+        results.append(BenchResult("load_words.wordnet", size, t * 1000, "ms", False))
+        t = _once(dictionary.load_words, repeat, clear)
+        results.append(BenchResult("load_words.cached", size, t * 1000, "ms", False))
+        t = _per_call(dictionary.load_words, repeat)
+        results.append(BenchResult("load_words.warm", size, 1 / t, "ops/s", True))
+
+        probe = _probe_words(words)
+        with _env(YODEL_LEXICON_PATH=str(lex_path)):
+            clear()
+            dictionary.load_lexicon()
+            t = _per_call(lambda: [dictionary.is_valid(w) for w in probe], repeat)
+            results.append(BenchResult("is_valid.lexicon", size, len(probe) / t, "ops/s", True))
+            write_bloom(Lexicon(lex_path), lex_path.with_suffix(".blm"))
+            clear()
+            dictionary.load_bloom()
+            t = _per_call(lambda: [dictionary.is_valid(w) for w in probe], repeat)
+            results.append(BenchResult("is_valid.bloom", size, len(probe) / t, "ops/s", True))
+        with _env(YODEL_WORDS_PATH=str(text)):
+            clear()
+            dictionary.load_words()
+            t = _per_call(lambda: [dictionary.is_valid(w) for w in probe], repeat)
+            results.append(BenchResult("is_valid.set", size, len(probe) / t, "ops/s", True))
+        clear()
+    return results
+
+
+def bench_scoring(repeat: int) -> list[BenchResult]:
+    from .scoring import feedback, score_guess
+
+    pairs = list(zip(synthetic_words(500, seed=3, min_length=5, max_length=5),
+                     synthetic_words(500, seed=4, min_length=5, max_length=5)))
+    results = []
+    for name, fn in (("score_guess", score_guess), ("feedback", feedback)):
+        t = _per_call(lambda: [fn(g, t) for g, t in pairs], repeat)
+        results.append(BenchResult(name, None, len(pairs) / t, "ops/s", True))
+    return results
+
+
+def bench_render(root: Path, repeat: int) -> list[BenchResult]:
+    from .display.headless import SoftMatrix
+    from .display.matrix import MatrixDisplay, ScrollConfig
+    from .hardware.mock_board import MockBoard
+
+    font = write_font(root / "bench.bdf")
+    disp = MatrixDisplay(config=ScrollConfig(font_path=str(font)), max_speed=True, backend=SoftMatrix(64, 32))
+    best = 0.0
+    for _ in range(repeat):
+        disp.scroll_once("HELLO WORLD")
+        best = max(best, disp.last_stats.fps if disp.last_stats else 0.0)
+    results = [BenchResult("scroll_once", None, best, "fps", True)]
+
+    board = MockBoard(64, 32, echo=False)
+    colors = [(255, 0, 0), (0, 255, 0)]
+    n = 0
+
+    def cycle() -> None:
+        nonlocal n
+        n += 1
+        board.clear()
+        board.fill_rect(n % 48, 4, 16, 8, colors[n & 1])
+        board.show()
+
+    t = _per_call(cycle, repeat)
+    results.append(BenchResult("mock_board", None, 1 / t, "ops/s", True))
+    return results
+
+
+def metrics_workload(guesses: int = 200, scrolls: int = 3) -> None:
+    """Synthetic instrumented run for ``yodel diag --metrics``: word load, guesses, headless scrolling.
+
+    Call after ``metrics.enable()``; the numbers describe this run only.
+    """
+    from .dictionary import load_words
+    from .display.headless import SoftMatrix
+    from .display.matrix import MatrixDisplay, ScrollConfig
+    from .game import Game
+
+    words = sorted(load_words())
+    rng = random.Random(0)
+    for mode in ("count", "wordle"):
+        game = Game(mode=mode)
+        pool = [w for w in words if len(w) == len(game.target)] or [game.target]
+        for _ in range(guesses // 2):
+            game.apply_guess(rng.choice(pool) if rng.random() < 0.8 else "Q" * len(game.target))
+    with tempfile.TemporaryDirectory(prefix="yodel-metrics-") as tmp:
+        font = ScrollConfig.font_path
+        if not Path(font).is_file():
+            font = str(write_font(Path(tmp) / "probe.bdf"))
+        disp = MatrixDisplay(config=ScrollConfig(font_path=font), max_speed=True)
+        if not disp.available():
+            disp = MatrixDisplay(config=disp.config, max_speed=True, backend=SoftMatrix(disp.cols, disp.rows))
+        for _ in range(scrolls):
+            disp.scroll_once("HELLO WORLD")
+
+
+def bench_cli_start(repeat: int) -> list[BenchResult]:
+    cmd = [sys.executable, "-c", "import yodel.cli"]
+    t = _once(lambda: subprocess.run(cmd, check=True), max(repeat, 3))
+    return [BenchResult("cli_start", None, t * 1000, "ms", False)]
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    only: str | None = None,
+    repeat: int = 3,
+    log: Callable[[str], None] = print,
+) -> dict:
+    """Run every benchmark (or those whose name contains ``only``); returns the JSON-ready report."""
+    for size in sizes:
+        if not 1 <= size <= MAX_SIZE:
+            raise ValueError(f"lexicon size must be 1..{MAX_SIZE}, got {size}")
+    results: list[BenchResult] = []
+
+    def wanted(*names: str) -> bool:
+        return only is None or any(only in n or n in only for n in names)
+
+    def add(batch: list[BenchResult]) -> None:
+        for r in batch:
+            if wanted(r.name):
+                results.append(r)
+                log(f"{r.key:<28} {r.value:>14,.2f} {r.unit}")
+
+    with tempfile.TemporaryDirectory(prefix="yodel-bench-") as tmp:
+        root = Path(tmp)
+        if wanted("load_words", "is_valid"):
+            for size in sizes:
+                d = root / f"words-{size}"
+                d.mkdir()
+                add(bench_words(size, d, repeat))
+        if wanted("score_guess", "feedback"):
+            add(bench_scoring(repeat))
+        if wanted("scroll_once", "mock_board"):
+            add(bench_render(root, repeat))
+        if wanted("cli_start"):
+            add(bench_cli_start(repeat))
+
+    from .scoring import numpy_module
+
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "numpy": numpy_module() is not None,
+        "sizes": list(sizes),
+        "results": [asdict(r) | {"key": r.key} for r in results],
+    }
+
+
+def load_report(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def save_report(report: dict, path: str | Path) -> Path:
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return out
+
+
+def compare(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[Regression]:
+    """Metrics present in both reports that got worse than ``baseline`` by more than ``threshold``."""
+    base = {r["key"]: r for r in baseline.get("results", [])}
+    out = []
+    for r in report["results"]:
+        b = base.get(r["key"])
+        if b is None or not b["value"]:
+            continue
+        change = (r["value"] - b["value"]) / b["value"]
+        if r["higher_is_better"]:
+            change = -change
+        if change > threshold:
+            out.append(Regression(r["key"], b["value"], r["value"], change))
+    return out
@@ -0,0 +1,149 @@
+"""Bloom filter over the compiled lexicon: a compact first stage for ``is_valid``.
+
+Most rejected guesses are not words at all. A miss in the filter is a
+definite "not a word", answered from a few hundred KB of bits without
+touching the lexicon; only probable hits go on to the exact binary search
+over the memory-mapped ``.lex`` (so on a small board only the filter and the
+touched lexicon pages are resident).
+
+File layout (``game_words.blm`` next to the lexicon, little endian):
+
+    header  56 bytes  magic b"YBLM", version u16, hash count k u16,
+                      word count u32, bit count m u32, target false-positive
+                      rate f64, lexicon checksum (32 bytes; a stale filter is
+                      ignored)
+    bits    ceil(m / 8) bytes
+
+Bit positions use double hashing over one 64-bit BLAKE2b digest of the
+upper-case ASCII word: ``(h1 + i * h2) mod m`` for ``i < k``.
+"""
+from __future__ import annotations
+
+from hashlib import blake2b
+from pathlib import Path
+import math
+import mmap
+import random
+import string
+import struct
+import time
+
+from .lexicon import Lexicon
+
+MAGIC = b"YBLM"
+VERSION = 1
+DEFAULT_FP_RATE = 0.01
+_HEADER = struct.Struct("<4sHHIId32s")
+
+
+def _hashes(key: bytes) -> tuple[int, int]:
+    h = int.from_bytes(blake2b(key, digest_size=8).digest(), "little")
+    return h & 0xFFFFFFFF, (h >> 32) | 1
+
+
+def sizing(n: int, fp_rate: float) -> tuple[int, int]:
+    """(bits m, hashes k) for ``n`` words at false-positive rate ``fp_rate``."""
+    if not 0 < fp_rate < 1:
+        raise ValueError("fp_rate must be between 0 and 1")
+    m = max(64, math.ceil(-max(n, 1) * math.log(fp_rate) / (math.log(2) ** 2)))
+    k = max(1, round(m / max(n, 1) * math.log(2)))
+    return m, k
+
+
+def build_bloom(lexicon: Lexicon, fp_rate: float = DEFAULT_FP_RATE) -> bytes:
+    n = len(lexicon)
+    m, k = sizing(n, fp_rate)
+    bits = bytearray((m + 7) // 8)
+    for word in lexicon.words():
+        h1, h2 = _hashes(word.encode("ascii"))
+        for i in range(k):
+            pos = (h1 + i * h2) % m
+            bits[pos >> 3] |= 1 << (pos & 7)
+    return _HEADER.pack(MAGIC, VERSION, k, n, m, fp_rate, lexicon.checksum) + bytes(bits)
+
+
+def write_bloom(lexicon: Lexicon, path: str | Path, fp_rate: float = DEFAULT_FP_RATE) -> Path:
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_bytes(build_bloom(lexicon, fp_rate))
+    tmp.replace(out)
+    return out
+
+
+class BloomFilter:
+    """Membership filter: ``word in f`` is False for every non-member, True for members and ~fp_rate of the rest."""
+
+    def __init__(self, data: bytes | mmap.mmap, lexicon: Lexicon | None = None) -> None:
+        magic, version, k, n, m, fp_rate, checksum = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a v1 bloom filter")
+        if len(data) != _HEADER.size + (m + 7) // 8:
+            raise ValueError("bloom filter size does not match header")
+        if lexicon is not None and checksum != lexicon.checksum:
+            raise ValueError("bloom filter does not match lexicon")
+        self.k, self.count, self.m, self.fp_rate = k, n, m, fp_rate
+        self._data = data
+        self._bits = memoryview(data)[_HEADER.size:]
+
+    @classmethod
+    def open(cls, path: str | Path, lexicon: Lexicon | None = None) -> "BloomFilter":
+        with Path(path).open("rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm, lexicon)
+
+    @classmethod
+    def build(cls, lexicon: Lexicon, fp_rate: float = DEFAULT_FP_RATE) -> "BloomFilter":
+        return cls(build_bloom(lexicon, fp_rate), lexicon)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+    def expected_fp_rate(self) -> float:
+        """Theoretical false-positive rate for the stored count, bits and hashes."""
+        return (1 - math.exp(-self.k * self.count / self.m)) ** self.k
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word.isascii():
+            return False
+        h1, h2 = _hashes(word.upper().encode("ascii"))
+        m, bits = self.m, self._bits
+        for i in range(self.k):
+            pos = (h1 + i * h2) % m
+            if not bits[pos >> 3] >> (pos & 7) & 1:
+                return False
+        return True
+
+
+def _non_words(lexicon: Lexicon, n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    out: list[str] = []
+    while len(out) < n:
+        w = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(4, 8)))
+        if w not in lexicon:
+            out.append(w)
+    return out
+
+
+def measure(bloom: BloomFilter, lexicon: Lexicon, samples: int = 20_000) -> dict[str, float]:
+    """Observed false-positive rate and lookups/sec for random non-words (for ``yodel diag``)."""
+    probes = _non_words(lexicon, samples)
+    t0 = time.perf_counter()
+    hits = sum(w in bloom for w in probes)
+    bloom_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for w in probes:
+        w in lexicon  # noqa: B015 - timing the exact lookup
+    exact_s = time.perf_counter() - t0
+    return {
+        "bytes": bloom.nbytes,
+        "hashes": bloom.k,
+        "words": bloom.count,
+        "target_fp_rate": bloom.fp_rate,
+        "expected_fp_rate": round(bloom.expected_fp_rate(), 5),
+        "observed_fp_rate": round(hits / samples, 5),
+        "bloom_lookups_per_sec": round(samples / bloom_s) if bloom_s else 0,
+        "lexicon_lookups_per_sec": round(samples / exact_s) if exact_s else 0,
+    }
+
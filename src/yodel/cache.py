@@ -0,0 +1,111 @@
+"""On-disk, cross-process cache of derived word lexicons.
+
+Deriving the word list from raw WordNet index files means parsing megabytes
+of text on every process start. The result is stored once as a compiled
+lexicon (see ``lexicon``) under ``cache_dir()`` and memory-mapped by later
+processes:
+
+    <key>.lex    compiled lexicon
+    <key>.json   source fingerprint: [path, size, mtime_ns, sha256] per input file
+
+``key`` hashes the cache version, the source kind and resolved path, and the
+derivation salt (``WORD_RE``'s pattern), so changing the filter never reuses
+an old entry. An entry is valid while every input file has the recorded size
+and mtime; when only the mtime moved the file is re-hashed and the entry is
+kept (and re-stamped) if the content is unchanged. Anything else re-derives
+and atomically replaces the entry. An unwritable cache directory just means
+deriving in memory.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+import hashlib
+import json
+import os
+
+from .lexicon import Lexicon, LexiconError, compile_lexicon
+
+CACHE_VERSION = 1
+
+
+def cache_dir() -> Path:
+    """``YODEL_CACHE_DIR``, else ``$XDG_CACHE_HOME/yodel``, else ``~/.cache/yodel``."""
+    env = os.getenv("YODEL_CACHE_DIR")
+    if env:
+        return Path(env)
+    xdg = os.getenv("XDG_CACHE_HOME")
+    return (Path(xdg) if xdg else Path.home() / ".cache") / "yodel"
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        while block := fh.read(1 << 20):
+            h.update(block)
+    return h.hexdigest()
+
+
+def fingerprint(files: Sequence[Path]) -> list[list]:
+    out = []
+    for f in files:
+        st = f.stat()
+        out.append([str(f), st.st_size, st.st_mtime_ns, _sha256_file(f)])
+    return out
+
+
+def _still_valid(recorded: list[list], files: Sequence[Path]) -> tuple[bool, bool]:
+    """(valid, restamp): compare stat first, fall back to content hash on mtime-only changes."""
+    if [r[0] for r in recorded] != [str(f) for f in files]:
+        return False, False
+    restamp = False
+    for (_path, size, mtime, sha), f in zip(recorded, files):
+        st = f.stat()
+        if st.st_size != size:
+            return False, False
+        if st.st_mtime_ns != mtime:
+            if _sha256_file(f) != sha:
+                return False, False
+            restamp = True
+    return True, restamp
+
+
+def _write_json(path: Path, obj) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(obj), encoding="utf-8")
+    tmp.replace(path)
+
+
+def cached_lexicon(
+    kind: str,
+    source: Path,
+    files: Sequence[Path],
+    derive: Callable[[], Iterable[str]],
+    salt: str = "",
+) -> Lexicon:
+    """Lexicon derived from ``files`` by ``derive()``, reusing the on-disk entry while the inputs are unchanged."""
+    key = hashlib.sha256(json.dumps([CACHE_VERSION, kind, str(source), salt]).encode("utf-8")).hexdigest()[:32]
+    root = cache_dir()
+    lex_path, meta_path = root / f"{kind}-{key}.lex", root / f"{kind}-{key}.json"
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        valid, restamp = _still_valid(meta["files"], files)
+        if valid:
+            lex = Lexicon(lex_path)
+            if restamp:
+                meta["files"] = fingerprint(files)
+                _write_json(meta_path, meta)
+            return lex
+    except (OSError, ValueError, KeyError, TypeError, LexiconError):
+        pass
+    words = sorted(set(derive()))
+    if not words:
+        return Lexicon.from_words(words)  # never cache an empty (failed) derivation
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        tmp = compile_lexicon(words, root / f"{kind}-{key}.{os.getpid()}.lex")
+        tmp.replace(lex_path)
+        _write_json(meta_path, {"version": CACHE_VERSION, "source": str(source), "salt": salt, "files": fingerprint(files)})
+        return Lexicon(lex_path)
+    except OSError:
+        return Lexicon.from_words(words)
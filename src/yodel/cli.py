@@ -4,7 +4,11 @@ Subcommands:
   play          Run interactive demo game loop.
   scroll TEXT   Scroll a message on the matrix (or stdout fallback).
   diag          Show environment & resource diagnostics.
-  update-words  Rebuild processed word list via build script.
+  update-words  Rebuild processed word lists (incremental build pipeline).
+  schedule      Precompute the daily-word schedule file.
+  serve         Host many game sessions over a local socket (or load-test one).
+  bench         Benchmark the hot paths; compare against a stored baseline.
+  replay LOG    Validate and score logged games (CSV / JSONL) across processes.
 """
 from __future__ import annotations
 
@@ -12,34 +16,115 @@ import argparse
 import importlib
 import os
 import sys
-import subprocess
 from pathlib import Path
 from typing import Callable
 
-from .game import Game
-from .dictionary import load_words
-from .display import MatrixDisplay
+# Subcommands import what they need when they run: ``yodel --help`` or
+# ``yodel scroll`` must not pay for the dictionary, NumPy or the display stack.
 
 
-def _cmd_play(_args: argparse.Namespace) -> int:
-    game = Game()
+def _cmd_play(args: argparse.Namespace) -> int:
+    from .game import Game
+
+    game = Game(mode=args.mode)
+    journal = None
+    if args.journal:
+        from .session import SessionJournal, resume_game
+
+        journal = SessionJournal(args.journal, sync_every=1)
+        game, resumed = resume_game(journal, game)
+        if resumed:
+            if game.solved:
+                print("Today's game is already solved.")
+                journal.close()
+                return 0
+            print(f"Resumed today's game: {len(game.state.ids)} guesses so far.")
+    try:
+        return _run_play(game, args)
+    finally:
+        if journal is not None:
+            journal.close()
+
+
+def _run_play(game, args: argparse.Namespace) -> int:
+    if args.use_async:
+        from .display import MatrixDisplay
+        from .runtime import play
+
+        disp = MatrixDisplay()
+        play(game, disp if disp.available() else None)
+        return 0
     game.start()
     return 0
 
 
 def _cmd_scroll(args: argparse.Namespace) -> int:
-    disp = MatrixDisplay()
-    disp.scroll_once(args.text)
+    from .display.matrix import MatrixDisplay, ScrollConfig
+
+    config = ScrollConfig(font_path=args.font) if args.font else ScrollConfig()
+    if args.out and not Path(config.font_path).is_file():
+        print(f"scroll: font not found: {config.font_path} (pass --font PATH to a BDF font)", file=sys.stderr)
+        return 1
+    disp = MatrixDisplay(config=config, output=args.out, max_speed=args.max_speed)
+    try:
+        disp.scroll_once(args.text)
+    finally:
+        disp.close()
+    if args.out and disp.last_stats is not None:
+        stats = disp.last_stats.as_dict()
+        print(f"Wrote {stats['frames']} frames to {args.out} ({stats['fps']} fps render)")
     return 0
 
 
-def _cmd_diag(_args: argparse.Namespace) -> int:
+def _cmd_diag(args: argparse.Namespace) -> int:
+    if args.metrics_from:
+        import json
+
+        from .metrics import format_report
+
+        print(format_report(json.loads(Path(args.metrics_from).read_text(encoding="utf-8"))))
+        return 0
+    if args.metrics:
+        from . import metrics
+
+        metrics.enable()  # before the instrumented modules are imported
+        from .bench import metrics_workload
+
+        metrics_workload()
+        if args.prom:
+            sys.stdout.write("# synthetic workload from yodel diag --metrics, not live traffic\n" + metrics.to_prometheus())
+        else:
+            print("Synthetic workload run by this command (not live traffic; see YODEL_METRICS_FILE):")
+            print(metrics.format_report())
+        return 0
+    if args.startup:
+        from .startup import format_startup, profile_startup
+
+        print(format_startup(profile_startup()))
+        return 0
+    from .dictionary import load_bloom, load_lexicon, load_words
+    from .display import MatrixDisplay
+
     info = {}
     # Python / platform
     info["python_version"] = sys.version.split()[0]
     # Words
     words = load_words()
     info["word_count"] = len(words)
+    lex = load_lexicon()
+    info["lexicon"] = f"{lex.path} ({lex.count * lex.width} bytes mapped)" if lex is not None else None
+    bloom = load_bloom(lex)
+    if bloom is not None:
+        from .bloom import measure
+
+        stats = measure(bloom, lex)  # type: ignore[arg-type]
+        info["bloom_filter"] = (
+            f"{stats['bytes']} bytes, k={stats['hashes']}, fp target {stats['target_fp_rate']:g} "
+            f"/ expected {stats['expected_fp_rate']:g} / observed {stats['observed_fp_rate']:g}"
+        )
+        info["bloom_lookups_per_sec"] = f"{stats['bloom_lookups_per_sec']:,} (lexicon {stats['lexicon_lookups_per_sec']:,})"
+    else:
+        info["bloom_filter"] = None
     # Display availability
     disp = MatrixDisplay()
     info["display_available"] = disp.available()
@@ -54,18 +139,90 @@ def _cmd_diag(_args: argparse.Namespace) -> int:
     return 0
 
 
-def _cmd_update_words(_args: argparse.Namespace) -> int:
-    script = Path("scripts/build_word_lists.py")
-    if not script.exists():
-        print("build_word_lists.py not found", file=sys.stderr)
+def _cmd_update_words(args: argparse.Namespace) -> int:
+    from .pipeline import BuildConfig, run_pipeline
+
+    config = BuildConfig(
+        min_length=args.min_length,
+        max_length=args.max_length,
+        split_compounds=args.split_compounds,
+        blocklist=Path(args.blocklist) if args.blocklist else BuildConfig.blocklist,
+        pattern_length=args.pattern_length,
+        bloom_fp_rate=args.bloom_fp,
+        graph=not args.no_graph,
+    )
+    run_pipeline(config, force=args.force)
+    return 0
+
+
+def _cmd_schedule(args: argparse.Namespace) -> int:
+    from datetime import date
+
+    from .daily import build_schedule
+
+    start = date.fromisoformat(args.start) if args.start else date(args.year or date.today().year, 1, 1)
+    try:
+        out = build_schedule(start, args.days, args.out)
+    except ValueError as e:
+        print(f"schedule: {e}", file=sys.stderr)
         return 1
-    # Run script in a subprocess with current interpreter
-    result = subprocess.run([sys.executable, str(script)], capture_output=True, text=True)
-    if result.returncode != 0:
-        print(result.stdout)
-        print(result.stderr, file=sys.stderr)
-        return result.returncode
-    print(result.stdout.strip())
+    print(f"Wrote {args.days} days from {start.isoformat()}: {out}")
+    return 0
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    from .server import run_load_test, run_server
+
+    if args.load_test:
+        import json
+
+        report = run_load_test(sessions=args.load_test, guesses=args.guesses, connections=args.connections)
+        print(json.dumps(report.as_dict(), indent=2))
+        return 0
+    run_server(args.host, args.port, args.unix, args.journal)
+    return 0
+
+
+def _cmd_bench(args: argparse.Namespace) -> int:
+    from .bench import compare, load_report, run_benchmarks, save_report
+
+    sizes = [int(s) for s in args.sizes.split(",")] if args.sizes else None
+    report = run_benchmarks(**({"sizes": sizes} if sizes else {}), only=args.only, repeat=args.repeat)
+    if args.json:
+        save_report(report, args.json)
+        print(f"results: {args.json}")
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        print(f"baseline saved: {args.baseline}")
+        return 0
+    baseline = Path(args.baseline)
+    if not baseline.is_file():
+        print(f"no baseline at {baseline} (use --save-baseline to record one)")
+        return 0
+    regressions = compare(report, load_report(baseline), args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r.key}: {r.baseline:,.2f} -> {r.value:,.2f} ({r.change:+.0%} worse)")
+    if not regressions:
+        print(f"no regressions beyond {args.threshold:.0%} vs {baseline}")
+    return 1 if regressions else 0
+
+
+def _cmd_replay(args: argparse.Namespace) -> int:
+    import json
+
+    from .replay import replay, write_synthetic_log
+
+    if args.generate:
+        write_synthetic_log(args.log, args.generate)
+        print(f"Wrote {args.generate} synthetic games to {args.log}")
+        return 0
+    summary = replay(args.log, mode=args.mode, workers=args.workers, chunk_size=args.chunk_size).as_dict()
+    text = json.dumps(summary, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+        print(f"{summary['games']} games in {summary['elapsed_s']} s ({summary['games_per_sec']}/s): {args.out}")
+    else:
+        print(text)
     return 0
 
 
@@ -74,23 +231,84 @@ def build_parser() -> argparse.ArgumentParser:
     sub = p.add_subparsers(dest="command", required=True)
 
     sp_play = sub.add_parser("play", help="Run demo game loop")
+    sp_play.add_argument("--mode", choices=["count", "wordle"], default="count", help="Scoring mode")
+    sp_play.add_argument("--async", dest="use_async", action="store_true", help="Asyncio runtime: scroll replies without blocking input")
+    sp_play.add_argument("--journal", help="Persist the game to this session journal and resume it after a restart")
     sp_play.set_defaults(func=_cmd_play)
 
     sp_scroll = sub.add_parser("scroll", help="Scroll text once")
     sp_scroll.add_argument("text", help="Text to scroll")
+    sp_scroll.add_argument("--out", help="Render headless to an animated .gif / .png (APNG) instead of the matrix")
+    sp_scroll.add_argument("--font", help="BDF font path (default: ScrollConfig.font_path)")
+    sp_scroll.add_argument("--max-speed", action="store_true", help="Ignore speed_seconds pacing (measure render fps)")
     sp_scroll.set_defaults(func=_cmd_scroll)
 
     sp_diag = sub.add_parser("diag", help="Show diagnostics")
+    sp_diag.add_argument("--startup", action="store_true", help="Profile cold start: import and init time per module")
+    sp_diag.add_argument("--metrics", action="store_true", help="Time a short synthetic workload (not live traffic) and report hot-path timings")
+    sp_diag.add_argument("--prom", action="store_true", help="With --metrics: Prometheus text format")
+    sp_diag.add_argument("--metrics-from", metavar="FILE", help="Report a JSON dump written by YODEL_METRICS_FILE")
     sp_diag.set_defaults(func=_cmd_diag)
 
-    sp_update = sub.add_parser("update-words", help="Rebuild processed word list")
+    sp_update = sub.add_parser("update-words", help="Rebuild processed word lists (cached per stage)")
+    sp_update.add_argument("--min-length", type=int, default=3, help="Shortest word kept")
+    sp_update.add_argument("--max-length", type=int, help="Longest word kept (default: no limit)")
+    sp_update.add_argument("--split-compounds", action="store_true", help="Split multi-word lemmas instead of dropping them")
+    sp_update.add_argument("--blocklist", help="Blocklist file (default data/blocklist.txt if present)")
+    sp_update.add_argument(
+        "--pattern-length", type=int, default=5, choices=range(11), metavar="{0..10}",
+        help="Feedback table word length, 1-10 (0 to skip)",
+    )
+    sp_update.add_argument("--bloom-fp", type=float, default=0.01, help="Bloom pre-filter false-positive rate (0 to skip)")
+    sp_update.add_argument("--no-graph", action="store_true", help="Skip the synset graph store")
+    sp_update.add_argument("--force", action="store_true", help="Ignore stage caches and rebuild everything")
     sp_update.set_defaults(func=_cmd_update_words)
+
+    sp_sched = sub.add_parser("schedule", help="Precompute daily-word schedule")
+    sp_sched.add_argument("--year", type=int, help="Calendar year (default: current)")
+    sp_sched.add_argument("--start", help="First day YYYY-MM-DD (overrides --year)")
+    sp_sched.add_argument("--days", type=int, default=366, help="Number of days (default 366, a full year)")
+    sp_sched.add_argument("--out", default="data/processed/daily_schedule.bin", help="Output file")
+    sp_sched.set_defaults(func=_cmd_schedule)
+
+    sp_serve = sub.add_parser("serve", help="Host many game sessions (JSON lines over TCP / Unix socket)")
+    sp_serve.add_argument("--host", default="127.0.0.1", help="Bind address")
+    sp_serve.add_argument("--port", type=int, default=7717, help="TCP port")
+    sp_serve.add_argument("--unix", help="Listen on a Unix socket path instead of TCP")
+    sp_serve.add_argument("--journal", help="Crash-safe session journal: sessions survive restarts")
+    sp_serve.add_argument("--load-test", type=int, metavar="SESSIONS", help="Run a local load test with this many simulated sessions")
+    sp_serve.add_argument("--guesses", type=int, default=6, help="Guesses per simulated session")
+    sp_serve.add_argument("--connections", type=int, default=64, help="Client connections for the load test")
+    sp_serve.set_defaults(func=_cmd_serve)
+
+    sp_bench = sub.add_parser("bench", help="Benchmark dictionary, scoring, rendering and CLI startup")
+    sp_bench.add_argument("--sizes", help="Comma-separated synthetic lexicon sizes, 1..1000000 (default 1000,100000)")
+    sp_bench.add_argument("--only", help="Run only benchmarks whose name contains this (e.g. is_valid)")
+    sp_bench.add_argument("--repeat", type=int, default=3, help="Timing repeats; the best is kept")
+    sp_bench.add_argument("--json", help="Write results JSON here")
+    sp_bench.add_argument("--baseline", default="benchmarks/baseline.json", help="Baseline results to compare against")
+    sp_bench.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    sp_bench.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before failing (fraction)")
+    sp_bench.set_defaults(func=_cmd_bench)
+
+    sp_replay = sub.add_parser("replay", help="Batch-validate and score a guess log (.csv or .jsonl)")
+    sp_replay.add_argument("log", help="Log file: JSONL, or CSV with target,guesses[,mode] header")
+    sp_replay.add_argument("--mode", choices=["count", "wordle"], default="wordle", help="Scoring mode when a record has none")
+    sp_replay.add_argument("--workers", type=int, help="Worker processes (default: CPU count; 1 runs in-process)")
+    sp_replay.add_argument("--chunk-size", type=int, default=5000, help="Games per work item")
+    sp_replay.add_argument("--out", help="Write the aggregated JSON here instead of stdout")
+    sp_replay.add_argument("--generate", type=int, metavar="GAMES", help="Write a synthetic JSONL log of GAMES games to LOG and exit")
+    sp_replay.set_defaults(func=_cmd_replay)
     return p
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if os.getenv("YODEL_METRICS", "") not in ("", "0"):
+        from .metrics import enable
+
+        enable()  # starts the YODEL_METRICS_FILE dump, if configured
     func: Callable[[argparse.Namespace], int] = getattr(args, "func")
     return func(args)
 
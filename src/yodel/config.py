@@ -8,6 +8,7 @@ import os
 class Settings:
     brightness: int = int(os.getenv("YODEL_BRIGHTNESS", "40"))
     daily_seed_salt: str = os.getenv("YODEL_SEED_SALT", "changeme")
+    word_length: int = int(os.getenv("YODEL_WORD_LENGTH", "5"))
 
 
 def load_settings() -> Settings:
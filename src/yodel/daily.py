@@ -0,0 +1,164 @@
+"""Deterministic daily target word.
+
+The word for a day is ``candidates[h % len(candidates)]`` where ``h`` is the
+sha256 of ``"<salt>:<YYYY-MM-DD>"`` and ``candidates`` is the stable,
+sorted array of ``length``-letter words of the active lexicon (never a set).
+There is no fallback word: a length with no candidates is a ``ValueError``.
+
+``build_schedule`` precomputes a range of days into a small fixed-width file
+so a device can read today's word at boot with one seek, without scanning the
+lexicon:
+
+    header  magic b"YSCH", u16 version, u16 width, u32 first day (ordinal),
+            u32 day count, 8 bytes sha256(salt) prefix, 8 bytes word-list
+            fingerprint (compiled lexicon checksum, else sha256 of the text
+            list; a schedule for another word list is ignored)
+    records count * width bytes of upper-case ASCII, one per day
+"""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Sequence
+import hashlib
+import os
+import struct
+
+from .config import load_settings
+from .dictionary import load_lexicon, load_word_index, load_words, word_list_path
+from .lexicon import Lexicon
+
+MAGIC = b"YSCH"
+VERSION = 2
+_HEADER = struct.Struct("<4sHHII8s8s")
+DEFAULT_SCHEDULE_PATH = Path("data/processed/daily_schedule.bin")
+
+
+def _salt_tag(salt: str) -> bytes:
+    return hashlib.sha256(salt.encode("utf-8")).digest()[:8]
+
+
+def _lexicon_tag() -> bytes:
+    """Fingerprint of the active word list, without loading a text list."""
+    return _source_tag(os.getenv("YODEL_LEXICON_PATH") or "", os.getenv("YODEL_WORDS_PATH") or "")
+
+
+@lru_cache(maxsize=4)
+def _source_tag(env_lexicon: str, env_words: str) -> bytes:
+    lex = load_lexicon()
+    if lex is not None:
+        return lex.checksum[:8]  # from the header
+    src = word_list_path()
+    if src is not None:
+        return hashlib.sha256(src.read_bytes()).digest()[:8]  # hashing is far cheaper than parsing
+    return Lexicon.from_words(load_words()).checksum[:8]  # built-in minimal list
+
+
+def daily_index(day: date, salt: str, n: int) -> int:
+    h = hashlib.sha256(f"{salt}:{day.isoformat()}".encode("utf-8")).digest()
+    return int.from_bytes(h[:8], "big") % n
+
+
+def candidate_words(length: int) -> Sequence[str]:
+    """Stable ordered candidates of ``length`` letters from the active word list."""
+    lex = load_lexicon()
+    if lex is not None:
+        return _LexiconSlice(lex, _length_ids(lex, length))
+    return sorted(w for w in load_words() if len(w) == length)
+
+
+@lru_cache(maxsize=8)
+def _length_ids(lex: Lexicon, length: int):
+    # A prebuilt .idx answers this directly; otherwise scan the record lengths
+    # rather than building a whole WordIndex just to list one length.
+    if lex.path.with_suffix(".idx").is_file():
+        return load_word_index().ids_of_length(length)
+    return lex.ids_of_length(length)
+
+
+class _LexiconSlice(Sequence[str]):
+    """Sequence view of selected lexicon ids (no per-word objects up front)."""
+
+    def __init__(self, lex, ids) -> None:
+        self._lex = lex
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self._lex.word_at(j) for j in self._ids[i]]
+        return self._lex.word_at(self._ids[i])
+
+
+def select_word(day: date, salt: str, candidates: Sequence[str]) -> str:
+    if not candidates:
+        raise ValueError("no candidate words of the requested length")
+    return candidates[daily_index(day, salt, len(candidates))]
+
+
+def build_schedule(
+    start: date,
+    days: int = 365,
+    path: str | Path = DEFAULT_SCHEDULE_PATH,
+    salt: str | None = None,
+    length: int | None = None,
+) -> Path:
+    """Precompute ``days`` daily words starting at ``start`` into ``path``."""
+    settings = load_settings()
+    salt = settings.daily_seed_salt if salt is None else salt
+    length = settings.word_length if length is None else length
+    candidates = candidate_words(length)
+    if not candidates:
+        raise ValueError(f"no {length}-letter words in the active word list")
+    words = [select_word(start + timedelta(days=i), salt, candidates).encode("ascii") for i in range(days)]
+    width = length
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    with tmp.open("wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, VERSION, width, start.toordinal(), days, _salt_tag(salt), _lexicon_tag()))
+        fh.write(b"".join(w.ljust(width, b"\0") for w in words))
+    tmp.replace(out)
+    return out
+
+
+def scheduled_word(day: date, path: str | Path = DEFAULT_SCHEDULE_PATH, salt: str | None = None) -> str | None:
+    """O(1) lookup in a precomputed schedule; None if missing, stale or out of range."""
+    salt = load_settings().daily_seed_salt if salt is None else salt
+    try:
+        with Path(path).open("rb") as fh:
+            head = fh.read(_HEADER.size)
+            if len(head) != _HEADER.size:
+                return None
+            magic, version, width, first, count, tag, lex_tag = _HEADER.unpack(head)
+            k = day.toordinal() - first
+            if magic != MAGIC or version != VERSION or tag != _salt_tag(salt) or not 0 <= k < count:
+                return None
+            if lex_tag != _lexicon_tag():
+                return None  # word list was rebuilt since the schedule was made
+            fh.seek(_HEADER.size + k * width)
+            rec = fh.read(width)
+    except OSError:
+        return None
+    return rec.rstrip(b"\0").decode("ascii") or None
+
+
+def daily_word(day: date | None = None, salt: str | None = None, length: int | None = None) -> str:
+    """Today's (or ``day``'s) target: schedule file first, else computed from the lexicon.
+
+    Raises ``ValueError`` when the word list has no ``length``-letter words.
+    """
+    settings = load_settings()
+    day = day or date.today()
+    salt = settings.daily_seed_salt if salt is None else salt
+    length = settings.word_length if length is None else length
+    word = scheduled_word(day, salt=salt)
+    if word is not None and len(word) == length:
+        return word
+    candidates = candidate_words(length)
+    if not candidates:
+        raise ValueError(f"no {length}-letter words in the active word list")
+    return select_word(day, salt, candidates)
@@ -5,8 +5,15 @@ from functools import lru_cache
 import os
 import re
 from datetime import datetime
+from typing import Iterator
+
+from . import metrics, wordnet
+from .bloom import BloomFilter
+from .lexicon import Lexicon, LexiconError
+from .wordindex import WordIndex
 
 _DEFAULT_PATH = Path("data/words.txt")  # Optional curated list (preferred once generated)
+_COMPILED_PATH = Path("data/processed/game_words.lex")  # Written by scripts/build_word_lists.py
 _RAW_ROOT = Path("data/raw")
 
 WORD_RE = re.compile(r"^[A-Za-z]{3,}$")  # basic token filter; adjust later
@@ -14,67 +21,188 @@ WORD_RE = re.compile(r"^[A-Za-z]{3,}$")  # basic token filter; adjust later
 
 def _latest_wordnet_dir() -> Path | None:
     """Return newest extracted english-wordnet directory (based on date suffix)."""
-    if not _RAW_ROOT.exists():
-        return None
-    candidates = []
-    for p in _RAW_ROOT.iterdir():
-        if p.is_dir() and p.name.startswith("english-wordnet-2024_"):
-            # extract date portion after last underscore if numeric
-            parts = p.name.rsplit("_", 1)
-            if len(parts) == 2 and parts[1].isdigit():
-                candidates.append((parts[1], p))
-    if not candidates:
-        return None
-    # pick max date string (YYYYMMDD lexical works)
-    return max(candidates, key=lambda t: t[0])[1]
+    return wordnet.latest_wordnet_dir(_RAW_ROOT)
+
+
+def _index_words(entries: Iterator[wordnet.IndexEntry]) -> set[str]:
+    return {e.lemma.upper() for e in entries if WORD_RE.match(e.lemma)}
 
 
 def _load_from_wordnet_dir(d: Path) -> set[str]:
     words: set[str] = set()
-    # Common index files
-    for fname in ["index.noun", "index.verb", "index.adj", "index.adv"]:
-        fpath = next(d.rglob(fname), None)
-        if not fpath or not fpath.is_file():
-            continue
-        try:
-            with fpath.open("r", encoding="utf-8", errors="ignore") as fh:
-                for line in fh:
-                    if not line or line.startswith(" ") or line.startswith("#"):
-                        continue
-                    token = line.split()[0]
-                    if WORD_RE.match(token):
-                        words.add(token.upper())
-        except Exception:
-            continue
+    # Common index files, parsed concurrently
+    try:
+        per_pos = wordnet.map_files(d, "index", _index_words)
+    except Exception:
+        return words
+    for pos_words in per_pos.values():
+        words |= pos_words
     return words
 
 
-@lru_cache(maxsize=1)
+def _wordnet_lexicon(d: Path) -> Lexicon | None:
+    """Words derived from WordNet dir ``d``, via the on-disk cache (see ``cache``)."""
+    from .cache import cached_lexicon
+
+    files = [f.resolve() for pos in wordnet.POS_NAMES if (f := wordnet.find_file(d, f"index.{pos}")) is not None]
+    if not files:
+        return None
+    salt = f"{WORD_RE.pattern}/{WORD_RE.flags}"
+    lex = cached_lexicon("wordnet", d.resolve(), files, lambda: _load_from_wordnet_dir(d), salt=salt)
+    return lex if len(lex) else None
+
+
+def _read_list(p: Path) -> set[str]:
+    with p.open("r", encoding="utf-8") as f:
+        return {line.strip().upper() for line in f if line.strip()}
+
+
 def load_words(path: str | Path = _DEFAULT_PATH) -> set[str]:
+    # The override is part of the cache key, so changing YODEL_WORDS_PATH takes effect.
+    return _load_words(str(path), os.getenv("YODEL_WORDS_PATH") or "")
+
+
+@lru_cache(maxsize=4)
+@metrics.timed("load_words")
+def _load_words(path: str, env_path: str) -> set[str]:
     # 1. If explicit YODEL_WORDS_PATH provided, use it.
-    env_path = os.getenv("YODEL_WORDS_PATH")
     if env_path:
         p = Path(env_path)
         if p.is_file():
-            with p.open("r", encoding="utf-8") as f:
-                return {line.strip().upper() for line in f if line.strip()}
+            return _read_list(p)
 
     # 2. If curated file exists at default, use it.
     p = Path(path)
     if p.is_file():
-        with p.open("r", encoding="utf-8") as f:
-            return {line.strip().upper() for line in f if line.strip()}
+        return _read_list(p)
 
-    # 3. Fallback: derive from latest extracted WordNet directory.
+    # 3. Fallback: derive from latest extracted WordNet directory (cached on disk).
     wn_dir = _latest_wordnet_dir()
     if wn_dir:
-        wn_words = _load_from_wordnet_dir(wn_dir)
-        if wn_words:
-            return wn_words
+        lex = _wordnet_lexicon(wn_dir)
+        if lex is not None:
+            return set(lex.words())
 
     # 4. Final minimal fallback.
     return {"YODEL", "HELLO", "WORLD"}
 
 
+def word_list_path(path: str | Path = _DEFAULT_PATH) -> Path | None:
+    """The text list ``load_words`` reads (YODEL_WORDS_PATH, then the curated file), if any."""
+    for p in (os.getenv("YODEL_WORDS_PATH"), path):
+        if p and Path(p).is_file():
+            return Path(p)
+    return None
+
+
+def load_lexicon(path: str | Path = _COMPILED_PATH) -> Lexicon | None:
+    """Open the compiled lexicon if one exists, else None.
+
+    An explicit YODEL_WORDS_PATH text list, or the curated ``data/words.txt``,
+    takes precedence over the default compiled file (the same order as
+    ``load_words``); YODEL_LEXICON_PATH points at a compiled file directly.
+    Without a compiled file or curated list, the cached WordNet lexicon is used.
+    """
+    return _load_lexicon(str(path), os.getenv("YODEL_LEXICON_PATH") or "", os.getenv("YODEL_WORDS_PATH") or "")
+
+
+@lru_cache(maxsize=4)
+def _load_lexicon(path: str, env_lexicon: str, env_words: str) -> Lexicon | None:
+    if env_lexicon:
+        p = Path(env_lexicon)
+    elif env_words or (Path(path) == _COMPILED_PATH and _DEFAULT_PATH.is_file()):
+        return None  # the text list wins, as in load_words
+    else:
+        p = Path(path)
+    if not p.is_file():
+        if env_lexicon or _DEFAULT_PATH.is_file():
+            return None
+        wn_dir = _latest_wordnet_dir()
+        return _wordnet_lexicon(wn_dir) if wn_dir else None
+    try:
+        return Lexicon(p)
+    except (OSError, LexiconError):
+        return None
+
+
+@lru_cache(maxsize=2)
+def load_bloom(lex: Lexicon | None = None) -> BloomFilter | None:
+    """The ``.blm`` filter built alongside the compiled lexicon, if present and current."""
+    lex = lex if lex is not None else load_lexicon()
+    if lex is None:
+        return None
+    p = lex.path.with_suffix(".blm")
+    if not p.is_file():
+        return None
+    try:
+        return BloomFilter.open(p, lex)
+    except (OSError, ValueError):
+        return None
+
+
+def active_lexicon() -> Lexicon:
+    """The lexicon guesses are stored against: the compiled one, else built over the text list."""
+    lex = load_lexicon()
+    return lex if lex is not None else _memory_lexicon(os.getenv("YODEL_WORDS_PATH") or "")
+
+
+@lru_cache(maxsize=2)
+def _memory_lexicon(env_words: str) -> Lexicon:
+    return Lexicon.from_words(load_words())
+
+
+def word_id(word: str) -> int:
+    """Id of ``word`` in ``active_lexicon()``, or -1 (with the same Bloom pre-stage as ``is_valid``)."""
+    lex = active_lexicon()
+    w = word.upper()
+    bloom = load_bloom(lex)
+    if bloom is not None and w not in bloom:
+        return -1
+    return lex.index_of(w)
+
+
 def is_valid(word: str) -> bool:
+    lex = load_lexicon()
+    if lex is not None:
+        w = word.upper()
+        bloom = load_bloom(lex)
+        if bloom is not None and w not in bloom:
+            return False  # definite miss: the lexicon is not touched
+        return w in lex
     return word.upper() in load_words()
+
+
+def load_word_index() -> WordIndex:
+    """Prefix/pattern/anagram index over the active word list.
+
+    Uses the prebuilt ``.idx`` next to the compiled lexicon when it matches,
+    otherwise builds one in memory (from the text/WordNet list if needed).
+    """
+    return _load_word_index(load_lexicon(), os.getenv("YODEL_WORDS_PATH") or "")
+
+
+@lru_cache(maxsize=2)
+def _load_word_index(lex: Lexicon | None, env_words: str) -> WordIndex:
+    if lex is not None:
+        idx_path = lex.path.with_suffix(".idx")
+        if idx_path.is_file():
+            try:
+                return WordIndex.open(lex, idx_path)
+            except (OSError, ValueError):
+                pass
+    else:
+        lex = Lexicon.from_words(load_words())
+    return WordIndex.build(lex)
+
+
+def words_with_prefix(prefix: str, limit: int | None = None) -> list[str]:
+    return load_word_index().prefix(prefix, limit)
+
+
+def match_pattern(pattern: str, limit: int | None = None) -> list[str]:
+    """e.g. ``match_pattern("Y?D?L")``; ``?`` is one letter, ``*`` any run."""
+    return load_word_index().match(pattern, limit)
+
+
+def anagrams(letters: str) -> list[str]:
+    return load_word_index().anagrams(letters)
@@ -1,5 +1,6 @@
 """Display abstractions (LED matrix, fallbacks)."""
 
 from .matrix import MatrixDisplay, DisplayUnavailable
+from .scheduler import FrameScheduler, FrameStats
 
-__all__ = ["MatrixDisplay", "DisplayUnavailable"]
+__all__ = ["MatrixDisplay", "DisplayUnavailable", "FrameScheduler", "FrameStats"]
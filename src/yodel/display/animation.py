@@ -0,0 +1,205 @@
+"""Streaming animated GIF / APNG writers for headless rendering.
+
+Frames are encoded and written as they arrive; only the previous frame is held
+(so runs of identical frames collapse into one longer frame), never the whole
+animation. Pure Python (``zlib`` for APNG, a small LZW coder for GIF).
+
+APNG keeps the exact frame period; GIF delays are whole centiseconds and most
+viewers clamp delays under 2cs, so prefer ``.png`` for timing-accurate output.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO
+import struct
+import zlib
+
+_PNG_SIG = b"\x89PNG\r\n\x1a\n"
+
+
+class AnimationWriter(ABC):
+    """Base for streaming writers: ``add(rgb)`` per frame, ``close()`` at the end."""
+
+    def __init__(self, target: str | Path | BinaryIO, width: int, height: int, delay: float) -> None:
+        self.width = width
+        self.height = height
+        self.delay = delay
+        self.frames = 0  # frames added (before collapsing duplicates)
+        self._owned = isinstance(target, (str, Path))
+        self._fh: BinaryIO = open(target, "wb") if self._owned else target  # type: ignore[arg-type]
+        self._pending: bytes | None = None
+        self._pending_count = 0
+        self._closed = False
+        self._start()
+
+    def add(self, rgb) -> None:
+        """Append one ``width * height * 3`` RGB frame."""
+        frame = bytes(rgb)
+        if len(frame) != self.width * self.height * 3:
+            raise ValueError(f"frame must be {self.width}x{self.height} RGB")
+        self.frames += 1
+        if frame == self._pending:
+            self._pending_count += 1
+            return
+        self._flush()
+        self._pending, self._pending_count = frame, 1
+
+    def _flush(self) -> None:
+        if self._pending is not None:
+            self._write_frame(self._pending, self.delay * self._pending_count)
+            self._pending = None
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._flush()
+        self._finish()
+        if self._owned:
+            self._fh.close()
+
+    def __enter__(self) -> "AnimationWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @abstractmethod
+    def _start(self) -> None:
+        """Write the file header."""
+
+    @abstractmethod
+    def _write_frame(self, frame: bytes, duration: float) -> None:
+        """Encode one (deduplicated) frame shown for ``duration`` seconds."""
+
+    @abstractmethod
+    def _finish(self) -> None:
+        """Write the trailer."""
+
+
+class ApngWriter(AnimationWriter):
+    """Animated PNG. The frame count is patched into ``acTL`` on close (needs a seekable target)."""
+
+    def _chunk(self, tag: bytes, payload: bytes) -> None:
+        self._fh.write(struct.pack(">I", len(payload)) + tag + payload)
+        self._fh.write(struct.pack(">I", zlib.crc32(tag + payload) & 0xFFFFFFFF))
+
+    def _start(self) -> None:
+        self._seq = 0
+        self._written = 0
+        self._fh.write(_PNG_SIG)
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0))
+        self._actl_pos = self._fh.tell()
+        self._chunk(b"acTL", struct.pack(">II", 1, 0))
+
+    def _write_frame(self, frame: bytes, duration: float) -> None:
+        stride = self.width * 3
+        raw = b"".join(b"\0" + frame[i:i + stride] for i in range(0, len(frame), stride))
+        data = zlib.compress(raw, 6)
+        ms = max(1, min(0xFFFF, round(duration * 1000)))
+        self._chunk(b"fcTL", struct.pack(">IIIIIHHBB", self._seq, self.width, self.height, 0, 0, ms, 1000, 0, 0))
+        self._seq += 1
+        if self._written == 0:
+            self._chunk(b"IDAT", data)
+        else:
+            self._chunk(b"fdAT", struct.pack(">I", self._seq) + data)
+            self._seq += 1
+        self._written += 1
+
+    def _finish(self) -> None:
+        if self._written == 0:
+            self._write_frame(bytes(self.width * self.height * 3), self.delay)
+        self._chunk(b"IEND", b"")
+        end = self._fh.tell()
+        self._fh.seek(self._actl_pos)
+        self._chunk(b"acTL", struct.pack(">II", self._written, 0))
+        self._fh.seek(end)
+
+
+def _lzw(indices: bytes, min_size: int) -> bytes:
+    """GIF variable-width LZW, packed LSB-first into 255-byte sub-blocks."""
+    clear, eoi = 1 << min_size, (1 << min_size) + 1
+    out = bytearray()
+    acc = nbits = 0
+
+    def emit(code: int, size: int) -> None:
+        nonlocal acc, nbits
+        acc |= code << nbits
+        nbits += size
+        while nbits >= 8:
+            out.append(acc & 0xFF)
+            acc >>= 8
+            nbits -= 8
+
+    size = min_size + 1
+    table = {bytes([i]): i for i in range(clear)}
+    next_code = eoi + 1
+    emit(clear, size)
+    w = b""
+    for i in range(len(indices)):
+        c = indices[i:i + 1]
+        wc = w + c
+        if wc in table:
+            w = wc
+            continue
+        emit(table[w], size)
+        if next_code < 4096:
+            table[wc] = next_code
+            if next_code == 1 << size and size < 12:
+                size += 1
+            next_code += 1
+        else:
+            emit(clear, size)
+            table = {bytes([i]): i for i in range(clear)}
+            size, next_code = min_size + 1, eoi + 1
+        w = c
+    if w:
+        emit(table[w], size)
+    emit(eoi, size)
+    if nbits:
+        out.append(acc & 0xFF)
+    return b"".join(bytes([len(out[i:i + 255])]) + out[i:i + 255] for i in range(0, len(out), 255)) + b"\0"
+
+
+def _palettize(frame: bytes) -> tuple[bytes, bytes]:
+    """(palette RGB bytes, one index byte per pixel); colours are reduced to 3-3-2 bits past 256."""
+    pixels = list(zip(frame[0::3], frame[1::3], frame[2::3]))
+    colors = dict.fromkeys(pixels)
+    if len(colors) > 256:
+        pixels = [(r & 0xE0, g & 0xE0, b & 0xC0) for r, g, b in pixels]
+        colors = dict.fromkeys(pixels)
+    lookup = {c: i for i, c in enumerate(colors)}
+    return b"".join(bytes(c) for c in colors), bytes(lookup[p] for p in pixels)
+
+
+class GifWriter(AnimationWriter):
+    """Animated GIF89a, looping forever, with a local colour table per frame."""
+
+    def _start(self) -> None:
+        self._fh.write(b"GIF89a" + struct.pack("<HHBBB", self.width, self.height, 0, 0, 0))
+        self._fh.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def _write_frame(self, frame: bytes, duration: float) -> None:
+        palette, indices = _palettize(frame)
+        bits = max(1, (len(palette) // 3 - 1).bit_length())
+        palette = palette.ljust(3 << bits, b"\0")
+        cs = max(1, min(0xFFFF, round(duration * 100)))
+        self._fh.write(b"\x21\xf9\x04\x00" + struct.pack("<H", cs) + b"\x00\x00")
+        self._fh.write(b"\x2c" + struct.pack("<HHHHB", 0, 0, self.width, self.height, 0x80 | (bits - 1)))
+        self._fh.write(palette)
+        min_size = max(2, bits)
+        self._fh.write(bytes([min_size]) + _lzw(indices, min_size))
+
+    def _finish(self) -> None:
+        self._fh.write(b"\x3b")
+
+
+def open_animation(path: str | Path, width: int, height: int, delay: float) -> AnimationWriter:
+    """Writer chosen by suffix: ``.gif`` -> GIF, ``.png`` / ``.apng`` -> APNG."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gif":
+        return GifWriter(path, width, height, delay)
+    if suffix in (".png", ".apng"):
+        return ApngWriter(path, width, height, delay)
+    raise ValueError(f"unsupported animation format: {suffix or path}")
@@ -0,0 +1,107 @@
+"""Minimal pure-Python BDF font reader with a per-process cache.
+
+Only what the matrix needs: per-glyph advance, bounding box and bitmap rows
+(stored as ints, most significant bit = leftmost pixel). ``load_bdf`` parses a
+given path once per process.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+from ..metrics import timed
+
+
+class Glyph:
+    __slots__ = ("advance", "width", "height", "x_off", "y_off", "rows", "row_bits")
+
+    def __init__(self, advance: int, width: int, height: int, x_off: int, y_off: int, rows: tuple[int, ...], row_bits: int) -> None:
+        self.advance = advance
+        self.width = width
+        self.height = height
+        self.x_off = x_off
+        self.y_off = y_off
+        self.rows = rows
+        self.row_bits = row_bits
+
+    def pixels(self):
+        """Yield (x, y) of lit pixels relative to the glyph box top-left."""
+        shift = self.row_bits - 1
+        for y, row in enumerate(self.rows):
+            if not row:
+                continue
+            for x in range(self.width):
+                if row >> (shift - x) & 1:
+                    yield x, y
+
+
+class BDFFont:
+    def __init__(self, glyphs: dict[int, Glyph], ascent: int, descent: int, default_char: int | None) -> None:
+        self.glyphs = glyphs
+        self.ascent = ascent
+        self.descent = descent
+        self.height = ascent + descent
+        self.default_char = default_char
+
+    def glyph(self, ch: str) -> Glyph | None:
+        g = self.glyphs.get(ord(ch))
+        if g is None and self.default_char is not None:
+            g = self.glyphs.get(self.default_char)
+        return g
+
+    def text_width(self, text: str) -> int:
+        return sum(g.advance for g in map(self.glyph, text) if g is not None)
+
+
+def parse_bdf(lines) -> BDFFont:
+    glyphs: dict[int, Glyph] = {}
+    ascent = descent = 0
+    default_char = None
+    font_bbx = (0, 0, 0, 0)
+    encoding = -1
+    advance = 0
+    bbx = font_bbx
+    rows: list[int] = []
+    row_bits = 0
+    in_bitmap = False
+    for raw in lines:
+        line = raw.strip()
+        if in_bitmap:
+            if line == "ENDCHAR":
+                in_bitmap = False
+                if encoding >= 0:
+                    glyphs[encoding] = Glyph(advance, bbx[0], bbx[1], bbx[2], bbx[3], tuple(rows), row_bits)
+                continue
+            rows.append(int(line, 16) if line else 0)
+            row_bits = max(row_bits, len(line) * 4)
+            continue
+        key, _, rest = line.partition(" ")
+        if key == "FONTBOUNDINGBOX":
+            font_bbx = tuple(int(v) for v in rest.split()[:4])  # type: ignore[assignment]
+        elif key == "FONT_ASCENT":
+            ascent = int(rest)
+        elif key == "FONT_DESCENT":
+            descent = int(rest)
+        elif key == "DEFAULT_CHAR":
+            default_char = int(rest)
+        elif key == "STARTCHAR":
+            encoding, advance, bbx, rows, row_bits = -1, font_bbx[0], font_bbx, [], 0
+        elif key == "ENCODING":
+            encoding = int(rest.split()[0])
+        elif key == "DWIDTH":
+            advance = int(rest.split()[0])
+        elif key == "BBX":
+            bbx = tuple(int(v) for v in rest.split()[:4])  # type: ignore[assignment]
+        elif key == "BITMAP":
+            in_bitmap = True
+    if not ascent and not descent:
+        ascent, descent = font_bbx[1] + font_bbx[3], -font_bbx[3]
+    return BDFFont(glyphs, ascent, descent, default_char)
+
+
+@lru_cache(maxsize=None)
+@timed("font_load")
+def load_bdf(path: str) -> BDFFont:
+    """Parse ``path`` once per process."""
+    with Path(path).open("r", encoding="latin-1") as fh:
+        return parse_bdf(fh)
@@ -0,0 +1,52 @@
+"""Software stand-ins for the rgbmatrix matrix and canvas.
+
+``SoftMatrix`` exposes the subset of ``RGBMatrix`` that ``MatrixDisplay``
+uses (``CreateFrameCanvas`` / ``SwapOnVSync``); canvases draw into an
+in-memory ``FrameBuffer`` and every swap hands the finished frame to a sink
+(for example an ``AnimationWriter``).
+"""
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from ..hardware.framebuffer import FrameBuffer
+
+
+class SoftCanvas:
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.buffer = FrameBuffer(width, height)
+
+    def Clear(self) -> None:  # noqa: N802 - rgbmatrix naming
+        self.buffer.clear()
+
+    def Fill(self, r: int, g: int, b: int) -> None:  # noqa: N802
+        self.buffer.fill((r, g, b))
+
+    def SetPixel(self, x: int, y: int, r: int, g: int, b: int) -> None:  # noqa: N802
+        self.buffer.set_pixel(x, y, (r, g, b))
+
+    def SetImage(self, image, offset_x: int = 0, offset_y: int = 0, unsafe: bool = True) -> None:  # noqa: N802
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        self.buffer.blit(image.tobytes(), offset_x, offset_y, image.size[0])
+
+
+class SoftMatrix:
+    """Single-buffered: ``SwapOnVSync`` emits the frame and returns the same canvas."""
+
+    def __init__(self, width: int, height: int, sink: Optional[Callable[[bytearray], None]] = None) -> None:
+        self.width = width
+        self.height = height
+        self.sink = sink
+        self.frames = 0
+
+    def CreateFrameCanvas(self) -> SoftCanvas:  # noqa: N802
+        return SoftCanvas(self.width, self.height)
+
+    def SwapOnVSync(self, canvas: SoftCanvas) -> SoftCanvas:  # noqa: N802
+        self.frames += 1
+        if self.sink is not None:
+            self.sink(canvas.buffer.data)
+        return canvas
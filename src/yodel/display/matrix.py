@@ -4,13 +4,53 @@ from __future__ import annotations
 
 Goals:
 - Provide simple scroll API for game messages.
-- Allow running on non-hardware systems (falls back to stdout).
+- Allow running on non-hardware systems (falls back to stdout), or render
+  headless into an animated GIF/APNG (``output=``) via a software canvas.
+- Load each BDF font once per process and, by default, rasterise a scrolled
+  message once into an off-screen strip so each frame is a window blit.
 """
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Generator, Optional
 import importlib
 import time
 
+from .. import metrics
+
+from .animation import AnimationWriter, open_animation
+from .bdf import load_bdf
+from .headless import SoftMatrix
+from .scheduler import FrameScheduler, FrameStats
+from .strip import Strip, render_strip
+
+_FONT_CACHE: dict[str, object] = {}  # font path -> loaded rgbmatrix graphics.Font
+_STRIP_CACHE_SIZE = 8
+_RENDER = metrics.histogram("frame_render")
+_SWAP = metrics.histogram("swap_vsync")
+_FONT_LOAD = metrics.histogram("font_load")
+
+
+def _graphics_font(graphics, path: str):
+    font = _FONT_CACHE.get(path)
+    if font is None:
+        t0 = time.perf_counter()
+        font = graphics.Font()
+        font.LoadFont(path)
+        _FONT_CACHE[path] = font
+        if _FONT_LOAD is not None:
+            _FONT_LOAD.observe(time.perf_counter() - t0)
+    return font
+
+
+@lru_cache(maxsize=1)
+def _pil_image():
+    """``PIL.Image`` if Pillow is installed, else None."""
+    try:
+        return importlib.import_module("PIL.Image")
+    except ImportError:
+        return None
+
 
 class DisplayUnavailable(RuntimeError):
     pass
@@ -18,21 +58,57 @@ class DisplayUnavailable(RuntimeError):
 
 @dataclass
 class ScrollConfig:
-    speed_seconds: float = 0.01
+    speed_seconds: float = 0.01  # frame period (deadline paced, see scheduler)
     brightness: float = 0.5  # 0..1 scaling of text color
     color: tuple[int, int, int] = (255, 255, 0)
     font_path: str = "fonts/spleen-16x32.bdf"
     baseline_offset: int = 23  # tune vs font size
     rotate_180: bool = True
+    # Scroll by blitting a pre-rendered strip instead of DrawText per frame. On a
+    # panel this needs Pillow (the ``display`` extra); without it DrawText is used.
+    prerender: bool = True
+    skip_late: bool = True  # drop frames (scroll further) when rendering falls behind
 
 
 class MatrixDisplay:
-    def __init__(self, rows: int = 32, cols: int = 64, config: Optional[ScrollConfig] = None) -> None:
+    """Scroll / static text on the matrix.
+
+    ``output`` renders headless into an animated ``.gif`` / ``.png`` (APNG)
+    instead of driving hardware; ``backend`` replaces the driver with any
+    object implementing the ``RGBMatrix`` subset of ``SoftMatrix`` (e.g.
+    ``SoftMatrix(cols, rows)`` to render headless without an output file).
+    ``max_speed`` ignores ``speed_seconds`` when pacing (frames still carry
+    the configured delay) so ``last_stats.fps`` measures raw rendering
+    throughput.
+    """
+
+    def __init__(
+        self,
+        rows: int = 32,
+        cols: int = 64,
+        config: Optional[ScrollConfig] = None,
+        output: str | Path | None = None,
+        max_speed: bool = False,
+        backend: object | None = None,
+    ) -> None:
         self.config = config or ScrollConfig()
         self._hw = None
+        self._graphics = None
+        self._writer: AnimationWriter | None = None
         self.rows = rows
         self.cols = cols
-        self._load_driver()
+        self.max_speed = max_speed
+        self._canvas = None
+        self._strips: dict[tuple[str, tuple[int, int, int], int], Strip] = {}
+        self.last_stats: FrameStats | None = None
+        self._static: tuple | None = None  # what show_static last put on the panel
+        if output is not None:
+            self._writer = open_animation(output, cols, rows, self.config.speed_seconds)
+            self._hw = SoftMatrix(cols, rows, self._writer.add)
+        elif backend is not None:
+            self._hw = backend  # software canvases draw through the pre-rendered strip
+        else:
+            self._load_driver()
 
     def _load_driver(self) -> None:
         try:
@@ -50,36 +126,128 @@ class MatrixDisplay:
     def available(self) -> bool:
         return self._hw is not None
 
-    def scroll_once(self, text: str) -> None:
-        if not self.available():
-            print(f"[DISPLAY:FALLBACK] {text}")
-            return
-        graphics = self._graphics
-        font = graphics.Font()
-        font.LoadFont(self.config.font_path)
-        color_scaled = tuple(int(c * self.config.brightness) for c in self.config.color)
-        text_color = graphics.Color(*color_scaled)
-        canvas = self._hw.CreateFrameCanvas()
+    def close(self) -> None:
+        """Finish the output animation, if rendering headless."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _text_color(self) -> tuple[int, int, int]:
+        return tuple(int(c * self.config.brightness) for c in self.config.color)  # type: ignore[return-value]
+
+    def _frame_canvas(self):
+        if self._canvas is None:
+            self._canvas = self._hw.CreateFrameCanvas()
+        return self._canvas
+
+    def _strip(self, text: str, baseline: int | None = None) -> Strip:
+        key = (text, self._text_color(), baseline or self.config.baseline_offset)
+        strip = self._strips.get(key)
+        if strip is None:
+            font = load_bdf(self.config.font_path)
+            strip = render_strip(font, text, self.rows, key[2], key[1])
+            if len(self._strips) >= _STRIP_CACHE_SIZE:
+                self._strips.pop(next(iter(self._strips)))
+            self._strips[key] = strip
+        return strip
+
+    def _strip_blitter(self, strip: Strip) -> Callable[[object, int], None]:
+        """Return ``blit(canvas, x)`` drawing ``strip`` with its left edge at ``x``."""
+        image_mod = _pil_image()
+        if image_mod is not None and strip.width:
+            image = image_mod.frombytes("RGB", (strip.width, strip.height), bytes(strip.pixels))
+
+            def blit(canvas, x: int) -> None:
+                x0, x1 = max(0, -x), min(strip.width, canvas.width - x)
+                if x0 < x1:
+                    canvas.SetImage(image.crop((x0, 0, x1, strip.height)), x + x0, 0)
+            return blit
+
+        pixels = strip.pixels
+
+        def blit_pixels(canvas, x: int) -> None:
+            set_pixel = canvas.SetPixel
+            for sx in range(max(0, -x), min(strip.width, canvas.width - x)):
+                for y in strip.columns[sx]:
+                    i = (y * strip.width + sx) * 3
+                    set_pixel(x + sx, y, pixels[i], pixels[i + 1], pixels[i + 2])
+        return blit_pixels
+
+    def scheduler(self) -> FrameScheduler:
+        speed = 0.0 if self.max_speed else self.config.speed_seconds
+        return FrameScheduler(1.0 / speed if speed > 0 else 0.0, skip_late=self.config.skip_late)
+
+    def scroll_frames(self, text: str) -> Generator[int, int, None]:
+        """Render and swap one scroll frame per iteration; yields the text x position.
+
+        ``send(n)`` advances the text by ``n`` pixels for the next frame
+        (the scheduler sends more than 1 after dropping late frames).
+        """
+        canvas = self._frame_canvas()
+        self._static = None
         pos = canvas.width
+        # Pixel-by-pixel strip blits only pay off against a software canvas;
+        # on a panel without Pillow one C++ DrawText per frame is cheaper.
+        if self._graphics is None or (self.config.prerender and _pil_image() is not None):
+            strip = self._strip(text)
+            blit = self._strip_blitter(strip)
+            length = strip.width
+            draw = blit
+        else:
+            graphics = self._graphics
+            font = _graphics_font(graphics, self.config.font_path)
+            text_color = graphics.Color(*self._text_color())
+            length = 0
+
+            def draw(c, x: int) -> None:
+                nonlocal length
+                length = graphics.DrawText(c, font, x, self.config.baseline_offset, text_color, text)
+        clock = time.perf_counter
         while True:
+            t0 = clock()
             canvas.Clear()
-            length = graphics.DrawText(canvas, font, pos, self.config.baseline_offset, text_color, text)
-            pos -= 1
+            draw(canvas, pos)
             if pos + length < 0:
                 break
-            time.sleep(self.config.speed_seconds)
-            canvas = self._hw.SwapOnVSync(canvas)
+            if _RENDER is not None:
+                t1 = clock()
+                _RENDER.observe(t1 - t0)
+                canvas = self._hw.SwapOnVSync(canvas)
+                _SWAP.observe(clock() - t1)  # type: ignore[union-attr]
+            else:
+                canvas = self._hw.SwapOnVSync(canvas)
+            self._canvas = canvas
+            step = yield pos
+            pos -= step or 1
+
+    def scroll_once(self, text: str) -> None:
+        if not self.available():
+            print(f"[DISPLAY:FALLBACK] {text}")
+            return
+        self.last_stats = self.scheduler().run(self.scroll_frames(text))
+
+    async def scroll_async(self, text: str, cancelled: Optional[Callable[[], bool]] = None) -> None:
+        """Non-blocking ``scroll_once``: awaits between frames, stops early when ``cancelled()``."""
+        if not self.available():
+            print(f"[DISPLAY:FALLBACK] {text}")
+            return
+        self.last_stats = await self.scheduler().arun(self.scroll_frames(text), cancelled)
 
     def show_static(self, text: str, x: int = 0, y: int = 0) -> None:
         if not self.available():
             print(f"[DISPLAY:FALLBACK:STATIC] ({x},{y}) {text}")
             return
-        graphics = self._graphics
-        font = graphics.Font()
-        font.LoadFont(self.config.font_path)
-        color_scaled = tuple(int(c * self.config.brightness) for c in self.config.color)
-        text_color = graphics.Color(*color_scaled)
-        canvas = self._hw.CreateFrameCanvas()
+        key = (text, x, y, self._text_color(), self.config.font_path)
+        if key == self._static:
+            return  # already on the panel: skip redraw and vsync swap
+        canvas = self._frame_canvas()
         canvas.Clear()
-        graphics.DrawText(canvas, font, x, y or self.config.baseline_offset, text_color, text)
-        self._hw.SwapOnVSync(canvas)
+        if self._graphics is None:
+            self._strip_blitter(self._strip(text, y))(canvas, x)
+        else:
+            graphics = self._graphics
+            font = _graphics_font(graphics, self.config.font_path)
+            text_color = graphics.Color(*self._text_color())
+            graphics.DrawText(canvas, font, x, y or self.config.baseline_offset, text_color, text)
+        self._canvas = self._hw.SwapOnVSync(canvas)
+        self._static = key
@@ -0,0 +1,170 @@
+"""Deadline-based frame pacing for scrolling and animations.
+
+Frames are scheduled on absolute ``perf_counter`` deadlines (start + n * period)
+rather than ``sleep(period)`` after each render, so render / vsync time does not
+accumulate as drift. When a frame starts more than a full period late the
+scheduler skips ahead and reports the dropped frames so the animation can
+advance by several steps at once.
+
+Animations are generators: they draw one frame per iteration, yield, and
+accept (via ``send``) how many steps to advance for the next frame. ``run``
+blocks the calling thread; ``arun`` awaits between frames so other asyncio
+tasks (input, game logic) run while an animation plays.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Optional
+import math
+import time
+
+from .. import metrics
+
+_FRAME = metrics.histogram("frame_time")
+_LATENESS = metrics.histogram("frame_lateness")
+_DROPPED = metrics.counter("frames_dropped")
+
+
+@dataclass
+class FrameStats:
+    target_period: float = 0.0
+    frames: int = 0
+    dropped: int = 0
+    elapsed: float = 0.0
+    render_total: float = 0.0
+    render_max: float = 0.0
+    lateness_total: float = 0.0
+    lateness_sq_total: float = 0.0
+    lateness_max: float = 0.0
+
+    def record(self, lateness: float, render: float) -> None:
+        self.frames += 1
+        self.render_total += render
+        self.render_max = max(self.render_max, render)
+        self.lateness_total += lateness
+        self.lateness_sq_total += lateness * lateness
+        self.lateness_max = max(self.lateness_max, lateness)
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def jitter(self) -> float:
+        """Standard deviation (seconds) of frame start lateness vs. deadline."""
+        if not self.frames:
+            return 0.0
+        mean = self.lateness_total / self.frames
+        return math.sqrt(max(0.0, self.lateness_sq_total / self.frames - mean * mean))
+
+    @property
+    def render_mean(self) -> float:
+        return self.render_total / self.frames if self.frames else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "fps": round(self.fps, 2),
+            "target_fps": round(1.0 / self.target_period, 2) if self.target_period else 0.0,
+            "jitter_ms": round(self.jitter * 1000, 3),
+            "late_max_ms": round(self.lateness_max * 1000, 3),
+            "render_mean_ms": round(self.render_mean * 1000, 3),
+            "render_max_ms": round(self.render_max * 1000, 3),
+        }
+
+
+class FrameScheduler:
+    """Pace a frame generator at ``fps`` (``fps <= 0`` runs unpaced)."""
+
+    def __init__(
+        self,
+        fps: float,
+        skip_late: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.period = 1.0 / fps if fps > 0 else 0.0
+        self.skip_late = skip_late
+        self._clock = clock
+        self._sleep = sleep
+        self.stats = FrameStats(target_period=self.period)
+        self._start = 0.0
+        self._next = 0.0
+
+    def start(self) -> None:
+        self.stats = FrameStats(target_period=self.period)
+        self._start = self._next = self._clock()
+
+    def _advance(self) -> tuple[float, int]:
+        """Move to the next deadline; returns (seconds to sleep, frames skipped)."""
+        self._next += self.period
+        now = self._clock()
+        if now < self._next:
+            return self._next - now, 0
+        if not self.skip_late or self.period <= 0:
+            return 0.0, 0
+        skipped = int((now - self._next) // self.period)
+        if skipped:
+            self._next += skipped * self.period
+            self.stats.dropped += skipped
+            if _DROPPED is not None:
+                _DROPPED.inc(skipped)
+        return 0.0, skipped
+
+    def wait(self) -> int:
+        """Sleep until the next frame deadline; returns frames to skip (0 if on time)."""
+        delay, skipped = self._advance()
+        if delay > 0:
+            self._sleep(delay)
+        return skipped
+
+    def _frame(self, frames: Generator[Any, int, Any], step: int | None) -> None:
+        frame_start = self._clock()
+        lateness = max(0.0, frame_start - self._next) if self.period > 0 else 0.0
+        if step is None:
+            next(frames)
+        else:
+            frames.send(step)
+        render = self._clock() - frame_start
+        self.stats.record(lateness, render)
+        if _FRAME is not None:
+            _FRAME.observe(render)
+            _LATENESS.observe(lateness)  # type: ignore[union-attr]
+
+    def run(self, frames: Generator[Any, int, Any]) -> FrameStats:
+        """Drive ``frames`` to completion, sending each the number of steps to advance."""
+        self.start()
+        step = None
+        try:
+            while True:
+                self._frame(frames, step)
+                step = 1 + self.wait()
+        except StopIteration:
+            pass
+        self.stats.elapsed = self._clock() - self._start
+        return self.stats
+
+    async def arun(
+        self,
+        frames: Generator[Any, int, Any],
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> FrameStats:
+        """Like ``run`` but awaits between frames; stops early once ``cancelled()`` is true."""
+        import asyncio  # only async callers pay for it
+
+        self.start()
+        step = None
+        try:
+            while True:
+                self._frame(frames, step)
+                delay, skipped = self._advance()
+                await asyncio.sleep(delay)  # always yield to the loop, even when late
+                if cancelled is not None and cancelled():
+                    frames.close()
+                    break
+                step = 1 + skipped
+        except StopIteration:
+            pass
+        self.stats.elapsed = self._clock() - self._start
+        return self.stats
@@ -0,0 +1,49 @@
+"""Pre-rendered text strips for scrolling.
+
+A message is rasterised once into an off-screen RGB bitmap as wide as the text;
+each scroll frame is then just a window of that strip copied to the canvas.
+"""
+from __future__ import annotations
+
+from .bdf import BDFFont
+
+Color = tuple[int, int, int]
+
+
+class Strip:
+    """Row-major RGB bitmap (``width * height * 3`` bytes) plus lit pixels per column."""
+
+    __slots__ = ("width", "height", "pixels", "columns")
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height * 3)
+        self.columns: list[list[int]] = [[] for _ in range(width)]
+
+    def set(self, x: int, y: int, color: Color) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = (y * self.width + x) * 3
+            self.pixels[i:i + 3] = bytes(color)
+            self.columns[x].append(y)
+
+    def row(self, y: int, x0: int, x1: int) -> memoryview:
+        """RGB bytes of row ``y`` between columns ``x0`` (incl.) and ``x1`` (excl.)."""
+        base = y * self.width * 3
+        return memoryview(self.pixels)[base + x0 * 3:base + x1 * 3]
+
+
+def render_strip(font: BDFFont, text: str, height: int, baseline: int, color: Color) -> Strip:
+    """Rasterise ``text`` with its baseline at row ``baseline``."""
+    strip = Strip(font.text_width(text), height)
+    pen = 0
+    for ch in text:
+        g = font.glyph(ch)
+        if g is None:
+            continue
+        left = pen + g.x_off
+        top = baseline - (g.y_off + g.height)
+        for gx, gy in g.pixels():
+            strip.set(left + gx, top + gy, color)
+        pen += g.advance
+    return strip
@@ -1,46 +1,165 @@
 from __future__ import annotations
 
-from .dictionary import is_valid, load_words
-from .scoring import score_guess
+from typing import TYPE_CHECKING, Callable
+
+from .dictionary import active_lexicon, load_lexicon, load_words, word_id
+from .metrics import timed
+from .scoring import feedback, feedback_string, score_guess
+from .session import GameState
+
+if TYPE_CHECKING:
+    from .patterns import PatternTable
+    from .solver import Hint, Solver
+
+MODES = ("count", "wordle")
+MAX_WORDLE_LENGTH = 10  # base-3 feedback must fit GameState's uint16 scores
 
 
 class Game:
     """Core game loop placeholder.
 
     Responsibilities (future):
-      - Manage target word selection
+      - Manage target word selection (defaults to the daily word, see ``daily``)
       - Track guesses & scoring
       - Interact with hardware board abstraction
+
+    Scoring modes:
+      count   number of letters in the correct position (``score_guess``)
+      wordle  per-letter green/yellow/grey feedback as a base-3 int (``feedback``),
+              read from the precomputed pattern table when one has been built
+
+    Word lists, pattern tables and the schedule are process-wide caches, so a
+    ``Game`` itself is small (``__slots__``) and many can share one process.
+    Its guesses live in a ``session.GameState`` (word ids of
+    ``active_lexicon()`` + packed scores), the same object a session journal
+    persists; ``guesses`` decodes them on demand.
+    Nothing is loaded up front: the lexicon on the first ``is_valid``, the
+    pattern table on the first wordle guess, the solver on the first hint.
+    ``on_guess(word, score)`` is called for every accepted guess (a
+    ``session.SessionJournal`` uses it to persist the game).
     """
 
-    def __init__(self, target: str | None = None) -> None:
-        load_words()  # warm cache
-        self.target = (target or "YODEL").upper()
-        self.guesses: list[tuple[str, int]] = []
+    __slots__ = ("state", "on_guess", "_patterns", "_target_col", "_solver")
+
+    def __init__(self, target: str | None = None, mode: str = "count", state: GameState | None = None) -> None:
+        if state is not None:
+            target, mode = state.target, state.mode
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}")
+        if target is None:
+            from .daily import daily_word
+
+            target = daily_word()
+        target = target.upper()
+        if mode == "wordle" and len(target) > MAX_WORDLE_LENGTH:
+            raise ValueError(f"wordle mode is limited to {MAX_WORDLE_LENGTH} letters")
+        self.state = state if state is not None else GameState(mode, target)
+        self.on_guess: Callable[[str, int], None] | None = None  # e.g. a session journal
+        self._patterns: PatternTable | None = None
+        self._target_col: int | None = None  # None until the pattern table is looked up
+        self._solver: Solver | None = None
+
+    @property
+    def target(self) -> str:
+        return self.state.target
+
+    @property
+    def mode(self) -> str:
+        return self.state.mode
 
+    @property
+    def guesses(self) -> list[tuple[str, int]]:
+        """Accepted guesses as (word, score), oldest first."""
+        word_at = active_lexicon().word_at
+        return [(word_at(i), s) for i, s in zip(self.state.ids, self.state.scores)]
+
+    @property
+    def solved(self) -> bool:
+        ids = self.state.ids
+        return bool(ids) and active_lexicon().word_at(ids[-1]) == self.target
+
+    def _pattern_table(self) -> PatternTable | None:
+        if self._target_col is None:
+            from .patterns import load_pattern_table
+
+            self._patterns = load_pattern_table(len(self.target))
+            self._target_col = self._patterns.row(self.target) if self._patterns is not None else -1
+        return self._patterns
+
+    def _feedback(self, g: str) -> int:
+        table = self._pattern_table()
+        if table is not None and self._target_col >= 0:
+            row = table.row(g)
+            if row >= 0:
+                return int(table.matrix[row, self._target_col])
+        return feedback(g, self.target)
+
+    @timed("apply_guess")
     def apply_guess(self, guess: str) -> tuple[bool, str | int]:
         g = guess.strip().upper()
-        if not is_valid(g):
+        if self.mode == "wordle" and len(g) != len(self.target):
+            return False, "LENGTH"
+        i = word_id(g)
+        if i < 0:
             return False, "INVALID"
-        score = score_guess(g, self.target)
-        self.guesses.append((g, score))
+        score = self._feedback(g) if self.mode == "wordle" else score_guess(g, self.target)
+        self.state.add(i, score)
+        if self.on_guess is not None:
+            self.on_guess(g, score)
+        if self._solver is not None:
+            self._solver.update(g, score)
         return True, score
 
+    def hint(self) -> Hint | None:
+        """Suggest the most informative next guess (wordle mode only).
+
+        The solver is created on first use and then narrowed incrementally by
+        every subsequent ``apply_guess``.
+        """
+        if self.mode != "wordle":
+            raise ValueError("hints need mode='wordle'")
+        if self._solver is None:
+            from .solver import Solver
+
+            table = self._pattern_table()
+            if table is not None:
+                self._solver = Solver(table)
+            else:
+                lex = load_lexicon()
+                words = lex if lex is not None else load_words()
+                self._solver = Solver([w for w in words if len(w) == len(self.target)])
+            for g, score in self.guesses:
+                self._solver.update(g, score)
+        return self._solver.suggest()
+
+    def handle(self, raw: str) -> tuple[str, bool]:
+        """Process one line of input; returns (reply text, game over)."""
+        raw = raw.strip()
+        if not raw:
+            return "Bye.", True
+        if raw == "?" and self.mode == "wordle":
+            h = self.hint()
+            return (f"Hint: {h.word} ({h.bits:.2f} bits, {h.remaining} left)" if h else "No candidates left"), False
+        ok, result = self.apply_guess(raw)
+        if not ok:
+            return (f"Guess must be {len(self.target)} letters" if result == "LENGTH" else "Invalid word"), False
+        if self.mode == "wordle":
+            reply = f"Feedback: {feedback_string(int(result), len(self.target))}"
+        else:
+            reply = f"Score: {result}"
+        if raw.upper() == self.target:
+            return reply + "\nYou win!", True
+        return reply, False
+
     def start(self) -> None:
         print("Starting game (demo mode). Type guesses or blank to quit.")
+        if self.mode == "wordle":
+            print("Type ? for a hint.")
         try:
             while True:
-                raw = input("> ").strip()
-                if not raw:
-                    print("Bye.")
+                reply, done = self.handle(input("> "))
+                print(reply)
+                if done:
                     break
-                ok, result = self.apply_guess(raw)
-                if ok:
-                    print(f"Score: {result}")
-                    if raw.upper() == self.target:
-                        print("You win!")
-                        break
-                else:
-                    print("Invalid word")
         except KeyboardInterrupt:
             print("\nInterrupted.")
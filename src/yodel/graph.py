@@ -0,0 +1,272 @@
+"""Pre-indexed WordNet synset/pointer graph (CSR arrays, memory-mapped).
+
+Built once from the raw ``data.*`` files (see ``build_graph``) into a single
+binary file. Synsets get dense integer ids ordered by (POS file, offset); each
+pointer symbol (``+``, ``@``, ``~``, ``#m``, ...) gets its own CSR adjacency
+(``indptr``/``indices`` uint32 arrays) and lemmas get a sorted string table
+with synset<->lemma CSR indexes in both directions.
+
+File layout: magic b"YGRF", u32 version, u32 JSON length, JSON table of
+contents, then 4-byte aligned sections. Sections are only cast to
+``memoryview`` arrays on first access, so opening the graph is cheap.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+import json
+import mmap
+import re
+import struct
+
+from . import wordnet
+
+MAGIC = b"YGRF"
+VERSION = 1
+_PREFIX = struct.Struct("<4sII")
+_FILE_POS = {"n": "n", "v": "v", "a": "a", "s": "a", "r": "r"}  # satellites live in data.adj
+_POS_ORDER = ("n", "v", "a", "r")
+
+DEFAULT_GRAPH_PATH = Path("data/processed/wordnet.graph")
+TOKEN_RE = re.compile(r"^[a-z][a-z_\-]*$")
+
+
+def _lemma_key(lemma: str) -> str:
+    # adjective markers: quick(a), galore(ip)
+    base = lemma.split("(", 1)[0]
+    return base.lower()
+
+
+def pick_rep(lemmas: Sequence[str]) -> str | None:
+    """Pick a single display lemma per synset (simple heuristics)."""
+    def score(w):
+        brit = ("isation" in w) or w.endswith("ise")
+        has_us = ("ization" in w) or w.endswith("ize")
+        return (
+            w.count("_"),
+            1 if brit else 0,
+            0 if has_us else 1,
+            len(w),
+            w.lower()
+        )
+    return sorted(lemmas, key=score)[0] if lemmas else None
+
+
+def _csr(rows: Sequence[Iterable[int]]) -> tuple[array, array]:
+    indptr = array("I", [0])
+    indices = array("I")
+    for row in rows:
+        indices.extend(row)
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+def _csr_from_edges(pairs: Sequence[tuple[int, int]], n: int) -> tuple[array, array]:
+    """CSR arrays from (src, dst) pairs already sorted by src."""
+    indptr = array("I", bytes(4 * (n + 1)))
+    for src, _dst in pairs:
+        indptr[src + 1] += 1
+    for i in range(n):
+        indptr[i + 1] += indptr[i]
+    return indptr, array("I", (dst for _src, dst in pairs))
+
+
+def build_graph(base: Path, out_path: str | Path = DEFAULT_GRAPH_PATH, workers: int | None = None) -> Path:
+    """Parse the WordNet data files under ``base`` and write the graph store."""
+    parsed = wordnet.parse_all(base, "data", workers=workers)
+    synsets: list[wordnet.Synset] = []
+    pos_ranges: dict[str, list[int]] = {}
+    for name, letter in zip(wordnet.POS_NAMES, _POS_ORDER):
+        recs = sorted(parsed.get(name, []), key=lambda s: s.offset)
+        pos_ranges[letter] = [len(synsets), len(synsets) + len(recs)]
+        synsets.extend(recs)
+    ids = {(_FILE_POS.get(s.pos, s.pos), s.offset): i for i, s in enumerate(synsets)}
+
+    lemma_names = sorted({lem.split("(", 1)[0] for s in synsets for lem in s.lemmas}, key=lambda w: (_lemma_key(w), w))
+    lemma_ids = {w: i for i, w in enumerate(lemma_names)}
+    syn_lemmas = [[lemma_ids[lem.split("(", 1)[0]] for lem in s.lemmas] for s in synsets]
+    lemma_syns: list[list[int]] = [[] for _ in lemma_names]
+    for sid, lids in enumerate(syn_lemmas):
+        for lid in lids:
+            if not lemma_syns[lid] or lemma_syns[lid][-1] != sid:
+                lemma_syns[lid].append(sid)
+
+    edges: dict[str, set[tuple[int, int]]] = defaultdict(set)
+    for sid, s in enumerate(synsets):
+        for ptr in s.pointers:
+            tgt = ids.get((_FILE_POS.get(ptr.pos, ptr.pos), ptr.offset))
+            if tgt is not None:
+                edges[ptr.symbol].add((sid, tgt))
+
+    blob = bytearray()
+    lemma_off = array("I", [0])
+    for w in lemma_names:
+        blob += w.encode("utf-8")
+        lemma_off.append(len(blob))
+
+    sections: dict[str, tuple[str, bytes]] = {
+        "offsets": ("I", array("I", (s.offset for s in synsets)).tobytes()),
+        "pos": ("B", bytes(ord(s.pos[0]) for s in synsets)),
+        "lemma_blob": ("B", bytes(blob)),
+        "lemma_off": ("I", lemma_off.tobytes()),
+    }
+    for name, rows in (("syn_lemmas", syn_lemmas), ("lemma_syns", lemma_syns)):
+        indptr, indices = _csr(rows)
+        sections[f"{name}.indptr"] = ("I", indptr.tobytes())
+        sections[f"{name}.indices"] = ("I", indices.tobytes())
+    symbols = sorted(edges)
+    for sym in symbols:
+        indptr, indices = _csr_from_edges(sorted(edges[sym]), len(synsets))
+        sections[f"ptr:{sym}.indptr"] = ("I", indptr.tobytes())
+        sections[f"ptr:{sym}.indices"] = ("I", indices.tobytes())
+
+    toc: dict[str, list] = {}
+    pos = 0
+    for name, (code, data) in sections.items():
+        toc[name] = [pos, len(data), code]
+        pos += (len(data) + 3) & ~3
+    meta = json.dumps({
+        "synsets": len(synsets),
+        "lemmas": len(lemma_names),
+        "pos_ranges": pos_ranges,
+        "symbols": symbols,
+        "sections": toc,
+    }).encode("utf-8")
+    header_len = (_PREFIX.size + len(meta) + 3) & ~3
+
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    with tmp.open("wb") as fh:
+        fh.write(_PREFIX.pack(MAGIC, VERSION, len(meta)))
+        fh.write(meta.ljust(header_len - _PREFIX.size, b" "))
+        for _name, (_code, data) in sections.items():
+            fh.write(data)
+            fh.write(b"\0" * (-len(data) % 4))
+    tmp.replace(out)
+    return out
+
+
+class WordNetGraph:
+    """Read-only, lazily mapped view over a graph file written by ``build_graph``."""
+
+    def __init__(self, path: str | Path = DEFAULT_GRAPH_PATH) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, meta_len = _PREFIX.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path}: not a v{VERSION} graph file")
+        meta = json.loads(self._mm[_PREFIX.size:_PREFIX.size + meta_len])
+        self._data_start = (_PREFIX.size + meta_len + 3) & ~3
+        self._toc: dict[str, list] = meta["sections"]
+        self._views: dict[str, memoryview] = {}
+        self.synset_count: int = meta["synsets"]
+        self.lemma_count: int = meta["lemmas"]
+        self.symbols: tuple[str, ...] = tuple(meta["symbols"])
+        self.pos_ranges: dict[str, tuple[int, int]] = {k: tuple(v) for k, v in meta["pos_ranges"].items()}
+
+    def _section(self, name: str) -> memoryview:
+        view = self._views.get(name)
+        if view is None:
+            off, length, code = self._toc[name]
+            start = self._data_start + off
+            view = memoryview(self._mm)[start:start + length].cast(code)
+            self._views[name] = view
+        return view
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self.synset_count
+
+    # --- synsets -----------------------------------------------------------------
+    def offset(self, sid: int) -> int:
+        return self._section("offsets")[sid]
+
+    def pos(self, sid: int) -> str:
+        return chr(self._section("pos")[sid])
+
+    def synset_id(self, pos: str, offset: int) -> int:
+        """Dense id for (pos, data-file offset) or -1."""
+        lo, hi = self.pos_ranges.get(_FILE_POS.get(pos, pos), (0, 0))
+        offsets = self._section("offsets")
+        i = bisect_left(offsets, offset, lo, hi)
+        return i if i < hi and offsets[i] == offset else -1
+
+    def _row(self, name: str, i: int) -> memoryview:
+        indptr = self._section(f"{name}.indptr")
+        return self._section(f"{name}.indices")[indptr[i]:indptr[i + 1]]
+
+    def neighbors(self, sid: int, symbol: str) -> memoryview:
+        """Target synset ids of ``symbol`` pointers leaving ``sid`` (zero-copy)."""
+        if symbol not in self.symbols:
+            return memoryview(array("I"))
+        return self._row(f"ptr:{symbol}", sid)
+
+    def edges(self, symbol: str) -> Iterator[tuple[int, int]]:
+        if symbol not in self.symbols:
+            return
+        indptr = self._section(f"ptr:{symbol}.indptr")
+        indices = self._section(f"ptr:{symbol}.indices")
+        for sid in range(self.synset_count):
+            for j in range(indptr[sid], indptr[sid + 1]):
+                yield sid, indices[j]
+
+    # --- lemmas ------------------------------------------------------------------
+    def lemma(self, lid: int) -> str:
+        off = self._section("lemma_off")
+        return bytes(self._section("lemma_blob")[off[lid]:off[lid + 1]]).decode("utf-8")
+
+    def lemmas(self, sid: int) -> list[str]:
+        return [self.lemma(lid) for lid in self._row("syn_lemmas", sid)]
+
+    def lemma_ids(self, word: str) -> range:
+        """Ids of lemmas matching ``word`` case-insensitively (spaces == underscores)."""
+        key = _lemma_key(word.strip().replace(" ", "_"))
+        lo, hi = 0, self.lemma_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _lemma_key(self.lemma(mid)) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        end = lo
+        while end < self.lemma_count and _lemma_key(self.lemma(end)) == key:
+            end += 1
+        return range(lo, end)
+
+    def synsets_for(self, word: str, pos: str | None = None) -> list[int]:
+        out: list[int] = []
+        for lid in self.lemma_ids(word):
+            out.extend(self._row("lemma_syns", lid))
+        if pos is not None:
+            lo, hi = self.pos_ranges.get(_FILE_POS.get(pos, pos), (0, 0))
+            out = [sid for sid in out if lo <= sid < hi]
+        return sorted(set(out))
+
+    # --- queries -----------------------------------------------------------------
+    def verb_to_nouns_filtered(self, min_nouns: int = 3) -> dict[str, list[str]]:
+        """Verbs with >= ``min_nouns`` derivationally related ('+') noun lemmas."""
+        v_lo, v_hi = self.pos_ranges["v"]
+        n_lo, n_hi = self.pos_ranges["n"]
+        mapping: dict[str, set[str]] = defaultdict(set)
+        for sid in range(v_lo, v_hi):
+            targets = [t for t in self.neighbors(sid, "+") if n_lo <= t < n_hi]
+            if not targets:
+                continue
+            v = pick_rep(self.lemmas(sid))
+            if not v or not TOKEN_RE.match(v):
+                continue
+            for tgt in targets:
+                n = pick_rep(self.lemmas(tgt))
+                if n and TOKEN_RE.match(n):
+                    mapping[v.replace("_", " ")].add(n.replace("_", " "))
+        return {v: sorted(ns) for v, ns in mapping.items() if len(ns) >= min_nouns}
@@ -2,6 +2,7 @@
 
 Modules:
     board_interface: Protocol / abstract interface for boards.
+    framebuffer: Contiguous RGB framebuffer (bulk fill/rect/blit, ASCII/PPM output).
     mock_board: In-memory/console mock for local dev.
     phyllis_board: Adapter reusing phyllis_bot hardware code (stub initially).
 """
@@ -5,6 +5,11 @@ from typing import Protocol, Tuple
 Color = Tuple[int, int, int]
 
 
+def rgb_view(buffer) -> memoryview:
+    """Flat byte view of a row-major RGB frame (bytes, bytearray, memoryview, array, ndarray or FrameBuffer)."""
+    return memoryview(getattr(buffer, "data", buffer)).cast("B")
+
+
 class BoardInterface(Protocol):
     width: int
     height: int
@@ -13,3 +18,33 @@ class BoardInterface(Protocol):
     def draw_pixel(self, x: int, y: int, color: Color) -> None: ...
     def draw_text(self, x: int, y: int, text: str, color: Color) -> None: ...
     def show(self) -> None: ...
+
+    def poll_input(self) -> str | None:
+        """Next completed input line from the board's buttons, or None (non-blocking)."""
+        return None
+
+    # Bulk operations. These defaults are the slow per-pixel fallback; boards
+    # with a real framebuffer override them with slice copies.
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: Color) -> None:
+        for py in range(max(0, y), min(self.height, y + h)):
+            for px in range(max(0, x), min(self.width, x + w)):
+                self.draw_pixel(px, py, color)
+
+    def blit(self, buffer, x: int = 0, y: int = 0, width: int | None = None) -> None:
+        """Copy RGB ``buffer`` (rows of ``width`` pixels, default the board width) with its top-left at (x, y)."""
+        src = rgb_view(buffer)
+        width = getattr(buffer, "width", self.width) if width is None else width
+        stride = width * 3
+        for sy in range(len(src) // stride if stride else 0):
+            py = y + sy
+            if not 0 <= py < self.height:
+                continue
+            for sx in range(max(0, -x), min(width, self.width - x)):
+                i = sy * stride + sx * 3
+                self.draw_pixel(x + sx, py, (src[i], src[i + 1], src[i + 2]))
+
+    def set_frame(self, buffer) -> None:
+        """Replace the whole frame with ``width * height * 3`` RGB bytes."""
+        if len(rgb_view(buffer)) != self.width * self.height * 3:
+            raise ValueError(f"frame must be {self.width}x{self.height} RGB")
+        self.blit(buffer, 0, 0, self.width)
@@ -0,0 +1,192 @@
+"""Contiguous RGB framebuffer shared by the mock board and headless rendering.
+
+Pixels live in one ``bytearray`` laid out as ``height x width x 3`` uint8
+(row-major RGB), so bulk operations are slice assignments and output is built
+from whole-buffer byte operations rather than per-pixel Python loops. With
+NumPy installed ``array()`` exposes the same memory as an ``(h, w, 3)`` view.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+from .board_interface import Color, rgb_view
+
+_ASCII_OFF, _ASCII_ON = b".", b"#"
+_ASCII_TABLE = _ASCII_OFF + _ASCII_ON * 255
+
+
+class Rect(NamedTuple):
+    x: int
+    y: int
+    w: int
+    h: int
+
+
+class FrameBuffer:
+    __slots__ = ("width", "height", "data", "_zero")
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.data = bytearray(width * height * 3)
+        self._zero = bytes(len(self.data))
+
+    @property
+    def stride(self) -> int:
+        return self.width * 3
+
+    def array(self):
+        """``(height, width, 3)`` uint8 ndarray sharing this buffer (needs NumPy)."""
+        from ..scoring import numpy_module  # NumPy is imported on first use only
+
+        np = numpy_module()
+        if np is None:
+            raise RuntimeError("numpy is not installed")
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(self.height, self.width, 3)
+
+    # --- drawing -----------------------------------------------------------------
+    def clear(self) -> None:
+        self.data[:] = self._zero
+
+    def fill(self, color: Color) -> None:
+        self.data[:] = bytes(color) * (self.width * self.height)
+
+    def set_pixel(self, x: int, y: int, color: Color) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = (y * self.width + x) * 3
+            self.data[i:i + 3] = bytes(color)
+
+    def get_pixel(self, x: int, y: int) -> Color:
+        i = (y * self.width + x) * 3
+        return self.data[i], self.data[i + 1], self.data[i + 2]
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: Color) -> None:
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + w), min(self.height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        span = bytes(color) * (x1 - x0)
+        stride = self.stride
+        for row in range(y0, y1):
+            start = row * stride + x0 * 3
+            self.data[start:start + len(span)] = span
+
+    def load(self, src) -> None:
+        """Replace the whole frame with ``width * height * 3`` RGB bytes (one copy)."""
+        src_mv = rgb_view(src)
+        if len(src_mv) != len(self.data):
+            raise ValueError(f"frame must be {self.width}x{self.height} RGB")
+        self.data[:] = src_mv
+
+    def blit(self, src, x: int, y: int, src_width: int) -> None:
+        """Copy an RGB buffer ``src`` (rows of ``src_width`` pixels) with its top-left at (x, y)."""
+        src_mv = rgb_view(src)
+        src_stride = src_width * 3
+        src_height = len(src_mv) // src_stride if src_stride else 0
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + src_width), min(self.height, y + src_height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        n = (x1 - x0) * 3
+        sx = (x0 - x) * 3
+        stride = self.stride
+        for row in range(y0, y1):
+            s = (row - y) * src_stride + sx
+            d = row * stride + x0 * 3
+            self.data[d:d + n] = src_mv[s:s + n]
+
+    # --- output ------------------------------------------------------------------
+    def lit_mask(self) -> bytes:
+        """One byte per pixel: nonzero where any channel is lit."""
+        n = self.width * self.height
+        if not n:
+            return b""
+        d = self.data
+        bits = int.from_bytes(d[0::3], "big") | int.from_bytes(d[1::3], "big") | int.from_bytes(d[2::3], "big")
+        return bits.to_bytes(n, "big")
+
+    def to_ascii(self) -> str:
+        mask = self.lit_mask().translate(_ASCII_TABLE)
+        w = self.width
+        return b"\n".join(mask[i:i + w] for i in range(0, len(mask), w)).decode("ascii")
+
+    def to_ppm(self) -> bytes:
+        return b"P6\n%d %d\n255\n" % (self.width, self.height) + bytes(self.data)
+
+    def write_ppm(self, target: str | Path | BinaryIO) -> None:
+        """Write one binary PPM frame to a path or an open binary stream (frames may be concatenated)."""
+        if isinstance(target, (str, Path)):
+            Path(target).write_bytes(self.to_ppm())
+        else:
+            target.write(self.to_ppm())
+
+
+def dirty_rects(current: FrameBuffer, previous) -> list[Rect]:
+    """Bounding boxes of pixels that differ between ``current`` and ``previous`` RGB bytes.
+
+    Rows are compared as whole byte slices; the changed span inside a row comes
+    from the XOR of the two rows as big ints (first / last set bit), so there is
+    no per-pixel Python loop. Adjacent dirty rows are merged into one band.
+    """
+    cur, prev = current.data, previous
+    stride = current.stride
+    rects: list[Rect] = []
+    band: list[int] | None = None  # [y0, y1, x0, x1)
+    for y in range(current.height):
+        base = y * stride
+        a, b = cur[base:base + stride], prev[base:base + stride]
+        if a == b:
+            if band is not None:
+                rects.append(Rect(band[2], band[0], band[3] - band[2], band[1] - band[0]))
+                band = None
+            continue
+        diff = int.from_bytes(a, "big") ^ int.from_bytes(b, "big")
+        first = stride - (diff.bit_length() + 7) // 8
+        last = stride - 1 - ((diff & -diff).bit_length() - 1) // 8
+        x0, x1 = first // 3, last // 3 + 1
+        if band is None:
+            band = [y, y + 1, x0, x1]
+        else:
+            band[1] = y + 1
+            band[2] = min(band[2], x0)
+            band[3] = max(band[3], x1)
+    if band is not None:
+        rects.append(Rect(band[2], band[0], band[3] - band[2], band[1] - band[0]))
+    return rects
+
+
+@dataclass
+class PushStats:
+    """Per-board counters for frame-diffed pushes to the panel."""
+
+    frames: int = 0
+    skipped: int = 0
+    rects: int = 0
+    pixels_pushed: int = 0
+    last_pixels: int = 0
+    frame_pixels: int = 0
+
+    def record(self, rects: list[Rect]) -> None:
+        self.frames += 1
+        self.rects += len(rects)
+        self.last_pixels = sum(r.w * r.h for r in rects)
+        self.pixels_pushed += self.last_pixels
+        if not rects:
+            self.skipped += 1
+
+    @property
+    def pixels_per_frame(self) -> float:
+        return self.pixels_pushed / self.frames if self.frames else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        full = self.frames * self.frame_pixels
+        return {
+            "frames": self.frames,
+            "skipped": self.skipped,
+            "rects": self.rects,
+            "pixels_pushed": self.pixels_pushed,
+            "pixels_per_frame": round(self.pixels_per_frame, 1),
+            "pushed_ratio": round(self.pixels_pushed / full, 4) if full else 0.0,
+        }
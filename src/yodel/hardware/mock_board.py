@@ -1,29 +1,86 @@
 from __future__ import annotations
 
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO
+
 from .board_interface import BoardInterface, Color
+from .framebuffer import FrameBuffer, PushStats, dirty_rects
+
 
 class MockBoard(BoardInterface):
-    def __init__(self, width: int = 32, height: int = 8) -> None:
+    """Headless board backed by a contiguous ``FrameBuffer``.
+
+    ``echo`` prints an ASCII frame on every ``show()`` that changed the picture; ``ppm_stream`` (a path
+    or binary file) receives every shown frame as concatenated binary PPM.
+    Turn ``echo`` off to run animations in CI faster than real time.
+    ``push_stats`` counts the pixels a frame-diffing board would push.
+    ``press(line)`` simulates button input, returned later by ``poll_input``.
+    """
+
+    def __init__(
+        self,
+        width: int = 32,
+        height: int = 8,
+        echo: bool = True,
+        ppm_stream: str | Path | BinaryIO | None = None,
+    ) -> None:
         self.width = width
         self.height = height
-        self._buffer = [[(0,0,0) for _ in range(width)] for _ in range(height)]
+        self.echo = echo
+        self.frames_shown = 0
+        self._buffer = FrameBuffer(width, height)
+        self._input: deque[str] = deque()
+        self._shown = bytearray(len(self._buffer.data))
+        self.push_stats = PushStats(frame_pixels=width * height)
+        self._ppm_owned = isinstance(ppm_stream, (str, Path))
+        self._ppm: BinaryIO | None = open(ppm_stream, "wb") if self._ppm_owned else ppm_stream  # type: ignore[arg-type]
+
+    @property
+    def framebuffer(self) -> FrameBuffer:
+        return self._buffer
 
     def clear(self) -> None:
-        for y in range(self.height):
-            for x in range(self.width):
-                self._buffer[y][x] = (0,0,0)
+        self._buffer.clear()
+
+    def fill(self, color: Color) -> None:
+        self._buffer.fill(color)
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: Color) -> None:
+        self._buffer.fill_rect(x, y, w, h, color)
+
+    def blit(self, buffer, x: int = 0, y: int = 0, width: int | None = None) -> None:
+        self._buffer.blit(buffer, x, y, getattr(buffer, "width", self.width) if width is None else width)
+
+    def set_frame(self, buffer) -> None:
+        self._buffer.load(buffer)
 
     def draw_pixel(self, x: int, y: int, color: Color) -> None:
-        if 0 <= x < self.width and 0 <= y < self.height:
-            self._buffer[y][x] = color
+        self._buffer.set_pixel(x, y, color)
+
+    def press(self, line: str) -> None:
+        self._input.append(line)
+
+    def poll_input(self) -> str | None:
+        return self._input.popleft() if self._input else None
 
     def draw_text(self, x: int, y: int, text: str, color: Color) -> None:
         # Placeholder: just print text positionally
         print(f"[MOCK TEXT] ({x},{y}) {text} {color}")
 
     def show(self) -> None:
-        # Simple ASCII visualization
-        rows = []
-        for row in self._buffer:
-            rows.append(''.join('#' if px != (0,0,0) else '.' for px in row))
-        print('\n'.join(rows))
+        self.frames_shown += 1
+        rects = dirty_rects(self._buffer, self._shown)
+        self.push_stats.record(rects)
+        if rects:
+            self._shown[:] = self._buffer.data
+        if self._ppm is not None:
+            self._buffer.write_ppm(self._ppm)
+        if self.echo and (rects or self.frames_shown == 1):
+            # Simple ASCII visualization
+            print(self._buffer.to_ascii())
+
+    def close(self) -> None:
+        if self._ppm is not None and self._ppm_owned:
+            self._ppm.close()
+        self._ppm = None
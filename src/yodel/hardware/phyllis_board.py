@@ -1,33 +1,119 @@
-from __future__ import annotations
-
 """Adapter to reuse phyllis_bot hardware driver.
 
+Drawing goes to a contiguous ``FrameBuffer`` back buffer. ``show()`` diffs it
+against what the back canvas already holds and pushes only the dirty
+rectangles (``SetImage`` crops with PIL, else ``SetPixel``); when the frame
+matches what is on the panel the push and vsync swap are skipped entirely.
+rgbmatrix double-buffers, so a shadow copy is kept per canvas. Without ``rgbmatrix`` the board runs headless
+and ``show()`` only updates the counters in ``push_stats``.
+
 Implementation TODO:
 - Import underlying matrix driver module from phyllis_bot (path / packaging TBD).
-- Provide same interface as BoardInterface.
 """
+from __future__ import annotations
+
+import importlib
+import time
 
 from .board_interface import BoardInterface, Color
+from .framebuffer import FrameBuffer, PushStats, Rect, dirty_rects
+from .. import metrics
+
+_SWAP = metrics.histogram("swap_vsync")
+
 
 class PhyllisBoard(BoardInterface):
-    def __init__(self) -> None:
-        # TODO: initialize underlying matrix from reused code
-        self.width = 64
-        self.height = 16
-        self._driver = None  # placeholder
-
-    def clear(self) -> None:  # pragma: no cover
-        # TODO: delegate to driver
-        pass
+    def __init__(self, width: int = 64, height: int = 16, rotate_180: bool = True) -> None:
+        self.width = width
+        self.height = height
+        self._buffer = FrameBuffer(width, height)
+        self._driver = None
+        self._canvas = None
+        self._image = None  # PIL.Image module, if available
+        # What each of the two swapped canvases currently shows.
+        self._shadows = [bytearray(len(self._buffer.data)), bytearray(len(self._buffer.data))]
+        self._back = 0
+        self.push_stats = PushStats(frame_pixels=width * height)
+        self._load_driver(rotate_180)
 
-    def draw_pixel(self, x: int, y: int, color: Color) -> None:  # pragma: no cover
-        # TODO: set pixel via driver
-        pass
+    def _load_driver(self, rotate_180: bool) -> None:
+        try:
+            rgbmatrix = importlib.import_module("rgbmatrix")
+        except ImportError:
+            return  # headless: keep the back buffer only
+        options = rgbmatrix.RGBMatrixOptions()
+        options.rows = self.height
+        options.cols = self.width
+        if rotate_180:
+            options.pixel_mapper_config = "Rotate:180"
+        self._driver = rgbmatrix.RGBMatrix(options=options)
+        self._canvas = self._driver.CreateFrameCanvas()
+        try:
+            self._image = importlib.import_module("PIL.Image")
+        except ImportError:
+            self._image = None
+
+    def available(self) -> bool:
+        return self._driver is not None
+
+    @property
+    def framebuffer(self) -> FrameBuffer:
+        return self._buffer
+
+    def clear(self) -> None:
+        self._buffer.clear()
+
+    def fill(self, color: Color) -> None:
+        self._buffer.fill(color)
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: Color) -> None:
+        self._buffer.fill_rect(x, y, w, h, color)
+
+    def blit(self, buffer, x: int = 0, y: int = 0, width: int | None = None) -> None:
+        self._buffer.blit(buffer, x, y, getattr(buffer, "width", self.width) if width is None else width)
+
+    def set_frame(self, buffer) -> None:
+        self._buffer.load(buffer)
+
+    def draw_pixel(self, x: int, y: int, color: Color) -> None:
+        self._buffer.set_pixel(x, y, color)
 
     def draw_text(self, x: int, y: int, text: str, color: Color) -> None:  # pragma: no cover
         # TODO: render text using existing font routines
         pass
 
-    def show(self) -> None:  # pragma: no cover
-        # TODO: flush / swap buffer
-        pass
+    def _push(self, canvas, rects: list[Rect]) -> None:
+        fb = self._buffer
+        if self._image is not None:
+            image = self._image.frombuffer("RGB", (fb.width, fb.height), fb.data, "raw", "RGB", 0, 1)
+            for r in rects:
+                region = image if r.w == fb.width and r.h == fb.height else image.crop((r.x, r.y, r.x + r.w, r.y + r.h))
+                canvas.SetImage(region, r.x, r.y)
+            return
+        # Slow fallback: one driver call per pixel in each dirty rectangle.
+        data, stride = fb.data, fb.stride
+        set_pixel = canvas.SetPixel
+        for r in rects:
+            for y in range(r.y, r.y + r.h):
+                for x in range(r.x, r.x + r.w):
+                    i = y * stride + x * 3
+                    set_pixel(x, y, data[i], data[i + 1], data[i + 2])
+
+    def show(self) -> None:
+        if self._buffer.data == self._shadows[self._back ^ 1]:
+            self.push_stats.record([])
+            return  # panel already shows this frame: no push, no swap
+        shadow = self._shadows[self._back]
+        rects = dirty_rects(self._buffer, shadow)
+        self.push_stats.record(rects)
+        shadow[:] = self._buffer.data
+        self._back ^= 1
+        if self._driver is None:
+            return
+        self._push(self._canvas, rects)
+        if _SWAP is None:
+            self._canvas = self._driver.SwapOnVSync(self._canvas)
+        else:
+            t0 = time.perf_counter()
+            self._canvas = self._driver.SwapOnVSync(self._canvas)
+            _SWAP.observe(time.perf_counter() - t0)
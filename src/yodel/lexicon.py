@@ -0,0 +1,179 @@
+"""Compiled binary lexicon (``.lex``) with memory-mapped lookup.
+
+Layout (little endian):
+
+    header  48 bytes  magic b"YLEX", version u16, width u16, count u32,
+                      sha256 of the record block (32 bytes), 4 reserved bytes
+    records count * width bytes, upper-case ASCII words sorted ascending and
+                      NUL padded to ``width``
+
+Lookups binary-search the mapped record block directly, so no per-word Python
+objects are kept resident. A word's position in the record block is its stable
+word id for this lexicon.
+"""
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+import hashlib
+import mmap
+import struct
+
+MAGIC = b"YLEX"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHI32s4x")
+HEADER_SIZE = _HEADER.size
+
+
+class LexiconError(ValueError):
+    pass
+
+
+def _pack(words: Iterable[str]) -> bytes:
+    encoded = sorted({w.strip().upper().encode("ascii") for w in words if w.strip() and w.strip().isascii()})
+    width = max((len(w) for w in encoded), default=1)
+    body = b"".join(w.ljust(width, b"\0") for w in encoded)
+    return _HEADER.pack(MAGIC, VERSION, width, len(encoded), hashlib.sha256(body).digest()) + body
+
+
+def compile_lexicon(words: Iterable[str], path: str | Path) -> Path:
+    """Write ``words`` (deduplicated, upper-cased) as a compiled lexicon file."""
+    data = _pack(words)
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(out)
+    return out
+
+
+class Lexicon:
+    """Read-only view over a compiled lexicon file."""
+
+    def __init__(self, path: str | Path, verify: bool = False, *, data: bytes | None = None) -> None:
+        self.path = Path(path)
+        if data is not None:
+            self._mm: mmap.mmap | bytes = data
+        else:
+            with self.path.open("rb") as fh:
+                try:
+                    self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # mmap refuses empty files
+                    raise LexiconError(f"{self.path}: truncated header") from None
+        if len(self._mm) < HEADER_SIZE:
+            raise LexiconError(f"{self.path}: truncated header")
+        magic, version, width, count, checksum = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise LexiconError(f"{self.path}: not a v{VERSION} lexicon file")
+        if len(self._mm) != HEADER_SIZE + width * count:
+            raise LexiconError(f"{self.path}: size does not match header")
+        self.width: int = width
+        self.count: int = count
+        self.checksum: bytes = checksum
+        if verify and not self.verify():
+            raise LexiconError(f"{self.path}: checksum mismatch")
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "Lexicon":
+        """In-memory lexicon (same layout, no file) for text-list fallbacks."""
+        return cls("<memory>", data=_pack(words))
+
+    @property
+    def digest(self) -> str:
+        """Hex sha256 of the record block; identifies this word list."""
+        return self.checksum.hex()
+
+    def verify(self) -> bool:
+        return hashlib.sha256(memoryview(self._mm)[HEADER_SIZE:]).digest() == self.checksum
+
+    def close(self) -> None:
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _record(self, i: int) -> bytes:
+        off = HEADER_SIZE + i * self.width
+        return self._mm[off:off + self.width]
+
+    def _key(self, word: str) -> bytes | None:
+        w = word.upper()
+        if not w.isascii() or not w or len(w) > self.width:
+            return None
+        return w.encode("ascii").ljust(self.width, b"\0")
+
+    def _bisect(self, key: bytes) -> int:
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._record(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def prefix_range(self, prefix: str) -> range:
+        """Word ids (contiguous, sorted) of the words starting with ``prefix``."""
+        p = prefix.upper()
+        if not p:
+            return range(self.count)
+        if not p.isascii() or len(p) > self.width:
+            return range(0)
+        key = p.encode("ascii")
+        n = len(key)
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._record(mid)[:n] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        start, hi = lo, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._record(mid)[:n] <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return range(start, lo)
+
+    def index_of(self, word: str) -> int:
+        """Return the word id of ``word`` or -1 when absent."""
+        key = self._key(word)
+        if key is None:
+            return -1
+        i = self._bisect(key)
+        if i < self.count and self._record(i) == key:
+            return i
+        return -1
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.index_of(word) >= 0
+
+    def word_at(self, i: int) -> str:
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return self._record(i).rstrip(b"\0").decode("ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.count):
+            yield self.word_at(i)
+
+    def ids_of_length(self, length: int) -> array:
+        """Ascending ids of the ``length``-letter words, from two strided byte slices (no index)."""
+        w = self.width
+        if not 0 < length <= w:
+            return array("I")
+        last = self._mm[HEADER_SIZE + length - 1::w]  # non-NUL: at least ``length`` letters
+        if length == w:
+            return array("I", (i for i, c in enumerate(last) if c))
+        pad = self._mm[HEADER_SIZE + length::w]  # NUL: at most ``length`` letters
+        return array("I", (i for i, (c, p) in enumerate(zip(last, pad)) if c and not p))
+
+    def words(self) -> list[str]:
+        """Every word in id order, decoded in one pass over the record block."""
+        w = self.width
+        text = bytes(self._mm[HEADER_SIZE:HEADER_SIZE + self.count * w]).decode("ascii")
+        return [text[i:i + w].rstrip("\0") for i in range(0, len(text), w)]
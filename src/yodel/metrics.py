@@ -0,0 +1,234 @@
+"""Hot-path timers, counters and histograms.
+
+Off by default. Set ``YODEL_METRICS=1`` (or call ``enable()``) before the
+instrumented modules are imported: with metrics off, ``timed`` returns the
+function unchanged and the inline probes are ``None`` checks on values bound
+at import time, so a disabled build pays (almost) nothing on the hot paths.
+
+    load_words      cold word-list loads (not in-process cache hits)
+    apply_guess     guess latency, validation + scoring
+    score_guess     count-mode scoring
+    feedback        wordle-mode scoring
+    font_load       BDF / rgbmatrix font loads
+    frame_render    canvas clear + draw per scroll frame
+    swap_vsync      SwapOnVSync per frame (matrix display and PhyllisBoard)
+    frame_time      whole frame as seen by the frame scheduler
+    frame_lateness  frame start vs. its scheduled deadline
+    frames_dropped  (counter) frames skipped by the scheduler
+
+All histograms are in seconds with fixed log-spaced buckets, so snapshots
+from different processes merge and map directly onto Prometheus histograms.
+``YODEL_METRICS_FILE`` (with ``enable()``) dumps a snapshot every
+``YODEL_METRICS_INTERVAL`` seconds (default 10) and at exit: Prometheus
+text exposition format when the file ends in ``.prom``, JSON otherwise.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+import os
+import time
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+PREFIX = "yodel_"
+DEFAULT_INTERVAL = 10.0
+
+_enabled = os.getenv("YODEL_METRICS", "") not in ("", "0")
+_histograms: dict[str, "Histogram"] = {}
+_counters: dict[str, "Counter"] = {}
+_dump_thread = None
+
+
+class Histogram:
+    __slots__ = ("name", "counts", "count", "sum", "max")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.counts = [0] * (len(BUCKETS) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (capped at the max seen)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(BUCKETS[i], self.max) if i < len(BUCKETS) else self.max
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"count": self.count, "sum": self.sum, "max": self.max, "buckets": list(self.counts)}
+
+
+class Counter:
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.value = 0
+
+    def inc(self, n: int = 1) -> None:
+        self.value += n
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(on: bool = True) -> None:
+    """Turn metrics on (affects modules imported afterwards) and start the file dump if configured."""
+    global _enabled
+    _enabled = on
+    path = os.getenv("YODEL_METRICS_FILE")
+    if on and path:
+        start_dump(path, float(os.getenv("YODEL_METRICS_INTERVAL") or DEFAULT_INTERVAL))
+
+
+def histogram(name: str) -> Histogram | None:
+    """The named histogram, or None when metrics are off (bind once, test for None)."""
+    if not _enabled:
+        return None
+    h = _histograms.get(name)
+    if h is None:
+        h = _histograms[name] = Histogram(name)
+    return h
+
+
+def counter(name: str) -> Counter | None:
+    if not _enabled:
+        return None
+    c = _counters.get(name)
+    if c is None:
+        c = _counters[name] = Counter(name)
+    return c
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Record each call's duration in histogram ``name``; a no-op decorator when metrics are off."""
+    def decorate(fn: F) -> F:
+        h = histogram(name)
+        if h is None:
+            return fn
+        clock = time.perf_counter
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            t0 = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                h.observe(clock() - t0)
+        return wrapper  # type: ignore[return-value]
+    return decorate
+
+
+def reset() -> None:
+    for h in _histograms.values():
+        h.__init__(h.name)  # type: ignore[misc]
+    for c in _counters.values():
+        c.value = 0
+
+
+def snapshot() -> dict[str, Any]:
+    return {
+        "time": time.time(),
+        "buckets": list(BUCKETS),
+        "histograms": {n: h.as_dict() for n, h in sorted(_histograms.items())},
+        "counters": {n: c.value for n, c in sorted(_counters.items())},
+    }
+
+
+def _from_snapshot(snap: dict[str, Any]) -> tuple[list[Histogram], dict[str, int]]:
+    hists = []
+    for name, d in snap.get("histograms", {}).items():
+        h = Histogram(name)
+        h.counts, h.count, h.sum, h.max = list(d["buckets"]), d["count"], d["sum"], d["max"]
+        hists.append(h)
+    return hists, dict(snap.get("counters", {}))
+
+
+def to_prometheus(snap: dict[str, Any] | None = None) -> str:
+    """Prometheus text exposition format (histograms in seconds, cumulative buckets)."""
+    hists, counters = _from_snapshot(snap or snapshot())
+    lines = []
+    for h in hists:
+        metric = f"{PREFIX}{h.name}_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        cumulative = 0
+        for bound, n in zip((*BUCKETS, "+Inf"), h.counts):
+            cumulative += n
+            lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f"{metric}_sum {h.sum!r}")
+        lines.append(f"{metric}_count {h.count}")
+    for name, value in counters.items():
+        lines.append(f"# TYPE {PREFIX}{name}_total counter")
+        lines.append(f"{PREFIX}{name}_total {value}")
+    return "\n".join(lines) + "\n"
+
+
+def format_report(snap: dict[str, Any] | None = None) -> str:
+    hists, counters = _from_snapshot(snap or snapshot())
+    if not hists and not counters:
+        return "no metrics recorded (set YODEL_METRICS=1 before starting)"
+    lines = [f"{'metric':<16} {'count':>8} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+    for h in hists:
+        mean = h.sum / h.count if h.count else 0.0
+        lines.append(
+            f"{h.name:<16} {h.count:>8} {mean * 1000:>9.3f} {h.quantile(0.5) * 1000:>9.3f} "
+            f"{h.quantile(0.99) * 1000:>9.3f} {h.max * 1000:>9.3f}"
+        )
+    lines += [f"{name:<16} {value:>8}" for name, value in counters.items()]
+    return "\n".join(lines)
+
+
+def write(path: str | Path) -> Path:
+    """Write a snapshot atomically (Prometheus text for ``.prom``, else JSON)."""
+    import json
+
+    out = Path(path)
+    snap = snapshot()
+    text = to_prometheus(snap) if out.suffix == ".prom" else json.dumps(snap) + "\n"
+    tmp = out.with_name(f"{out.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(out)
+    return out
+
+
+def start_dump(path: str | Path, interval: float = DEFAULT_INTERVAL) -> None:
+    """Write ``path`` every ``interval`` seconds from a daemon thread, and once more at exit."""
+    global _dump_thread
+    if _dump_thread is not None:
+        return
+    import atexit
+    import threading
+
+    def loop() -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                write(path)
+            except OSError:
+                pass
+
+    _dump_thread = threading.Thread(target=loop, name="yodel-metrics", daemon=True)
+    _dump_thread.start()
+    atexit.register(write, path)
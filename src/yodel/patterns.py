@@ -0,0 +1,125 @@
+"""Precomputed guess x target feedback pattern tables.
+
+For one word length ``L`` the candidates are the ``L``-letter words of the
+compiled lexicon, in lexicon (sorted) order. Two files are written next to the
+lexicon, both keyed by the lexicon digest so a rebuilt word list never reuses a
+stale table:
+
+    patterns-<digest16>-L<L>.lex   candidate words (row/column order)
+    patterns-<digest16>-L<L>.npy   (n, n) uint8/uint16 matrix of feedback()
+
+The ``.npy`` matrix is memory-mapped at runtime (NumPy if installed, otherwise
+a plain ``memoryview`` over ``mmap``). Rows are found through a word -> row
+dict built on first use, so a lookup is two hash probes plus one indexed read.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+import ast
+import mmap
+import struct
+
+from . import scoring
+from .dictionary import load_lexicon
+from .lexicon import Lexicon, LexiconError, compile_lexicon
+
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+_NPY_CODES = {"|u1": "B", "<u2": "H", "<u4": "I", "<u8": "Q"}
+
+
+def table_paths(lexicon: Lexicon, length: int) -> tuple[Path, Path]:
+    stem = f"patterns-{lexicon.digest[:16]}-L{length}"
+    return lexicon.path.with_name(stem + ".lex"), lexicon.path.with_name(stem + ".npy")
+
+
+def _write_npy(path: Path, matrix, n: int, descr: str) -> None:
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({n}, {n}), }}"
+    pad = -(len(_NPY_MAGIC) + 2 + len(header) + 1) % 64
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as fh:
+        fh.write(_NPY_MAGIC)
+        fh.write(struct.pack("<H", len(header) + pad + 1))
+        fh.write(header.encode("latin-1") + b" " * pad + b"\n")
+        if scoring.numpy_module() is not None and hasattr(matrix, "tobytes"):
+            fh.write(matrix.tobytes())
+        else:
+            code = _NPY_CODES[descr]
+            for row in matrix:
+                fh.write(struct.pack(f"<{n}{code}", *row))
+    tmp.replace(path)
+
+
+def build_pattern_table(lexicon: Lexicon, length: int) -> "PatternTable":
+    """Compute and store the feedback matrix for ``length``-letter words."""
+    if length > 10:
+        raise ValueError("pattern tables are limited to 10 letters (uint16)")
+    words = [w for w in lexicon if len(w) == length]
+    lex_path, npy_path = table_paths(lexicon, length)
+    compile_lexicon(words, lex_path)
+    matrix = scoring.feedback_matrix(scoring.encode_words(words))
+    _write_npy(npy_path, matrix, len(words), "|u1" if 3 ** length <= 256 else "<u2")
+    return PatternTable(lex_path, npy_path)
+
+
+class PatternTable:
+    """Memory-mapped feedback matrix with word -> row lookup."""
+
+    def __init__(self, lex_path: str | Path, npy_path: str | Path) -> None:
+        self.words = Lexicon(lex_path)
+        self.path = Path(npy_path)
+        np = scoring.numpy_module()
+        if np is not None:
+            self.matrix = np.load(self.path, mmap_mode="r")
+        else:
+            self.matrix = self._map_npy()
+        if len(self.matrix) != len(self.words):
+            raise LexiconError(f"{self.path}: shape does not match {lex_path}")
+        self._rows: dict[str, int] | None = None
+
+    def _map_npy(self) -> memoryview:
+        with self.path.open("rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(_NPY_MAGIC)] != _NPY_MAGIC:
+            raise LexiconError(f"{self.path}: not a v1 .npy file")
+        (hlen,) = struct.unpack_from("<H", self._mm, len(_NPY_MAGIC))
+        start = len(_NPY_MAGIC) + 2
+        header = ast.literal_eval(self._mm[start:start + hlen].decode("latin-1"))
+        n = header["shape"][0]
+        return memoryview(self._mm)[start + hlen:].cast(_NPY_CODES[header["descr"]], shape=[n, n])
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def row(self, word: str) -> int:
+        """Row (and column) of ``word``, or -1; O(1) after the first call builds the map."""
+        rows = self._rows
+        if rows is None:
+            rows = self._rows = {w: i for i, w in enumerate(self.words.words())}
+        return rows.get(word.upper(), -1)
+
+    def lookup(self, guess: str, target: str) -> int | None:
+        """Stored ``feedback(guess, target)`` or None if either word is not in the table."""
+        gi = self.row(guess)
+        ti = self.row(target)
+        if gi < 0 or ti < 0:
+            return None
+        return int(self.matrix[gi, ti])
+
+
+def load_pattern_table(length: int) -> PatternTable | None:
+    """Table for the active compiled lexicon, or None if it has not been built."""
+    return _load_pattern_table(load_lexicon(), length)
+
+
+@lru_cache(maxsize=4)
+def _load_pattern_table(lex: Lexicon | None, length: int) -> PatternTable | None:
+    if lex is None:
+        return None
+    lex_path, npy_path = table_paths(lex, length)
+    if not (lex_path.is_file() and npy_path.is_file()):
+        return None
+    try:
+        return PatternTable(lex_path, npy_path)
+    except (OSError, ValueError):
+        return None
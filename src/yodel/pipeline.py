@@ -0,0 +1,296 @@
+"""Incremental, content-addressed word-list build.
+
+    extract -> tokenize -> filter -> dedupe -> emit
+
+extract    lemmas from the newest raw WordNet ``index.*`` files (placeholder
+           words when no raw data has been fetched)
+tokenize   upper-case; multi-word lemmas are dropped or split into parts
+filter     alphabetic, ASCII only, length bounds, blocklist (profanity)
+dedupe     sorted unique words
+emit       game_words.txt, the compiled lexicon / word index / Bloom filter /
+           pattern table / synset graph, and manifest.json with the sha256 of
+           every output
+
+Every list stage is keyed by sha256(stage, version, parameters, sha256 of its
+input) and its output cached as ``<out_dir>/.stages/<stage>-<key>.txt``. A
+re-run reuses each stage whose key is unchanged, so tweaking one filter only
+recomputes that stage and the ones after it, and an unchanged output stops
+the recomputation there. ``emit`` likewise skips artefacts whose source digest
+matches the previous manifest.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, NamedTuple, Sequence
+import hashlib
+import json
+import re
+
+from . import wordnet
+
+PIPELINE_VERSION = 1
+RAW_DIR = Path("data/raw")
+PROC_DIR = Path("data/processed")
+BLOCKLIST_PATH = Path("data/blocklist.txt")  # optional, one word per line, '#' comments
+PLACEHOLDER_WORDS = ("YODEL", "HELLO", "WORLD")
+MANIFEST_NAME = "manifest.json"
+_CACHE_DIR = ".stages"
+_KEEP_PER_STAGE = 4
+_SPLIT_RE = re.compile(r"[_\s\-]+")
+
+
+@dataclass(frozen=True)
+class BuildConfig:
+    raw_dir: Path = RAW_DIR
+    out_dir: Path = PROC_DIR
+    min_length: int = 3
+    max_length: int | None = None
+    ascii_only: bool = True
+    split_compounds: bool = False
+    blocklist: Path | None = BLOCKLIST_PATH
+    pattern_length: int = 5  # feedback table word length (needs numpy); 0 disables
+    bloom_fp_rate: float = 0.01  # is_valid pre-filter false-positive rate; 0 disables
+    graph: bool = True  # build the synset graph store when raw WordNet exists
+    workers: int | None = None
+
+
+class StageResult(NamedTuple):
+    name: str
+    key: str
+    digest: str  # sha256 of the stage output
+    count: int
+    cached: bool
+
+
+@dataclass
+class BuildResult:
+    stages: list[StageResult] = field(default_factory=list)
+    outputs: dict[str, dict] = field(default_factory=dict)  # file name -> manifest entry
+    rebuilt: list[str] = field(default_factory=list)
+    manifest: Path | None = None
+
+
+def sha256_file(path: Path, chunk: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        while block := fh.read(chunk):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _lines_bytes(lines: Sequence[str]) -> bytes:
+    return "".join(f"{line}\n" for line in lines).encode("utf-8")
+
+
+def _stage_key(name: str, params: dict, input_digest: str) -> str:
+    blob = json.dumps([PIPELINE_VERSION, name, params, input_digest], sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# --- stage functions (lines in, lines out) -----------------------------------------
+
+
+def _index_lemmas(entries) -> list[str]:
+    return [e.lemma for e in entries]
+
+
+def extract(wn_dir: Path | None, workers: int | None = None) -> list[str]:
+    if wn_dir is None:
+        return list(PLACEHOLDER_WORDS)
+    lemmas: list[str] = []
+    for pos_lemmas in wordnet.map_files(wn_dir, "index", _index_lemmas, workers=workers).values():
+        lemmas.extend(pos_lemmas)
+    return lemmas or list(PLACEHOLDER_WORDS)
+
+
+def tokenize(lemmas: Sequence[str], split_compounds: bool) -> list[str]:
+    out: list[str] = []
+    for lemma in lemmas:
+        parts = [p for p in _SPLIT_RE.split(lemma) if p]
+        if len(parts) > 1 and not split_compounds:
+            continue
+        out.extend(p.upper() for p in parts)
+    return out
+
+
+def load_blocklist(path: Path | None) -> frozenset[str]:
+    if path is None or not path.is_file():
+        return frozenset()
+    with path.open("r", encoding="utf-8") as fh:
+        return frozenset(w.upper() for line in fh if (w := line.split("#", 1)[0].strip()))
+
+
+def filter_words(
+    tokens: Sequence[str],
+    min_length: int,
+    max_length: int | None,
+    ascii_only: bool,
+    blocked: frozenset[str],
+) -> list[str]:
+    hi = max_length if max_length is not None else 1 << 30
+    return [
+        t for t in tokens
+        if min_length <= len(t) <= hi and t.isalpha() and (t.isascii() or not ascii_only) and t not in blocked
+    ]
+
+
+def dedupe(words: Sequence[str]) -> list[str]:
+    return sorted(set(words))
+
+
+# --- driver ------------------------------------------------------------------------
+
+
+class _StageCache:
+    def __init__(self, root: Path, force: bool) -> None:
+        self.root = root
+        self.force = force
+        root.mkdir(parents=True, exist_ok=True)
+
+    def run(self, name: str, params: dict, input_digest: str, fn: Callable[[], list[str]]) -> tuple[list[str], StageResult]:
+        key = _stage_key(name, params, input_digest)
+        path = self.root / f"{name}-{key[:24]}.txt"
+        if path.is_file() and not self.force:
+            data = path.read_bytes()
+            lines = data.decode("utf-8").splitlines()
+            path.touch()  # most recently used, for pruning
+            cached = True
+        else:
+            lines = fn()
+            data = _lines_bytes(lines)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+            cached = False
+        self._prune(name)
+        return lines, StageResult(name, key, hashlib.sha256(data).hexdigest(), len(lines), cached)
+
+    def _prune(self, name: str) -> None:
+        old = sorted(self.root.glob(f"{name}-*.txt"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for p in old[_KEEP_PER_STAGE:]:
+            p.unlink(missing_ok=True)
+
+
+def _raw_digest(wn_dir: Path | None) -> str:
+    """sha256 over the names and contents of the raw index/data files."""
+    h = hashlib.sha256()
+    if wn_dir is None:
+        h.update(b"placeholder:" + " ".join(PLACEHOLDER_WORDS).encode())
+        return h.hexdigest()
+    for kind in ("index", "data"):
+        for pos in wordnet.POS_NAMES:
+            f = wordnet.find_file(wn_dir, f"{kind}.{pos}")
+            if f is not None:
+                h.update(f"{kind}.{pos}:{sha256_file(f)}\n".encode())
+    return h.hexdigest()
+
+
+def _load_manifest(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def run_pipeline(config: BuildConfig | None = None, force: bool = False, log: Callable[[str], None] = print) -> BuildResult:
+    """Run every stage, reusing cached stage outputs and unchanged artefacts."""
+    from .lexicon import Lexicon, compile_lexicon
+    from .wordindex import write_word_index
+
+    cfg = config or BuildConfig()
+    out_dir = Path(cfg.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    cache = _StageCache(out_dir / _CACHE_DIR, force)
+    manifest_path = out_dir / MANIFEST_NAME
+    previous = {} if force else _load_manifest(manifest_path).get("outputs", {})
+    result = BuildResult(manifest=manifest_path)
+
+    wn_dir = wordnet.latest_wordnet_dir(Path(cfg.raw_dir))
+    raw = _raw_digest(wn_dir)
+    blocked = load_blocklist(cfg.blocklist)
+    block_digest = hashlib.sha256(_lines_bytes(sorted(blocked))).hexdigest()
+
+    lemmas, st = cache.run("extract", {"source": str(wn_dir)}, raw, lambda: extract(wn_dir, cfg.workers))
+    result.stages.append(st)
+    tokens, st = cache.run("tokenize", {"split_compounds": cfg.split_compounds}, st.digest,
+                           lambda: tokenize(lemmas, cfg.split_compounds))
+    result.stages.append(st)
+    params = {"min_length": cfg.min_length, "max_length": cfg.max_length, "ascii_only": cfg.ascii_only,
+              "blocklist": block_digest}
+    kept, st = cache.run("filter", params, st.digest,
+                         lambda: filter_words(tokens, cfg.min_length, cfg.max_length, cfg.ascii_only, blocked))
+    result.stages.append(st)
+    words, st = cache.run("dedupe", {}, st.digest, lambda: dedupe(kept))
+    result.stages.append(st)
+    words_digest = st.digest
+    for s in result.stages:
+        log(f"{s.name:<9} {s.count:>8} lines  {'cached' if s.cached else 'built '}  {s.key[:12]}")
+
+    def emit(name: str, source: str, build: Callable[[], Sequence[Path]]) -> None:
+        """(Re)build the files of one artefact unless the manifest shows them current."""
+        entries = {n: e for n, e in previous.items() if e.get("artifact") == name}
+        if entries and all(
+            e.get("source") == source and (out_dir / n).is_file() and (out_dir / n).stat().st_size == e.get("bytes")
+            for n, e in entries.items()
+        ):
+            result.outputs.update(entries)
+            return
+        for path in build():
+            result.outputs[path.name] = {
+                "artifact": name, "source": source, "sha256": sha256_file(path), "bytes": path.stat().st_size,
+            }
+            result.rebuilt.append(path.name)
+
+    def emit_words() -> list[Path]:
+        path = out_dir / "game_words.txt"
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(_lines_bytes(words))
+        tmp.replace(path)
+        return [path]
+
+    lex_path = out_dir / "game_words.lex"
+    emit("words", words_digest, emit_words)
+    emit("lexicon", words_digest, lambda: [compile_lexicon(words, lex_path)])
+    emit("index", words_digest, lambda: [write_word_index(Lexicon(lex_path), lex_path.with_suffix(".idx"))])
+    if cfg.bloom_fp_rate:
+        from .bloom import write_bloom
+
+        emit("bloom", f"{words_digest}:fp{cfg.bloom_fp_rate}",
+             lambda: [write_bloom(Lexicon(lex_path), lex_path.with_suffix(".blm"), cfg.bloom_fp_rate)])
+    if cfg.pattern_length:
+        from .scoring import numpy_module
+
+        if numpy_module() is not None:
+            from .patterns import build_pattern_table, table_paths
+
+            def emit_patterns() -> list[Path]:
+                lex = Lexicon(lex_path)
+                build_pattern_table(lex, cfg.pattern_length)
+                return list(table_paths(lex, cfg.pattern_length))
+
+            emit("patterns", f"{words_digest}:L{cfg.pattern_length}", emit_patterns)
+        else:
+            log("numpy not installed; skipping feedback pattern table")
+    if cfg.graph and wn_dir is not None:
+        from .graph import build_graph
+
+        emit("graph", raw, lambda: [build_graph(wn_dir, out_dir / "wordnet.graph", cfg.workers)])
+
+    # Drop artefacts from the previous build that this one no longer produces.
+    for stale in set(previous) - set(result.outputs):
+        (out_dir / stale).unlink(missing_ok=True)
+
+    manifest = {
+        "version": PIPELINE_VERSION,
+        "config": {k: (str(v) if isinstance(v, Path) else v) for k, v in asdict(cfg).items()},
+        "raw": {"dir": str(wn_dir) if wn_dir else None, "sha256": raw},
+        "stages": {s.name: {"key": s.key, "sha256": s.digest, "count": s.count} for s in result.stages},
+        "outputs": dict(sorted(result.outputs.items())),
+    }
+    tmp = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    tmp.replace(manifest_path)
+    log(f"rebuilt: {', '.join(result.rebuilt) if result.rebuilt else 'nothing (all outputs current)'}")
+    log(f"manifest: {manifest_path}")
+    return result
@@ -0,0 +1,258 @@
+"""Offline replay of logged games: batch validation and scoring (``yodel replay``).
+
+Input is one game per line, either JSONL::
+
+    {"target": "CRANE", "guesses": ["SLATE", "CRONE", "CRANE"], "mode": "wordle"}
+
+or CSV with a header row containing ``target`` and ``guesses`` (space, ``;``
+or ``|`` separated) and optionally ``mode``. Each game is replayed with
+``Game.apply_guess`` rules without building a ``Game``: invalid or
+wrong-length guesses are rejected and not counted, the game ends at the
+first correct guess.
+
+The log is streamed in chunks of raw lines; a ``ProcessPoolExecutor`` parses,
+validates and scores each chunk and returns only aggregates, so memory stays
+flat for any log size. Workers open the compiled lexicon (and its Bloom
+filter) by path and memory-map it: every process shares the same page-cache
+pages instead of unpickling a word set. A text-only word list is compiled
+once to a temporary ``.lex`` for the run.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+import csv
+import json
+import os
+import re
+import tempfile
+import time
+
+from .bloom import BloomFilter
+from .lexicon import Lexicon
+from .scoring import feedback, feedback_string, score_guess
+
+DEFAULT_CHUNK = 5000
+_SEP_RE = re.compile(r"[\s;|,]+")
+
+# Per-worker state, set by _init_worker.
+_lex: Lexicon | None = None
+_bloom: BloomFilter | None = None
+
+
+@dataclass
+class ReplaySummary:
+    games: int = 0
+    guesses: int = 0  # accepted guesses
+    invalid: int = 0
+    wrong_length: int = 0
+    solved: int = 0
+    bad_records: int = 0
+    solved_in: Counter = field(default_factory=Counter)  # accepted guesses -> games solved
+    scores: Counter = field(default_factory=Counter)  # "G.Y.." feedback or count-mode score -> guesses
+    targets: dict[str, list[int]] = field(default_factory=dict)  # target -> [games, solved, guesses]
+    elapsed: float = 0.0
+    workers: int = 1
+
+    def merge(self, other: "ReplaySummary") -> None:
+        self.games += other.games
+        self.guesses += other.guesses
+        self.invalid += other.invalid
+        self.wrong_length += other.wrong_length
+        self.solved += other.solved
+        self.bad_records += other.bad_records
+        self.solved_in.update(other.solved_in)
+        self.scores.update(other.scores)
+        for t, (g, s, n) in other.targets.items():
+            row = self.targets.setdefault(t, [0, 0, 0])
+            row[0] += g
+            row[1] += s
+            row[2] += n
+
+    def as_dict(self, top: int = 20) -> dict[str, Any]:
+        hardest = sorted(
+            ((t, g, s, n) for t, (g, s, n) in self.targets.items() if g),
+            key=lambda r: (r[2] / r[1], -r[1]),
+        )[:top]
+        return {
+            "games": self.games,
+            "guesses": self.guesses,
+            "invalid": self.invalid,
+            "wrong_length": self.wrong_length,
+            "solved": self.solved,
+            "solve_rate": round(self.solved / self.games, 4) if self.games else 0.0,
+            "mean_guesses_to_solve": round(
+                sum(k * v for k, v in self.solved_in.items()) / self.solved, 3) if self.solved else 0.0,
+            "solved_in": {str(k): v for k, v in sorted(self.solved_in.items())},
+            "top_scores": dict(self.scores.most_common(top)),
+            "bad_records": self.bad_records,
+            "distinct_targets": len(self.targets),
+            "hardest_targets": [
+                {"target": t, "games": g, "solve_rate": round(s / g, 4), "guesses": n} for t, g, s, n in hardest
+            ],
+            "elapsed_s": round(self.elapsed, 3),
+            "workers": self.workers,
+            "games_per_sec": round(self.games / self.elapsed) if self.elapsed else 0,
+        }
+
+
+def _init_worker(lex_path: str, bloom_path: str | None) -> None:
+    global _lex, _bloom
+    _lex = Lexicon(lex_path)
+    _bloom = None
+    if bloom_path is not None:
+        try:
+            _bloom = BloomFilter.open(bloom_path, _lex)
+        except (OSError, ValueError):
+            _bloom = None
+
+
+def _parse(fmt: str, line: str, header: Sequence[str] | None) -> tuple[str, list[str], str | None] | None:
+    if fmt == "jsonl":
+        rec = json.loads(line)
+        if not isinstance(rec, dict):
+            return None
+        target, guesses, mode = rec.get("target"), rec.get("guesses", []), rec.get("mode")
+        if not isinstance(target, str) or not (mode is None or isinstance(mode, str)):
+            return None
+        if isinstance(guesses, str):
+            guesses = _SEP_RE.split(guesses.strip())
+        elif not isinstance(guesses, list) or not all(isinstance(g, str) for g in guesses):
+            return None
+        return target, guesses, mode
+    row = dict(zip(header or (), next(csv.reader([line]))))
+    return row["target"], [g for g in _SEP_RE.split(row.get("guesses", "").strip()) if g], row.get("mode") or None
+
+
+def _replay_chunk(fmt: str, header: Sequence[str] | None, lines: list[str], mode: str) -> ReplaySummary:
+    lex, bloom = _lex, _bloom
+    assert lex is not None, "worker not initialised"
+    out = ReplaySummary()
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            rec = _parse(fmt, line, header)
+        except (ValueError, KeyError, TypeError):
+            rec = None
+        if rec is None or not rec[0].strip():
+            out.bad_records += 1
+            continue
+        target, guesses, game_mode = rec
+        target = target.strip().upper()
+        wordle = (game_mode or mode) == "wordle"
+        accepted = 0
+        solved = False
+        for raw in guesses:
+            g = raw.strip().upper()
+            if wordle and len(g) != len(target):
+                out.wrong_length += 1
+                continue
+            if (bloom is not None and g not in bloom) or g not in lex:
+                out.invalid += 1
+                continue
+            accepted += 1
+            if wordle:
+                out.scores[feedback_string(feedback(g, target), len(target))] += 1
+            else:
+                out.scores[str(score_guess(g, target))] += 1
+            if g == target:
+                solved = True
+                break
+        out.games += 1
+        out.guesses += accepted
+        row = out.targets.setdefault(target, [0, 0, 0])
+        row[0] += 1
+        row[2] += accepted
+        if solved:
+            out.solved += 1
+            out.solved_in[accepted] += 1
+            row[1] += 1
+    return out
+
+
+def iter_chunks(path: str | Path, chunk_size: int = DEFAULT_CHUNK) -> Iterator[tuple[str, list[str] | None, list[str]]]:
+    """Yield (format, CSV header or None, raw lines) chunks; format from the suffix (``.csv`` else JSONL)."""
+    p = Path(path)
+    fmt = "csv" if p.suffix.lower() == ".csv" else "jsonl"
+    with p.open("r", encoding="utf-8", newline="") as fh:
+        header = None
+        if fmt == "csv":
+            header = [h.strip().lower() for h in next(csv.reader([fh.readline()]), [])]
+            if "target" not in header:
+                raise ValueError(f"{p}: CSV header needs a 'target' column")
+        chunk: list[str] = []
+        for line in fh:
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                yield fmt, header, chunk
+                chunk = []
+        if chunk:
+            yield fmt, header, chunk
+
+
+def _shared_lexicon(tmp: Path) -> tuple[str, str | None]:
+    """Paths of a compiled lexicon (and Bloom filter) the workers can mmap."""
+    from .dictionary import load_lexicon, load_words
+    from .lexicon import compile_lexicon
+
+    lex = load_lexicon()
+    if lex is not None and lex.path.is_file():
+        blm = lex.path.with_suffix(".blm")
+        return str(lex.path), str(blm) if blm.is_file() else None
+    return str(compile_lexicon(load_words(), tmp / "replay.lex")), None
+
+
+def replay(
+    path: str | Path,
+    mode: str = "wordle",
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK,
+) -> ReplaySummary:
+    """Validate and score every game in the log at ``path``; returns the merged aggregates."""
+    workers = workers or os.cpu_count() or 1
+    total = ReplaySummary(workers=workers)
+    t0 = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="yodel-replay-") as tmp:
+        lex_path, bloom_path = _shared_lexicon(Path(tmp))
+        chunks = iter_chunks(path, chunk_size)
+        if workers == 1:
+            _init_worker(lex_path, bloom_path)
+            for fmt, header, lines in chunks:
+                total.merge(_replay_chunk(fmt, header, lines, mode))
+        else:
+            from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(lex_path, bloom_path)) as pool:
+                pending: set = set()
+                for fmt, header, lines in chunks:
+                    pending.add(pool.submit(_replay_chunk, fmt, header, lines, mode))
+                    if len(pending) >= 2 * workers:  # bound memory: never read far ahead of the workers
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for f in done:
+                            total.merge(f.result())
+                for f in pending:
+                    total.merge(f.result())
+    total.elapsed = time.perf_counter() - t0
+    return total
+
+
+def write_synthetic_log(path: str | Path, games: int, length: int = 5, seed: int = 0) -> Path:
+    """A JSONL log of ``games`` random games over the active word list (for scaling tests)."""
+    import random
+
+    from .daily import candidate_words
+
+    words = list(candidate_words(length)) or ["YODEL", "HELLO", "WORLD"]
+    rng = random.Random(seed)
+    out = Path(path)
+    with out.open("w", encoding="utf-8") as fh:
+        for _ in range(games):
+            target = rng.choice(words)
+            guesses = [rng.choice(words) if rng.random() < 0.85 else "X" * length for _ in range(rng.randint(1, 6))]
+            if rng.random() < 0.5:
+                guesses.append(target)
+            fh.write(json.dumps({"target": target, "guesses": guesses}) + "\n")
+    return out
@@ -0,0 +1,164 @@
+"""Asyncio runtime: input producers, game logic and display as separate tasks.
+
+    stdin / board.poll_input --(lines)--> input queue --> Game.handle --> DisplayQueue
+                                                                             |
+                                                           scroll task (awaits between frames)
+
+Guesses are applied as soon as they arrive: the scroll task awaits between
+frames, so ``Game.apply_guess`` runs in the gaps and never waits for a message
+to finish. Messages either queue behind the current one or preempt it (the
+current scroll stops at the next frame and the new message starts).
+
+The run ends when the game does (solved, or a blank line to quit) or once
+every source is exhausted: stdin reaching EOF (e.g. a service with stdin on
+``/dev/null``) does not end a game that a board is still feeding. Board input
+comes from ``BoardInterface.poll_input``; ``MockBoard.press`` simulates it,
+while ``PhyllisBoard`` has no button input yet and never yields a line.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import AsyncIterator, Callable, Optional
+import asyncio
+import sys
+import threading
+
+from .display import MatrixDisplay
+from .game import Game
+from .hardware.board_interface import BoardInterface
+
+
+async def stdin_lines() -> AsyncIterator[str]:
+    """Lines from stdin, read by a daemon thread so the loop keeps running; ends at EOF.
+
+    A daemon thread (not the loop's executor) so a pending ``readline`` never
+    holds up interpreter exit once the game is over.
+    """
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue = asyncio.Queue()
+
+    def reader() -> None:
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(lines.put_nowait, line.rstrip("\n"))
+        loop.call_soon_threadsafe(lines.put_nowait, None)
+
+    threading.Thread(target=reader, name="yodel-stdin", daemon=True).start()
+    while True:
+        line = await lines.get()
+        if line is None:
+            return
+        yield line
+
+
+async def board_lines(board: BoardInterface, poll_seconds: float = 0.02) -> AsyncIterator[str]:
+    """Input lines composed on the board's buttons (``poll_input``), polled every ``poll_seconds``."""
+    while True:
+        line = board.poll_input()
+        if line is None:
+            await asyncio.sleep(poll_seconds)
+            continue
+        yield line
+
+
+class DisplayQueue:
+    """Consumer task scrolling queued messages one at a time."""
+
+    def __init__(self, display: MatrixDisplay) -> None:
+        self.display = display
+        self._pending: deque[str] = deque()
+        self._wake = asyncio.Event()
+        self._preempt = False
+        self._busy = False
+        self.shown = 0
+
+    def post(self, text: str, preempt: bool = False) -> None:
+        """Queue ``text``; with ``preempt`` drop queued messages and cut the current scroll short."""
+        if preempt:
+            self._pending.clear()
+            self._preempt = True
+        self._pending.append(text)
+        self._wake.set()
+
+    async def run(self) -> None:
+        while True:
+            while not self._pending:
+                self._wake.clear()
+                await self._wake.wait()
+            text = self._pending.popleft()
+            self._preempt = False
+            self._busy = True
+            try:
+                await self.display.scroll_async(text, cancelled=lambda: self._preempt)
+            finally:
+                self._busy = False
+            self.shown += 1
+
+    async def drain(self) -> None:
+        """Wait until every queued message has been shown."""
+        while self._pending or self._busy:
+            await asyncio.sleep(0.01)
+
+
+class GameRuntime:
+    """Run a ``Game`` from any number of async line sources.
+
+    ``echo`` receives every reply (default ``print``); replies are also posted
+    to the display, preempting the previous reply so feedback is never stale.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        display: Optional[MatrixDisplay] = None,
+        echo: Callable[[str], None] = print,
+    ) -> None:
+        self.game = game
+        self.display = DisplayQueue(display) if display is not None else None
+        self.echo = echo
+
+    async def _pump(self, source: AsyncIterator[str], inbox: asyncio.Queue) -> None:
+        async for line in source:
+            await inbox.put(line)
+        await inbox.put(None)  # this source is exhausted
+
+    def respond(self, line: str) -> bool:
+        """Apply one input line; returns True once the game is over."""
+        reply, done = self.game.handle(line)
+        self.echo(reply)
+        if self.display is not None:
+            self.display.post(reply.replace("\n", " "), preempt=not done)
+        return done
+
+    async def run(self, *sources: AsyncIterator[str]) -> None:
+        inbox: asyncio.Queue = asyncio.Queue()
+        tasks = [asyncio.create_task(self._pump(s, inbox)) for s in sources]
+        if self.display is not None:
+            tasks.append(asyncio.create_task(self.display.run()))
+        live = len(sources)
+        try:
+            while live:
+                line = await inbox.get()
+                if line is None:
+                    live -= 1  # end of input only once every source has finished
+                elif self.respond(line):
+                    break
+            if self.display is not None:
+                await self.display.drain()
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def play(game: Game, display: Optional[MatrixDisplay] = None, board: Optional[BoardInterface] = None) -> None:
+    """Blocking entry point: run ``game`` on stdin (plus ``board`` buttons) until it ends."""
+    print("Starting game (async). Type guesses or blank to quit.")
+    if game.mode == "wordle":
+        print("Type ? for a hint.")
+    sources = [stdin_lines()]
+    if board is not None:
+        sources.append(board_lines(board))
+    try:
+        asyncio.run(GameRuntime(game, display).run(*sources))
+    except KeyboardInterrupt:
+        print("\nInterrupted.")
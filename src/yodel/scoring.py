@@ -1,5 +1,30 @@
 from __future__ import annotations
 
+from typing import Any, Iterable, Sequence
+
+from .metrics import timed
+
+_np: Any = None  # numpy module, False when unavailable; see numpy_module()
+
+
+def numpy_module():
+    """NumPy if installed, else None.
+
+    Imported on first batch use rather than at module import: ``score_guess``
+    and ``feedback`` are pure Python, and NumPy alone costs tens of
+    milliseconds of CLI startup on a Pi.
+    """
+    global _np
+    if _np is None:
+        try:  # optional: vectorised batch scoring
+            import numpy
+        except ImportError:  # pragma: no cover - exercised on boards without numpy
+            numpy = False
+        _np = numpy
+    return _np or None
+
+
+@timed("score_guess")
 def score_guess(guess: str, target: str) -> int:
     """Naive scoring: +1 for each correct position letter.
     Length mismatch is tolerated by zipping shortest.
@@ -7,3 +32,164 @@ def score_guess(guess: str, target: str) -> int:
     guess_u = guess.upper()
     target_u = target.upper()
     return sum(g == t for g, t in zip(guess_u, target_u))
+
+
+class WordMatrix:
+    """A word list encoded once for batch scoring.
+
+    With NumPy, ``codes`` is an ``(n, width)`` uint8 matrix of upper-case ASCII
+    codes, zero padded to the longest word. Without NumPy only the upper-cased
+    word list is kept and the batch functions fall back to ``score_guess``.
+    """
+
+    __slots__ = ("words", "width", "codes")
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words: list[str] = [w.upper() for w in words]
+        self.width: int = max((len(w) for w in self.words), default=0)
+        self.codes = None
+        if numpy_module() is not None:
+            self.codes = _encode(self.words, self.width)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+def _encode(words: Sequence[str], width: int):
+    np = numpy_module()
+    codes = np.zeros((len(words), width), dtype=np.uint8)
+    for i, w in enumerate(words):
+        if not w.isascii():
+            raise ValueError(f"batch scoring needs ASCII words, got {w!r}")
+        codes[i, :len(w)] = np.frombuffer(w.encode("ascii"), dtype=np.uint8)
+    return codes
+
+
+def encode_words(words: Iterable[str]) -> WordMatrix:
+    return WordMatrix(words)
+
+
+def score_against(guess: str, targets: WordMatrix):
+    """Score one guess against every target; same values as ``score_guess``.
+
+    Returns a uint8 array with NumPy, else a list of ints.
+    """
+    if targets.codes is None:
+        return [score_guess(guess, t) for t in targets.words]
+    np = numpy_module()
+    g = _encode([guess.upper()[:targets.width]], targets.width)[0]
+    return ((targets.codes == g) & (g != 0)).sum(axis=1, dtype=np.uint8)
+
+
+def score_matrix(guesses: WordMatrix, targets: WordMatrix | None = None, chunk: int = 1024):
+    """Score every guess against every target: result[i, j] = score(guess_i, target_j).
+
+    Returns a ``(len(guesses), len(targets))`` uint8 array with NumPy, else a
+    list of lists. Guesses are processed ``chunk`` rows at a time to bound the
+    temporary memory.
+    """
+    targets = guesses if targets is None else targets
+    if guesses.codes is None or targets.codes is None:
+        return [[score_guess(g, t) for t in targets.words] for g in guesses.words]
+    np = numpy_module()
+    width = min(guesses.width, targets.width)
+    out = np.zeros((len(guesses), len(targets)), dtype=np.uint8)
+    t_codes = targets.codes[:, :width]
+    for start in range(0, len(guesses), chunk):
+        g_codes = guesses.codes[start:start + chunk, :width]
+        block = out[start:start + chunk]
+        for j in range(width):
+            g_col = g_codes[:, j, None]
+            block += (g_col == t_codes[None, :, j]) & (g_col != 0)
+    return out
+
+
+GREY, YELLOW, GREEN = 0, 1, 2
+_MARKS = {GREY: ".", YELLOW: "Y", GREEN: "G"}
+
+
+@timed("feedback")
+def feedback(guess: str, target: str) -> int:
+    """Wordle-style feedback encoded as a base-3 integer.
+
+    Digit ``i`` (least significant first) is GREEN for a letter in the right
+    spot, YELLOW for a letter present elsewhere and GREY otherwise. Repeated
+    letters are only marked YELLOW as many times as they remain unmatched in
+    the target, left to right.
+    """
+    g = guess.upper()
+    t = target.upper()
+    marks = [GREY] * len(g)
+    remaining: dict[str, int] = {}
+    for i, tc in enumerate(t):
+        if i < len(g) and g[i] == tc:
+            marks[i] = GREEN
+        else:
+            remaining[tc] = remaining.get(tc, 0) + 1
+    for i, gc in enumerate(g):
+        if marks[i] != GREEN and remaining.get(gc, 0) > 0:
+            marks[i] = YELLOW
+            remaining[gc] -= 1
+    return sum(m * 3 ** i for i, m in enumerate(marks))
+
+
+def decode_feedback(pattern: int, length: int) -> list[int]:
+    marks = []
+    for _ in range(length):
+        pattern, m = divmod(pattern, 3)
+        marks.append(m)
+    return marks
+
+
+def feedback_string(pattern: int, length: int) -> str:
+    """Render a pattern as e.g. ``"G.Y.."`` (G green, Y yellow, . grey)."""
+    return "".join(_MARKS[m] for m in decode_feedback(pattern, length))
+
+
+def pattern_dtype(width: int):
+    """Smallest unsigned NumPy dtype holding every pattern for ``width`` letters."""
+    np = numpy_module()
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if 3 ** width <= np.iinfo(dtype).max + 1:
+            return dtype
+    raise ValueError(f"feedback patterns for {width}-letter words do not fit 64 bits")
+
+
+def feedback_matrix(guesses: WordMatrix, targets: WordMatrix | None = None, chunk: int = 256):
+    """All-pairs ``feedback``: result[i, j] = feedback(guess_i, target_j).
+
+    Returns an array of ``pattern_dtype(guesses.width)`` with NumPy, else a
+    list of lists.
+    """
+    targets = guesses if targets is None else targets
+    if guesses.codes is None or targets.codes is None:
+        return [[feedback(g, t) for t in targets.words] for g in guesses.words]
+    np = numpy_module()
+    gw, tw = guesses.width, targets.width
+    dtype = pattern_dtype(gw)
+    out = np.zeros((len(guesses), len(targets)), dtype=dtype)
+    t_codes = targets.codes
+    for start in range(0, len(guesses), chunk):
+        g_codes = guesses.codes[start:start + chunk]
+        rows = len(g_codes)
+        # green[i][a, b]: guess a and target b share the letter at position i
+        green = [
+            (g_codes[:, i, None] == t_codes[None, :, i]) & (g_codes[:, i, None] != 0)
+            if i < tw else np.zeros((rows, len(targets)), dtype=bool)
+            for i in range(gw)
+        ]
+        not_green_t = [~green[j] if j < gw else None for j in range(tw)]
+        block = np.zeros((rows, len(targets)), dtype=dtype)
+        for i in range(gw):
+            g_col = g_codes[:, i, None]
+            avail = np.zeros((rows, len(targets)), dtype=np.uint8)
+            for j in range(tw):
+                hit = t_codes[None, :, j] == g_col
+                avail += hit & not_green_t[j] if not_green_t[j] is not None else hit
+            earlier = np.zeros((rows, len(targets)), dtype=np.uint8)
+            for k in range(i):
+                earlier += (g_codes[:, k, None] == g_col) & ~green[k]
+            yellow = ~green[i] & (g_col != 0) & (avail > earlier)
+            block += (green[i] * GREEN + yellow * YELLOW).astype(dtype) * dtype(3 ** i)
+        out[start:start + chunk] = block
+    return out
@@ -0,0 +1,290 @@
+"""Multi-session game server (``yodel serve``).
+
+One asyncio process hosts many ``Game`` sessions over TCP or a Unix socket.
+The protocol is one JSON object per line in each direction, so clients can
+pipeline requests and multiplex many sessions over one connection:
+
+    {"op": "new", "mode": "wordle"}            -> {"ok": true, "session": "…", "length": 5}
+    {"op": "guess", "session": "…", "word": "…"} -> {"ok": true, "score": 42, "feedback": "G.Y..", "solved": false}
+    {"op": "hint", "session": "…"}             -> {"ok": true, "hint": "CRANE", "bits": 5.8, "remaining": 120}
+    {"op": "end", "session": "…"}              -> {"ok": true}
+    {"op": "stats"}                            -> {"ok": true, "sessions": 1000, "guesses": 5000}
+
+Failures answer ``{"ok": false, "error": "INVALID" | "LENGTH" | "NO_SESSION" | …}``.
+
+The lexicon, pattern tables and daily schedule are the process-wide caches in
+``dictionary`` / ``patterns`` / ``daily``, loaded once and shared read-only by
+every session; today's target is resolved once per day and word length. Each
+session is just a slotted ``Game`` (target, mode, guesses). With a
+``SessionJournal`` every new game, accepted guess and end is appended to a
+crash-safe journal, and live sessions are restored from it at startup.
+``load_test`` drives thousands of simulated sessions against a local server
+and reports guesses/sec and latency percentiles.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional
+import asyncio
+import json
+import random
+import secrets
+import time
+
+from .config import load_settings
+from .daily import candidate_words, daily_word
+from .dictionary import load_lexicon, load_words
+from .game import MODES, Game
+from .patterns import load_pattern_table
+from .scoring import feedback_string
+from .session import SessionJournal
+
+DEFAULT_PORT = 7717
+MAX_SESSIONS = 100_000
+
+
+class SessionStore:
+    """Live sessions by id; the oldest session is evicted past ``max_sessions``."""
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, journal: SessionJournal | None = None) -> None:
+        self.max_sessions = max_sessions
+        self.sessions: dict[str, Game] = {}
+        self.guesses = 0
+        self.journal = journal
+        self._targets: dict[tuple[date, int], str] = {}
+        if journal is not None:
+            for sid, state in journal.sessions.items():
+                self._track(sid, state.to_game(), new=False)
+
+    def _track(self, sid: str, game: Game, new: bool = True) -> None:
+        if self.journal is not None:
+            if new:
+                self.journal.record_new(sid, game)  # raises JournalError before the session is kept
+            game.on_guess = partial(self.journal.record_guess, sid)
+        self.sessions[sid] = game
+
+    def _drop(self, sid: str) -> None:
+        del self.sessions[sid]
+        if self.journal is not None:
+            self.journal.record_end(sid)
+
+    def target(self, length: int | None = None) -> str:
+        length = load_settings().word_length if length is None else length
+        key = (date.today(), length)
+        word = self._targets.get(key)
+        if word is None:
+            self._targets = {k: v for k, v in self._targets.items() if k[0] == key[0]}  # drop past days
+            word = self._targets[key] = daily_word(key[0], length=length).upper()
+        return word
+
+    def warm(self) -> None:
+        """Load the shared read-only data before accepting connections."""
+        load_words()
+        load_lexicon()
+        target = self.target()
+        load_pattern_table(len(target))
+
+    def handle(self, req: dict[str, Any]) -> dict[str, Any]:
+        op = req.get("op")
+        if op == "new":
+            mode = req.get("mode", "wordle")
+            if mode not in MODES:
+                return {"ok": False, "error": "MODE"}
+            length = req.get("length")
+            if length is not None and (not isinstance(length, int) or isinstance(length, bool)):
+                return {"ok": False, "error": "LENGTH"}
+            try:
+                game = Game(target=self.target(length), mode=mode)
+            except ValueError:  # no words of that length, or too long for wordle
+                return {"ok": False, "error": "LENGTH"}
+            # Evict only once the new session is known to be valid.
+            if len(self.sessions) >= self.max_sessions:
+                self._drop(next(iter(self.sessions)))
+            sid = secrets.token_hex(8)
+            self._track(sid, game)
+            return {"ok": True, "session": sid, "length": len(game.target)}
+        if op == "stats":
+            return {"ok": True, "sessions": len(self.sessions), "guesses": self.guesses}
+        sid = req.get("session")
+        game = self.sessions.get(sid) if isinstance(sid, str) else None
+        if game is None:
+            return {"ok": False, "error": "NO_SESSION"}
+        if op == "guess":
+            ok, result = game.apply_guess(str(req.get("word", "")))
+            if not ok:
+                return {"ok": False, "error": result}
+            self.guesses += 1
+            resp: dict[str, Any] = {"ok": True, "score": result, "solved": game.solved}
+            if game.mode == "wordle":
+                resp["feedback"] = feedback_string(int(result), len(game.target))
+            return resp
+        if op == "hint":
+            if game.mode != "wordle":
+                return {"ok": False, "error": "MODE"}
+            h = game.hint()
+            if h is None:
+                return {"ok": True, "hint": None, "remaining": 0}
+            return {"ok": True, "hint": h.word, "bits": round(h.bits, 3), "remaining": h.remaining}
+        if op == "end":
+            self._drop(sid)
+            return {"ok": True}
+        return {"ok": False, "error": "OP"}
+
+
+async def _serve_client(store: SessionStore, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while line := await reader.readline():
+            try:
+                req = json.loads(line)
+                resp = store.handle(req) if isinstance(req, dict) else {"ok": False, "error": "REQUEST"}
+            except (ValueError, TypeError):  # malformed JSON or field types
+                resp = {"ok": False, "error": "REQUEST"}
+            writer.write(json.dumps(resp, separators=(",", ":")).encode() + b"\n")
+            if writer.transport.get_write_buffer_size() > 65536:
+                await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(
+    store: SessionStore,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    unix_path: str | Path | None = None,
+) -> asyncio.AbstractServer:
+    handler = lambda r, w: _serve_client(store, r, w)  # noqa: E731
+    if unix_path is not None:
+        return await asyncio.start_unix_server(handler, path=str(unix_path))
+    return await asyncio.start_server(handler, host, port)
+
+
+async def _flush_periodically(journal: SessionJournal) -> None:
+    """Bound the unsynced window when traffic stops mid-batch."""
+    while True:
+        await asyncio.sleep(journal.sync_seconds)
+        journal.flush()
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    unix_path: str | Path | None = None,
+    journal_path: str | Path | None = None,
+) -> None:
+    journal = None
+    if journal_path is not None:
+        journal = SessionJournal(journal_path)
+        journal.compact()  # resume cost stays proportional to live sessions
+        print(f"yodel serve: resumed {len(journal.sessions)} sessions from {journal_path}")
+    store = SessionStore(journal=journal)
+    store.warm()
+    server = await start_server(store, host, port, unix_path)
+    where = unix_path or "%s:%d" % server.sockets[0].getsockname()[:2]
+    print(f"yodel serve: listening on {where}")
+    flusher = asyncio.create_task(_flush_periodically(journal)) if journal is not None else None
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if flusher is not None:
+            flusher.cancel()
+        if journal is not None:
+            journal.close()
+
+
+@dataclass
+class LoadReport:
+    sessions: int
+    guesses: int
+    elapsed: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @property
+    def guesses_per_sec(self) -> float:
+        return self.guesses / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "sessions": self.sessions,
+            "guesses": self.guesses,
+            "elapsed_s": round(self.elapsed, 3),
+            "guesses_per_sec": round(self.guesses_per_sec, 1),
+            "p50_ms": round(self.p50_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+async def load_test(
+    sessions: int = 2000,
+    guesses: int = 6,
+    connections: int = 64,
+    mode: str = "wordle",
+    seed: int = 0,
+    port: int = 0,
+) -> LoadReport:
+    """Run ``sessions`` simulated players (``guesses`` each) over ``connections`` sockets to a local server."""
+    store = SessionStore()
+    store.warm()
+    server = await start_server(store, "127.0.0.1", port)
+    host, port = server.sockets[0].getsockname()[:2]
+    words = list(candidate_words(len(store.target())))
+    rng = random.Random(seed)
+    latencies: list[float] = []
+    done = 0
+
+    async def client(n_sessions: int) -> None:
+        nonlocal done
+        reader, writer = await asyncio.open_connection(host, port)
+
+        async def call(req: dict[str, Any]) -> dict[str, Any]:
+            writer.write(json.dumps(req).encode() + b"\n")
+            return json.loads(await reader.readline())
+
+        for _ in range(n_sessions):
+            sid = (await call({"op": "new", "mode": mode}))["session"]
+            for _ in range(guesses):
+                t0 = time.perf_counter()
+                await call({"op": "guess", "session": sid, "word": rng.choice(words)})
+                latencies.append(time.perf_counter() - t0)
+                done += 1
+            await call({"op": "end", "session": sid})
+        writer.close()
+
+    per = [sessions // connections + (i < sessions % connections) for i in range(connections)]
+    t0 = time.perf_counter()
+    async with server:
+        await asyncio.gather(*(client(n) for n in per if n))
+    elapsed = time.perf_counter() - t0
+    latencies.sort()
+    ms = [v * 1000 for v in latencies]
+    return LoadReport(sessions, done, elapsed, _percentile(ms, 0.50), _percentile(ms, 0.99), ms[-1] if ms else 0.0)
+
+
+def run_load_test(**kwargs: Any) -> LoadReport:
+    return asyncio.run(load_test(**kwargs))
+
+
+def run_server(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    unix_path: Optional[str] = None,
+    journal_path: Optional[str] = None,
+) -> None:
+    try:
+        asyncio.run(serve(host, port, unix_path, journal_path))
+    except KeyboardInterrupt:
+        pass
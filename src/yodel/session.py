@@ -0,0 +1,306 @@
+"""Compact game-state snapshots and a crash-safe session journal.
+
+A ``GameState`` is where a ``Game`` keeps its mode, target and accepted
+guesses: word ids of ``dictionary.active_lexicon()`` (``array('I')``) plus
+packed scores (``array('H')``; wordle feedback is base 3, so ``Game`` caps
+wordle targets at 10 letters). A journal holds the very same objects for its
+live sessions, so persisting a game costs no second copy of its state, and a
+6-guess game snapshots to 43 bytes.
+
+The journal is an append-only file of framed records:
+
+    header  40 bytes  magic b"YSES", version u16, 2 reserved bytes,
+                      lexicon checksum (32 bytes; ids are only meaningful
+                      for that word list)
+    record  u16 payload length, u32 crc32(payload), payload
+
+    payload op u8, session id (8 bytes), then per op:
+      NEW    mode u8, target word
+      GUESS  word, score u16
+      END    -
+      SNAP   mode u8, target word, guess count u16, (word, score u16) * count
+
+A word is its u32 lexicon id, or 0xFFFFFFFF followed by a u8 length and the
+ASCII letters for a word outside the lexicon (e.g. a custom target).
+
+Appends go through a buffered file and are fsynced in batches (every
+``sync_every`` records or ``sync_seconds``, and on ``flush``/``close``), so a
+crash loses at most the last unsynced batch. A torn or corrupt tail is
+detected by the length/CRC framing and cut off when the journal is opened.
+``load_sessions`` replays the journal into states; ``SessionJournal.compact``
+rewrites it as one SNAP per live session, which keeps resume time
+proportional to live sessions rather than history.
+"""
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Mapping
+import os
+import struct
+import time
+import zlib
+
+from .lexicon import Lexicon
+
+if TYPE_CHECKING:
+    from .game import Game
+
+MAGIC = b"YSES"
+VERSION = 1
+_HEADER = struct.Struct("<4sH2x32s")
+_FRAME = struct.Struct("<HI")
+_U8, _U16, _U32 = struct.Struct("<B"), struct.Struct("<H"), struct.Struct("<I")
+_LITERAL = 0xFFFFFFFF
+OP_NEW, OP_GUESS, OP_END, OP_SNAP = 1, 2, 3, 4
+_MODES = ("count", "wordle")
+SID_BYTES = 8
+LOCAL_SESSION = "0" * 2 * SID_BYTES  # the single game of ``yodel play --journal``
+
+
+class JournalError(ValueError):
+    pass
+
+
+def active_lexicon() -> Lexicon:
+    """The lexicon whose ids games and the journal store (see ``dictionary.active_lexicon``)."""
+    from .dictionary import active_lexicon
+
+    return active_lexicon()
+
+
+class GameState:
+    """A game's mode, target and accepted guesses as word ids + scores (``Game.state``)."""
+
+    __slots__ = ("mode", "target", "ids", "scores")
+
+    def __init__(self, mode: str, target: str) -> None:
+        self.mode = mode
+        self.target = target
+        self.ids = array("I")
+        self.scores = array("H")
+
+    def add(self, word_id: int, score: int) -> None:
+        if word_id < 0:
+            raise JournalError("guess is not in the lexicon")
+        self.ids.append(word_id)
+        self.scores.append(score)
+
+    def to_game(self) -> "Game":
+        """A ``Game`` playing on this state (not a copy)."""
+        from .game import Game
+
+        return Game(state=self)
+
+    def pack(self, lexicon: Lexicon) -> bytes:
+        """Standalone snapshot bytes (the SNAP record body)."""
+        parts = [_U8.pack(_MODES.index(self.mode)), _word(lexicon, self.target), _U16.pack(len(self.ids))]
+        for i, s in zip(self.ids, self.scores):
+            parts.append(_U32.pack(i) + _U16.pack(s))
+        return b"".join(parts)
+
+    @classmethod
+    def unpack(cls, data: bytes | memoryview, lexicon: Lexicon, off: int = 0) -> tuple["GameState", int]:
+        mode = _MODES[data[off]]
+        target, off = _read_word(data, off + 1, lexicon)
+        (n,) = _U16.unpack_from(data, off)
+        off += 2
+        state = cls(mode, target)
+        for _ in range(n):
+            word_id, score = _U32.unpack_from(data, off)[0], _U16.unpack_from(data, off + 4)[0]
+            state.add(word_id, score)
+            off += 6
+        return state, off
+
+
+def _word(lexicon: Lexicon, word: str) -> bytes:
+    i = lexicon.index_of(word)
+    if i >= 0:
+        return _U32.pack(i)
+    if not word.isascii() or len(word) > 255:
+        raise JournalError(f"cannot journal word {word[:32]!r}: not in the lexicon, ASCII or <= 255 letters")
+    raw = word.encode("ascii")
+    return _U32.pack(_LITERAL) + _U8.pack(len(raw)) + raw
+
+
+def _read_word(data: bytes | memoryview, off: int, lexicon: Lexicon) -> tuple[str, int]:
+    (i,) = _U32.unpack_from(data, off)
+    off += 4
+    if i != _LITERAL:
+        return lexicon.word_at(i), off
+    n = data[off]
+    return bytes(data[off + 1:off + 1 + n]).decode("ascii"), off + 1 + n
+
+
+def _sid(session_id: str) -> bytes:
+    try:
+        raw = bytes.fromhex(session_id) if len(session_id) == 2 * SID_BYTES else session_id.encode("ascii")
+    except ValueError:  # non-hex digits, or non-ASCII
+        raw = b""
+    if len(raw) != SID_BYTES:
+        raise JournalError(f"session id must be {SID_BYTES} bytes (16 hex digits)")
+    return raw
+
+
+def _frames(data: bytes) -> Iterator[tuple[int, bytes]]:
+    """(end offset, payload) for each intact record after the header; stops at a torn/corrupt tail."""
+    off = _HEADER.size
+    while off + _FRAME.size <= len(data):
+        length, crc = _FRAME.unpack_from(data, off)
+        end = off + _FRAME.size + length
+        payload = data[off + _FRAME.size:end]
+        if end > len(data) or zlib.crc32(payload) != crc:
+            return
+        yield end, payload
+        off = end
+
+
+def _read_journal(path: Path, lexicon: Lexicon) -> tuple[dict[str, GameState], int]:
+    """Replay ``path``; returns (live states by session id, offset of the last intact record)."""
+    data = path.read_bytes()
+    if len(data) < _HEADER.size:
+        raise JournalError(f"{path}: truncated header")
+    magic, version, checksum = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise JournalError(f"{path}: not a v{VERSION} session journal")
+    if checksum != lexicon.checksum:
+        raise JournalError(f"{path}: written for a different word list")
+    states: dict[str, GameState] = {}
+    good = _HEADER.size
+    for end, payload in _frames(data):
+        op, sid = payload[0], payload[1:1 + SID_BYTES].hex()
+        body = 1 + SID_BYTES
+        if op == OP_NEW:
+            target, _ = _read_word(payload, body + 1, lexicon)
+            states[sid] = GameState(_MODES[payload[body]], target)
+        elif op == OP_GUESS:
+            state = states.get(sid)
+            if state is not None:
+                word_id = _U32.unpack_from(payload, body)[0]
+                state.add(word_id, _U16.unpack_from(payload, body + 4)[0])
+        elif op == OP_END:
+            states.pop(sid, None)
+        elif op == OP_SNAP:
+            states[sid] = GameState.unpack(payload, lexicon, body)[0]
+        good = end
+    return states, good
+
+
+def load_sessions(path: str | Path, lexicon: Lexicon | None = None) -> dict[str, GameState]:
+    """Live sessions recorded in the journal at ``path`` (empty if it does not exist)."""
+    p = Path(path)
+    if not p.is_file():
+        return {}
+    return _read_journal(p, lexicon or active_lexicon())[0]
+
+
+class SessionJournal:
+    """Append-only session log with batched fsync; opening it recovers the live sessions.
+
+    ``lexicon`` defaults to (and for journaled ``Game``s must be) ``active_lexicon()``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        lexicon: Lexicon | None = None,
+        sync_every: int = 64,
+        sync_seconds: float = 1.0,
+    ) -> None:
+        self.path = Path(path)
+        self.lexicon = lexicon or active_lexicon()
+        self.sync_every = sync_every
+        self.sync_seconds = sync_seconds
+        self.sessions: dict[str, GameState] = {}
+        if self.path.is_file():
+            try:
+                self.sessions, good = _read_journal(self.path, self.lexicon)
+            except JournalError:
+                self.path.replace(self.path.with_name(self.path.name + ".old"))  # keep, but start over
+            else:
+                if good < self.path.stat().st_size:
+                    os.truncate(self.path, good)  # drop a torn tail before appending
+        if not self.path.is_file():
+            self._write_new(self.path, {})
+        self._fh = self.path.open("ab")
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def _write_new(self, path: Path, states: Mapping[str, GameState]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as fh:
+            fh.write(_HEADER.pack(MAGIC, VERSION, self.lexicon.checksum))
+            for sid, state in states.items():
+                fh.write(self._frame(OP_SNAP, sid, state.pack(self.lexicon)))
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    @staticmethod
+    def _frame(op: int, sid: str, body: bytes) -> bytes:
+        payload = _U8.pack(op) + _sid(sid) + body
+        return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def _append(self, op: int, sid: str, body: bytes = b"") -> None:
+        self._fh.write(self._frame(op, sid, body))
+        self._pending += 1
+        if self._pending >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_seconds:
+            self.flush()
+
+    def record_new(self, sid: str, game: "Game") -> None:
+        # Append first: a target or id that cannot be journaled raises before anything is kept.
+        self._append(OP_NEW, sid, _U8.pack(_MODES.index(game.mode)) + _word(self.lexicon, game.target))
+        self.sessions[sid] = game.state  # shared: the game's own guesses are the live state
+
+    def record_guess(self, sid: str, word: str, score: int) -> None:
+        """Journal a guess the session's game has already added to its (shared) state."""
+        if sid not in self.sessions:
+            return
+        word_id = self.lexicon.index_of(word)
+        if word_id < 0:
+            raise JournalError(f"{word!r} is not in the journal's word list")
+        self._append(OP_GUESS, sid, _U32.pack(word_id) + _U16.pack(score))
+
+    def record_end(self, sid: str) -> None:
+        if self.sessions.pop(sid, None) is not None:
+            self._append(OP_END, sid)
+
+    def flush(self) -> None:
+        """Write out and fsync everything appended so far."""
+        self._fh.flush()
+        if self._pending:
+            os.fsync(self._fh.fileno())
+            self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def compact(self) -> None:
+        """Rewrite the journal as one snapshot per live session (atomic replace)."""
+        self.flush()
+        self._fh.close()
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        self._write_new(tmp, self.sessions)
+        tmp.replace(self.path)
+        self._fh = self.path.open("ab")
+
+    def restore(self, sid: str) -> "Game | None":
+        state = self.sessions.get(sid)
+        return state.to_game() if state is not None else None
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self.flush()
+            self._fh.close()
+
+
+def resume_game(journal: SessionJournal, game: "Game", sid: str = LOCAL_SESSION) -> tuple["Game", bool]:
+    """Continue journaled session ``sid`` if it plays the same target and mode as ``game``, else start
+    ``game`` in its place; either way later guesses are journaled. Returns (game, resumed)."""
+    saved = journal.restore(sid)
+    resumed = saved is not None and saved.target == game.target and saved.mode == game.mode
+    if resumed:
+        game = saved  # type: ignore[assignment]
+    else:
+        journal.record_end(sid)
+        journal.compact()
+        journal.record_new(sid, game)
+    game.on_guess = lambda word, score: journal.record_guess(sid, word, score)
+    return game, resumed
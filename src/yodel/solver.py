@@ -0,0 +1,143 @@
+"""Hint engine: incremental candidate pruning and expected-information ranking.
+
+The solver works in wordle feedback space (``scoring.feedback``). Candidates
+are kept as an index array into the pattern table's word list and are only
+ever narrowed: each ``update`` filters the surviving indices against one row
+of the table, never the full lexicon.
+
+``suggest`` ranks a bounded, deterministic sample of guesses by the entropy of
+the feedback distribution they induce over (a bounded sample of) the
+remaining candidates, which keeps a hint in the low milliseconds with NumPy
+even when the table holds 100k words. Without a table or without NumPy the
+same logic runs over ``feedback`` in pure Python with smaller samples.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from math import log2
+from typing import NamedTuple, Sequence
+
+from .patterns import PatternTable
+from .scoring import feedback, numpy_module
+
+np = numpy_module()
+
+
+class Hint(NamedTuple):
+    word: str
+    bits: float  # expected information (entropy of the feedback distribution)
+    remaining: int  # candidates left before playing ``word``
+
+
+def _stride_sample(n: int, k: int) -> range:
+    """Up to ``k`` evenly spaced positions in range(n) (deterministic)."""
+    step = max(1, -(-n // k)) if k > 0 else n or 1
+    return range(0, n, step)
+
+
+class Solver:
+    def __init__(self, words: PatternTable | Sequence[str]) -> None:
+        if isinstance(words, PatternTable):
+            self.table: PatternTable | None = words
+            self._words = words.words
+            self._n = len(words)
+        else:
+            self.table = None
+            self._words = sorted({w.upper() for w in words})
+            self._n = len(self._words)
+        self._vectorised = self.table is not None and np is not None
+        if self._vectorised:
+            self.candidates = np.arange(self._n, dtype=np.int32)
+        else:
+            self.candidates = array("I", range(self._n))
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def _word(self, i: int) -> str:
+        return self._words.word_at(i) if self.table is not None else self._words[i]
+
+    def _index(self, word: str) -> int:
+        if self.table is not None:
+            return self.table.row(word)
+        i = bisect_left(self._words, word)
+        return i if i < self._n and self._words[i] == word else -1
+
+    def remaining(self, limit: int | None = None) -> list[str]:
+        idx = self.candidates if limit is None else self.candidates[:limit]
+        return [self._word(int(i)) for i in idx]
+
+    def update(self, guess: str, pattern: int) -> int:
+        """Keep only candidates that would have produced ``pattern``; returns how many remain."""
+        g = guess.upper()
+        row = self._index(g)
+        if self._vectorised and row >= 0:
+            cands = self.candidates
+            self.candidates = cands[self.table.matrix[row][cands] == pattern]
+        elif self.table is not None and row >= 0:
+            m = self.table.matrix
+            self.candidates = array("I", (t for t in self.candidates if m[row, t] == pattern))
+        else:
+            # guess outside the table: score the survivors directly
+            keep = [int(t) for t in self.candidates if feedback(g, self._word(int(t))) == pattern]
+            self.candidates = np.asarray(keep, dtype=np.int32) if self._vectorised else array("I", keep)
+        return len(self.candidates)
+
+    def suggest(self, max_guesses: int = 256, max_targets: int = 2048) -> Hint | None:
+        """Best next guess by expected information, or None when nothing is left."""
+        m = len(self.candidates)
+        if m == 0:
+            return None
+        if m <= 2:
+            return Hint(self._word(int(self.candidates[0])), 1.0 if m == 2 else 0.0, m)
+        if not self._vectorised:
+            max_guesses, max_targets = min(max_guesses, 48), min(max_targets, 256)
+        targets = [int(self.candidates[i]) for i in _stride_sample(m, max_targets)]
+        half = max_guesses // 2
+        pool = dict.fromkeys(int(self.candidates[i]) for i in _stride_sample(m, half))
+        pool.update(dict.fromkeys(_stride_sample(self._n, max_guesses - len(pool))))
+        guesses = list(pool)
+        bits = self._entropies(guesses, targets)
+        best, best_score = 0, -1.0
+        for j, g in enumerate(guesses):
+            # small bonus for guesses that could win outright
+            score = bits[j] + (1.0 / m if self._is_candidate(g) else 0.0)
+            if score > best_score:
+                best, best_score = j, score
+        return Hint(self._word(guesses[best]), float(bits[best]), m)
+
+    def _is_candidate(self, i: int) -> bool:
+        # candidates stay sorted: filtering preserves order
+        if self._vectorised:
+            k = int(np.searchsorted(self.candidates, i))
+            return k < len(self.candidates) and int(self.candidates[k]) == i
+        k = bisect_left(self.candidates, i)
+        return k < len(self.candidates) and self.candidates[k] == i
+
+    def _entropies(self, guesses: list[int], targets: list[int]) -> Sequence[float]:
+        if self._vectorised:
+            sub = self.table.matrix[np.ix_(np.asarray(guesses), np.asarray(targets))].astype(np.int64)
+            n_pat = int(sub.max()) + 1
+            offs = sub + np.arange(len(guesses), dtype=np.int64)[:, None] * n_pat
+            counts = np.bincount(offs.ravel(), minlength=len(guesses) * n_pat).reshape(len(guesses), n_pat)
+            p = counts / len(targets)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                terms = np.where(p > 0, p * np.log2(p), 0.0)
+            return -terms.sum(axis=1)
+        out = []
+        total = len(targets)
+        for g in guesses:
+            counts: dict[int, int] = {}
+            if self.table is not None:
+                m = self.table.matrix
+                for t in targets:
+                    pat = m[g, t]
+                    counts[pat] = counts.get(pat, 0) + 1
+            else:
+                gw = self._words[g]
+                for t in targets:
+                    pat = feedback(gw, self._words[t])
+                    counts[pat] = counts.get(pat, 0) + 1
+            out.append(-sum(c / total * log2(c / total) for c in counts.values()))
+        return out
@@ -0,0 +1,100 @@
+"""Cold-start profiling for ``yodel diag --startup``.
+
+Runs a fresh interpreter with ``-X importtime`` so every cache is cold, times
+the steps a real start goes through (CLI import, game setup, first word
+validation, display setup) and breaks import time down per module.
+"""
+from __future__ import annotations
+
+from typing import Any
+import json
+import subprocess
+import sys
+import time
+
+TARGET_MS = 100.0
+
+# Executed in the child interpreter; prints one JSON line of step timings.
+_PROBE = r"""
+import json, time
+t = time.perf_counter
+steps = []
+def step(name, fn):
+    t0 = t(); fn(); steps.append((name, (t() - t0) * 1000))
+step("import yodel.cli", lambda: __import__("yodel.cli"))
+step("import yodel.game", lambda: __import__("yodel.game"))
+from yodel.game import Game
+from yodel import dictionary
+game = None
+def new_game():
+    global game
+    game = Game()
+step("Game()", new_game)
+step("first is_valid()", lambda: dictionary.is_valid(game.target))
+step("first apply_guess()", lambda: game.apply_guess(game.target))
+step("import yodel.display", lambda: __import__("yodel.display"))
+from yodel.display import MatrixDisplay
+step("MatrixDisplay()", MatrixDisplay)
+print("STEPS " + json.dumps(steps))
+"""
+
+
+def _parse_importtime(stderr: str) -> list[tuple[str, float, float]]:
+    """(module, self ms, cumulative ms) for each ``-X importtime`` line."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            self_us, cum_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            rows.append((name, int(self_us) / 1000, int(cum_us) / 1000))
+        except ValueError:
+            continue
+    return rows
+
+
+def profile_startup(top: int = 10) -> dict[str, Any]:
+    """Profile a cold start in a child interpreter."""
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], capture_output=True)
+    interpreter_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", _PROBE], capture_output=True, text=True)
+    total_ms = (time.perf_counter() - t0) * 1000
+    steps: list[tuple[str, float]] = []
+    for line in proc.stdout.splitlines():
+        if line.startswith("STEPS "):
+            steps = [tuple(s) for s in json.loads(line[len("STEPS "):])]  # type: ignore[misc]
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "startup probe failed")
+    modules = _parse_importtime(proc.stderr)
+    ours = [m for m in modules if m[0].lstrip().startswith("yodel")]
+    # Top-level third-party / stdlib packages pulled in (indentation-free names).
+    top_level = [m for m in modules if not m[0].startswith(" ") and not m[0].startswith("yodel")]
+    cli_ms = next((ms for name, ms in steps if name == "import yodel.cli"), 0.0)
+    return {
+        "interpreter_ms": round(interpreter_ms, 1),
+        "cold_cli_ms": round(interpreter_ms + cli_ms, 1),
+        "target_ms": TARGET_MS,
+        "probe_total_ms": round(total_ms, 1),
+        "steps": [(name, round(ms, 2)) for name, ms in steps],
+        "yodel_modules": sorted(((n.strip(), round(s, 2), round(c, 2)) for n, s, c in ours), key=lambda m: -m[2]),
+        "heaviest_imports": sorted(((n, round(c, 2)) for n, _s, c in top_level), key=lambda m: -m[1])[:top],
+    }
+
+
+def format_startup(report: dict[str, Any]) -> str:
+    ok = "OK" if report["cold_cli_ms"] <= report["target_ms"] else "OVER"
+    lines = [
+        f"interpreter startup: {report['interpreter_ms']:.1f} ms",
+        f"cold CLI start (interpreter + import yodel.cli): {report['cold_cli_ms']:.1f} ms "
+        f"[target {report['target_ms']:.0f} ms: {ok}]",
+        "",
+        "steps (ms, in order; later steps reuse earlier caches):",
+    ]
+    lines += [f"  {name:<24} {ms:8.2f}" for name, ms in report["steps"]]
+    lines += ["", "yodel modules (self / cumulative ms):"]
+    lines += [f"  {name:<32} {s:8.2f} {c:8.2f}" for name, s, c in report["yodel_modules"]]
+    lines += ["", "heaviest top-level imports (cumulative ms):"]
+    lines += [f"  {name:<32} {c:8.2f}" for name, c in report["heaviest_imports"]]
+    return "\n".join(lines)
@@ -0,0 +1,222 @@
+"""Sorted-array word index for prefix, pattern and anagram queries.
+
+Works on top of a compiled ``Lexicon`` (whose records are already sorted, so
+prefix queries are ``Lexicon.prefix_range``) and adds three uint32 id arrays:
+
+    by length     word ids grouped by length (CSR)
+    by position   word ids per (length, position, letter) (CSR)
+    by signature  word ids ordered by sorted-letter signature, for anagrams
+
+File layout (``game_words.idx`` next to the lexicon): header with magic
+b"YIDX", version, lexicon width/count, posting count and the lexicon checksum
+(a stale index is ignored), followed by the arrays above. The file is
+memory-mapped; arrays are ``memoryview`` casts, no per-word objects.
+"""
+from __future__ import annotations
+
+from array import array
+from itertools import combinations
+from pathlib import Path
+from typing import Iterator
+import mmap
+import re
+import struct
+
+from .lexicon import Lexicon
+
+MAGIC = b"YIDX"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHII32s")
+_LETTERS = 27  # A-Z plus one bucket for anything else
+WILDCARDS = "?._"
+
+
+def _letter(c: str) -> int:
+    o = ord(c) - 65
+    return o if 0 <= o < 26 else 26
+
+
+def _signature(word: str) -> str:
+    return "".join(sorted(word))
+
+
+def _layout(width: int, count: int, postings: int) -> dict[str, tuple[int, int]]:
+    sizes = {
+        "len_ptr": width + 2,
+        "len_ids": count,
+        "pos_ptr": width * width * _LETTERS + 1,
+        "pos_ids": postings,
+        "sig_ids": count,
+    }
+    out, off = {}, _HEADER.size
+    for name, n in sizes.items():
+        out[name] = (off, n)
+        off += 4 * n
+    return out
+
+
+def _pos_key(width: int, length: int, pos: int, ch: int) -> int:
+    return ((length - 1) * width + pos) * _LETTERS + ch
+
+
+def build_word_index(lexicon: Lexicon) -> bytes:
+    """Serialise the index for ``lexicon`` (see module docstring)."""
+    width, count = lexicon.width, len(lexicon)
+    words = list(lexicon)
+    by_len: list[list[int]] = [[] for _ in range(width + 1)]
+    by_pos: dict[int, list[int]] = {}
+    for i, w in enumerate(words):
+        by_len[len(w)].append(i)
+        for pos, c in enumerate(w):
+            by_pos.setdefault(_pos_key(width, len(w), pos, _letter(c)), []).append(i)
+
+    len_ptr, len_ids = array("I", [0]), array("I")
+    for ids in by_len:
+        len_ids.extend(ids)
+        len_ptr.append(len(len_ids))
+    pos_ptr, pos_ids = array("I", [0]), array("I")
+    for key in range(width * width * _LETTERS):
+        pos_ids.extend(by_pos.get(key, ()))
+        pos_ptr.append(len(pos_ids))
+    sig_ids = array("I", sorted(range(count), key=lambda i: (_signature(words[i]), i)))
+
+    header = _HEADER.pack(MAGIC, VERSION, width, count, len(pos_ids), lexicon.checksum)
+    return b"".join([header, len_ptr.tobytes(), len_ids.tobytes(), pos_ptr.tobytes(), pos_ids.tobytes(), sig_ids.tobytes()])
+
+
+def write_word_index(lexicon: Lexicon, path: str | Path) -> Path:
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_bytes(build_word_index(lexicon))
+    tmp.replace(out)
+    return out
+
+
+class WordIndex:
+    """Query view over an index buffer (mapped file or in-memory bytes)."""
+
+    def __init__(self, lexicon: Lexicon, data: bytes | mmap.mmap) -> None:
+        magic, version, width, count, postings, checksum = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a v1 word index")
+        if checksum != lexicon.checksum or width != lexicon.width or count != len(lexicon):
+            raise ValueError("word index does not match lexicon")
+        self.lexicon = lexicon
+        self.width = width
+        self._data = data
+        view = memoryview(data)
+        self._arrays = {
+            name: view[off:off + 4 * n].cast("I") for name, (off, n) in _layout(width, count, postings).items()
+        }
+
+    @classmethod
+    def open(cls, lexicon: Lexicon, path: str | Path) -> "WordIndex":
+        with Path(path).open("rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(lexicon, mm)
+
+    @classmethod
+    def build(cls, lexicon: Lexicon) -> "WordIndex":
+        return cls(lexicon, build_word_index(lexicon))
+
+    def _ids(self, ptr: str, ids: str, key: int) -> memoryview:
+        p = self._arrays[ptr]
+        return self._arrays[ids][p[key]:p[key + 1]]
+
+    def ids_of_length(self, length: int) -> memoryview:
+        """Word ids of every ``length``-letter word, ascending (stable order)."""
+        if not 0 < length <= self.width:
+            return memoryview(array("I"))
+        return self._ids("len_ptr", "len_ids", length)
+
+    # --- prefix ------------------------------------------------------------------
+    def prefix_range(self, prefix: str) -> range:
+        return self.lexicon.prefix_range(prefix)
+
+    def prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        r = self.prefix_range(prefix)
+        if limit is not None:
+            r = r[:limit]
+        return [self.lexicon.word_at(i) for i in r]
+
+    # --- patterns ----------------------------------------------------------------
+    def _pattern_ids(self, pat: str) -> Iterator[int]:
+        length = len(pat)
+        if not 0 < length <= self.width:
+            return
+        fixed = [(i, c) for i, c in enumerate(pat) if c not in WILDCARDS]
+        if not fixed:
+            yield from self.ids_of_length(length)
+            return
+        lists = [self._ids("pos_ptr", "pos_ids", _pos_key(self.width, length, i, _letter(c))) for i, c in fixed]
+        shortest = min(range(len(lists)), key=lambda k: len(lists[k]))
+        rest = [fixed[k] for k in range(len(fixed)) if k != shortest]
+        for wid in lists[shortest]:
+            w = self.lexicon.word_at(wid)
+            if all(w[i] == c for i, c in rest):
+                yield wid
+
+    def match(self, pattern: str, limit: int | None = None) -> list[str]:
+        """Words matching ``pattern``: ``?``/``.``/``_`` match one letter, ``*`` any run.
+
+        Single-letter wildcards use the position index; ``*`` patterns scan
+        the prefix range before the first wildcard.
+        """
+        pat = pattern.upper()
+        out: list[str] = []
+        if "*" in pat:
+            head = re.split(r"[*?._]", pat, maxsplit=1)[0]
+            rx = re.compile("".join(".*" if c == "*" else "." if c in WILDCARDS else re.escape(c) for c in pat) + r"\Z")
+            for wid in self.prefix_range(head):
+                w = self.lexicon.word_at(wid)
+                if rx.match(w):
+                    out.append(w)
+                    if limit is not None and len(out) >= limit:
+                        break
+            return out
+        for wid in self._pattern_ids(pat):
+            out.append(self.lexicon.word_at(wid))
+            if limit is not None and len(out) >= limit:
+                break
+        return out
+
+    # --- anagrams ----------------------------------------------------------------
+    def _signature_range(self, sig: str) -> range:
+        ids = self._arrays["sig_ids"]
+        lex = self.lexicon
+        lo, hi = 0, len(ids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _signature(lex.word_at(ids[mid])) < sig:
+                lo = mid + 1
+            else:
+                hi = mid
+        start, hi = lo, len(ids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _signature(lex.word_at(ids[mid])) <= sig:
+                lo = mid + 1
+            else:
+                hi = mid
+        return range(start, lo)
+
+    def anagrams(self, letters: str) -> list[str]:
+        """Words using exactly the multiset ``letters``."""
+        ids = self._arrays["sig_ids"]
+        r = self._signature_range(_signature(letters.upper()))
+        return sorted(self.lexicon.word_at(ids[k]) for k in r)
+
+    def sub_anagrams(self, letters: str, min_length: int = 3) -> list[str]:
+        """Words spelled from any sub-multiset of ``letters`` (each letter used at most once)."""
+        sig = _signature(letters.upper())
+        seen: set[str] = set()
+        out: list[str] = []
+        for n in range(max(1, min_length), len(sig) + 1):
+            for combo in combinations(sig, n):
+                s = "".join(combo)
+                if s in seen:
+                    continue
+                seen.add(s)
+                out.extend(self.anagrams(s))
+        return sorted(out)
@@ -0,0 +1,173 @@
+"""Streaming reader for WordNet ``data.*`` / ``index.*`` files.
+
+Single shared parser for the dictionary loader, the build script and the
+experiments. Each file is read in one pass and yields compact NamedTuple
+records; ``map_files`` fans the four POS files out over a process pool.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple, TypeVar
+import os
+
+RAW_ROOT = Path("data/raw")
+WN_PREFIX = "english-wordnet-2024_"
+POS_NAMES = ("noun", "verb", "adj", "adv")
+
+T = TypeVar("T")
+
+
+class Pointer(NamedTuple):
+    symbol: str
+    offset: int
+    pos: str
+    source_target: str  # 4 hex digits: source lemma no. / target lemma no.
+
+
+class Synset(NamedTuple):
+    offset: int
+    lex_filenum: int
+    pos: str
+    lemmas: tuple[str, ...]
+    pointers: tuple[Pointer, ...]
+
+
+class IndexEntry(NamedTuple):
+    lemma: str
+    pos: str
+    pointer_symbols: tuple[str, ...]
+    offsets: tuple[int, ...]
+
+
+def latest_wordnet_dir(root: Path = RAW_ROOT) -> Path | None:
+    """Return newest extracted english-wordnet directory (based on date suffix)."""
+    if not root.exists():
+        return None
+    candidates = []
+    for p in root.iterdir():
+        if p.is_dir() and p.name.startswith(WN_PREFIX):
+            # extract date portion after last underscore if numeric
+            parts = p.name.rsplit("_", 1)
+            if len(parts) == 2 and parts[1].isdigit():
+                candidates.append((parts[1], p))
+    if not candidates:
+        return None
+    # pick max date string (YYYYMMDD lexical works)
+    return max(candidates, key=lambda t: t[0])[1]
+
+
+def find_file(base: Path, name: str) -> Path | None:
+    """Locate ``name`` anywhere below ``base`` (archives nest e.g. ``oewn2024/``)."""
+    direct = base / name
+    if direct.is_file():
+        return direct
+    found = next(base.rglob(name), None)
+    return found if found and found.is_file() else None
+
+
+def parse_data_line(line: str) -> Synset | None:
+    if not line or not line[0].isdigit():
+        return None
+    parts = line.split("|", 1)[0].split()
+    if len(parts) < 4:
+        return None
+    try:
+        offset = int(parts[0])
+        lex_filenum = int(parts[1])
+        w_cnt = int(parts[3], 16)
+    except ValueError:
+        return None
+    # lemmas start at index 4, alternating lemma lex_id
+    lemmas = tuple(parts[4:4 + 2 * w_cnt:2])
+    i = 4 + 2 * w_cnt
+    pointers: list[Pointer] = []
+    if i < len(parts):
+        try:
+            p_cnt = int(parts[i])
+        except ValueError:
+            p_cnt = 0
+        i += 1
+        for _ in range(p_cnt):
+            if i + 3 >= len(parts):
+                break
+            sym, tgt_off, tgt_pos, st = parts[i:i + 4]
+            i += 4
+            try:
+                pointers.append(Pointer(sym, int(tgt_off), tgt_pos, st))
+            except ValueError:
+                continue
+    return Synset(offset, lex_filenum, parts[2], lemmas, tuple(pointers))
+
+
+def parse_index_line(line: str) -> IndexEntry | None:
+    if not line or line.startswith(" ") or line.startswith("#"):
+        return None
+    parts = line.split()
+    if len(parts) < 4:
+        return None
+    try:
+        synset_cnt = int(parts[2])
+        p_cnt = int(parts[3])
+        offsets = tuple(int(o) for o in parts[len(parts) - synset_cnt:]) if synset_cnt else ()
+    except ValueError:
+        return None
+    return IndexEntry(parts[0], parts[1], tuple(parts[4:4 + p_cnt]), offsets)
+
+
+def _iter_lines(path: Path, parse: Callable[[str], T | None]) -> Iterator[T]:
+    with path.open("r", encoding="utf-8", errors="ignore") as fh:
+        for line in fh:
+            rec = parse(line)
+            if rec is not None:
+                yield rec
+
+
+def iter_data(path: Path) -> Iterator[Synset]:
+    """Yield one Synset per record line of a ``data.<pos>`` file."""
+    return _iter_lines(path, parse_data_line)
+
+
+def iter_index(path: Path) -> Iterator[IndexEntry]:
+    """Yield one IndexEntry per lemma line of an ``index.<pos>`` file."""
+    return _iter_lines(path, parse_index_line)
+
+
+_READERS = {"data": iter_data, "index": iter_index}
+
+
+def _run(kind: str, path: Path, func: Callable[[Iterator], T]) -> T:
+    return func(_READERS[kind](path))
+
+
+def map_files(
+    base: Path,
+    kind: str,
+    func: Callable[[Iterator], T] = list,
+    pos: Iterable[str] = POS_NAMES,
+    workers: int | None = None,
+) -> dict[str, T]:
+    """Apply ``func`` to the record stream of each ``<kind>.<pos>`` file.
+
+    Files are parsed concurrently in a process pool (``workers=1`` stays in
+    process). ``func`` must be picklable (module-level) and should reduce the
+    stream to something small, since its result is sent back to the parent.
+    Missing files are skipped.
+    """
+    if kind not in _READERS:
+        raise ValueError(f"kind must be one of {sorted(_READERS)}")
+    paths = {p: f for p in pos if (f := find_file(base, f"{kind}.{p}")) is not None}
+    if not paths:
+        return {}
+    n = min(len(paths), workers or os.cpu_count() or 1)
+    if n <= 1:
+        return {p: _run(kind, f, func) for p, f in paths.items()}
+    from concurrent.futures import ProcessPoolExecutor  # deferred: pulls in multiprocessing
+
+    with ProcessPoolExecutor(max_workers=n) as pool:
+        futures = {p: pool.submit(_run, kind, f, func) for p, f in paths.items()}
+        return {p: fut.result() for p, fut in futures.items()}
+
+
+def parse_all(base: Path, kind: str = "data", workers: int | None = None) -> dict[str, list]:
+    """Fully materialise every POS file of ``kind`` (see ``map_files``)."""
+    return map_files(base, kind, list, workers=workers)